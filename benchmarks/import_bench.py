@@ -0,0 +1,112 @@
+import json
+import os
+import re
+import subprocess
+import sys
+import tempfile
+
+from mabooia import arg, get_args_obj
+
+
+class BenchArgs:
+    @arg(["--cases"], desc="Comma separated case names to run (default: all)")
+    def cases(self) -> list:
+        pass
+
+    @arg(["--repeat"], desc="Fresh interpreter runs per case, the best one is reported (default: 5)")
+    def repeat(self) -> int:
+        pass
+
+    @arg(["--output"], desc="Write the results as JSON into this file")
+    def output(self):
+        pass
+
+
+_CASES = {
+    'mabooia': "import mabooia",
+    'applib': "from mabooia import get_args_obj",
+    'rational': "from mabooia import rat",
+    'collections': "from mabooia.collections import Stream",
+    'accounting': "from mabooia.accounting import Money",
+    'finance': "from mabooia.finance import Account",
+}
+
+_IMPORT_TIME_REGEX = re.compile(r"^import time:\s+(\d+)\s+\|\s+(\d+)\s+\|(\s*)(\S+)\s*$")
+
+_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+
+def parse_import_times(stderr: str) -> dict:
+    res = dict()
+    for line in stderr.splitlines():
+        m = _IMPORT_TIME_REGEX.match(line)
+        if m is not None:
+            self_us, cumulative_us, indent, name = m.groups()
+            res[name] = (int(self_us), int(cumulative_us), (len(indent) - 1) // 2)
+
+    return res
+
+
+def import_times(code: str, cache_dir: str) -> dict:
+    env = dict(os.environ)
+    env.pop('PYTHONDONTWRITEBYTECODE', None)
+    env['PYTHONPYCACHEPREFIX'] = cache_dir
+    env['PYTHONPATH'] = os.pathsep.join(filter(None, [_ROOT, env.get('PYTHONPATH')]))
+
+    proc = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", code],
+        env=env, capture_output=True, text=True, check=True
+    )
+    return parse_import_times(proc.stderr)
+
+
+def time_case(name: str, repeat: int, cache_dir: str) -> dict:
+    code = _CASES[name]
+    # warm-up run, so the bytecode cache is populated
+    import_times(code, cache_dir)
+
+    best = None
+    for _ in range(repeat):
+        times = import_times(code, cache_dir)
+        total = sum(self_us for self_us, _, _ in times.values())
+        if best is None or total < best[0]:
+            best = total, times
+
+    total, times = best
+    modules = sorted(it for it in times if it == 'mabooia' or it.startswith('mabooia.'))
+    return {
+        'case': name,
+        'code': code,
+        'total_us': total,
+        'mabooia_us': sum(
+            cumulative_us for it, (_, cumulative_us, level) in times.items() if it in modules and level == 0
+        ),
+        'modules': modules,
+    }
+
+
+def run(cases: list, repeat: int) -> list:
+    with tempfile.TemporaryDirectory() as cache_dir:
+        return [time_case(name, repeat, cache_dir) for name in cases]
+
+
+def main(argv: list = None):
+    args = get_args_obj(BenchArgs, argv)
+    cases = args.cases if args.cases else list(_CASES)
+    repeat = args.repeat if args.repeat > 0 else 5
+
+    results = run(cases, repeat)
+    for res in results:
+        print(f"{res['case']:<12} {res['mabooia_us'] / 1000:>8.2f} ms"
+              f" {res['total_us'] / 1000:>8.2f} ms total  {len(res['modules'])} mabooia modules")
+
+    if args.output:
+        with open(args.output, "w") as file:
+            json.dump({
+                'python': sys.version,
+                'results': results,
+            }, file, indent=2)
+
+
+if __name__ == '__main__':
+    main(sys.argv)
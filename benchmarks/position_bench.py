@@ -0,0 +1,97 @@
+import json
+import math
+import random
+import sys
+import time
+from datetime import date
+
+from mabooia import arg, get_args_obj, rat, Rational, PrecisionPolicy, ExactPrecision, MaxDenominatorPrecision, \
+    DecimalPrecision
+from mabooia.accounting import Currency
+from mabooia.finance import Position, Stock, Trade
+
+
+class BenchArgs:
+    @arg(["--lengths"], desc="Comma separated history lengths (default: 100,500,1000,2000,4000)")
+    def lengths(self) -> list:
+        pass
+
+    @arg(["--sample"], desc="Trades timed after each history length (default: 50)")
+    def sample(self) -> int:
+        pass
+
+    @arg(["--output"], desc="Write the results as JSON into this file")
+    def output(self):
+        pass
+
+
+_stock = Stock('DRIP', Currency.CAD)
+_day = date(2020, 1, 1)
+
+
+def drip_trades(count: int, seed: int = 7) -> list:
+    # Reinvestments at amt / q like ScotiaITradeTransaction, plus a periodic partial sale
+    # so the average cost keeps feeding back into the next trade.
+    rnd = random.Random(seed)
+    res = []
+    for idx in range(count):
+        q = rat(f"{rnd.randint(1, 99999) / 10000:.4f}")
+        amt = rat(f"{rnd.randint(100, 99999) / 100:.2f}")
+        if idx % 4 == 3:
+            res.append(Trade('bench', _day, _day, _stock, -q / 10, amt / q, rat('9.99')))
+        else:
+            res.append(Trade('bench', _day, _day, _stock, q * 10, amt / q, Rational.zero()))
+
+    return res
+
+
+def per_trade_cost(precision: PrecisionPolicy, history: int, sample: int) -> dict:
+    trades = drip_trades(history + sample)
+    pos = Position('bench', _stock, precision)
+    for trade in trades[:history]:
+        pos.add_event(trade)
+
+    start = time.perf_counter()
+    for trade in trades[history:]:
+        pos.add_event(trade)
+    elapsed = time.perf_counter() - start
+
+    return {
+        'policy': str(precision),
+        'history': history,
+        'us_per_trade': elapsed / sample * 1e6,
+        # estimated from the bit length: exact denominators outgrow the int to str conversion limit
+        'avg_cost_den_digits': _decimal_digits(pos.avg_cost.den),
+    }
+
+
+def _decimal_digits(n: int) -> int:
+    return int(n.bit_length() * math.log10(2)) + 1
+
+
+def run(lengths: list, sample: int) -> list:
+    policies = [ExactPrecision(), MaxDenominatorPrecision(10 ** 12), DecimalPrecision(10)]
+    return [
+        per_trade_cost(precision, history, sample)
+        for precision in policies
+        for history in lengths
+    ]
+
+
+def main(argv: list = None):
+    args = get_args_obj(BenchArgs, argv)
+    lengths = [int(it) for it in args.lengths] if args.lengths else [100, 500, 1000, 2000, 4000]
+    sample = args.sample if args.sample > 0 else 50
+
+    results = run(lengths, sample)
+    for res in results:
+        print(f"{res['policy']:<40} history={res['history']:<6} "
+              f"{res['us_per_trade']:>10.1f} us/trade  den digits={res['avg_cost_den_digits']}")
+
+    if args.output:
+        with open(args.output, "w") as file:
+            json.dump(results, file, indent=2)
+
+
+if __name__ == '__main__':
+    main(sys.argv)
@@ -0,0 +1,207 @@
+import json
+import random
+import sys
+import timeit
+from decimal import Decimal
+from fractions import Fraction
+
+from mabooia import arg, get_args_obj, rat, Rational, RationalArray, float_rep
+
+try:
+    import numpy
+except ImportError:
+    numpy = None
+
+
+class BenchArgs:
+    @arg(["--cases"], desc="Comma separated case names to run (default: all)")
+    def cases(self) -> list:
+        pass
+
+    @arg(["--repeat"], desc="Timing repetitions, the best one is reported (default: 5)")
+    def repeat(self) -> int:
+        pass
+
+    @arg(["--output"], desc="Write the results as JSON into this file")
+    def output(self):
+        pass
+
+
+_SIZE = 1000
+_rnd = random.Random(11)
+_ints = [_rnd.randint(-10 ** 6, 10 ** 6) for _ in range(_SIZE)]
+_floats = [_rnd.uniform(-1000, 1000) for _ in range(_SIZE)]
+_strs = [f"{_rnd.randint(-99999, 99999) / 100:.2f}" for _ in range(_SIZE)]
+_pairs = [(_rnd.randint(-10 ** 6, 10 ** 6), _rnd.randint(1, 10 ** 4)) for _ in range(_SIZE)]
+_trades = [(f"{_rnd.randint(1, 99999) / 10000:.4f}", f"{_rnd.randint(100, 99999) / 100:.2f}") for _ in range(_SIZE)]
+
+_CONSTRUCTORS = {
+    'Rational': (rat, lambda n, d: Rational(n, d)),
+    'Fraction': (Fraction, Fraction),
+    'Decimal': (Decimal, lambda n, d: Decimal(n) / Decimal(d)),
+}
+
+
+def _operands(impl: str) -> tuple:
+    _, of_pair = _CONSTRUCTORS[impl]
+    values = [of_pair(n, d) for n, d in _pairs]
+    return values, values[1:] + values[:1]
+
+
+def _binary(op):
+    def case(impl: str):
+        xs, ys = _operands(impl)
+        return lambda: [op(x, y) for x, y in zip(xs, ys) if y != 0]
+
+    return case
+
+
+def _from_list(values):
+    def case(impl: str):
+        of, _ = _CONSTRUCTORS[impl]
+        return lambda: [of(it) for it in values]
+
+    return case
+
+
+def _from_floats(impl: str):
+    of, _ = _CONSTRUCTORS[impl]
+    return lambda: [of(it) for it in _floats]
+
+
+def _simplify(impl: str):
+    if impl == 'Rational':
+        xs, _ = _operands(impl)
+        return lambda: [it.simplify() for it in xs]
+    elif impl == 'Decimal':
+        xs, _ = _operands(impl)
+        return lambda: [it.normalize() for it in xs]
+
+    return None
+
+
+def _float_rep(impl: str):
+    if impl != 'Rational':
+        return None
+
+    xs, _ = _operands(impl)
+    return lambda: [float_rep(it) for it in xs]
+
+
+def _to_str(impl: str):
+    xs, _ = _operands(impl)
+    return lambda: [str(it) for it in xs]
+
+
+def _format(impl: str):
+    xs, _ = _operands(impl)
+    try:
+        f"{xs[0]:,.2f}"
+    except TypeError:
+        # Fraction supports format specs from Python 3.12 only
+        return None
+
+    return lambda: [f"{it:,.2f}" for it in xs]
+
+
+def _cost_basis(impl: str):
+    of, _ = _CONSTRUCTORS[impl]
+    trades = [(of(q), of(p)) for q, p in _trades]
+    zero = of(0)
+
+    def replay():
+        qty = zero
+        book = zero
+        avg = zero
+        for idx, (q, p) in enumerate(trades):
+            if idx % 4 == 3 and qty > 0:
+                sold = q if q < qty else qty
+                book -= avg * sold
+                qty -= sold
+            else:
+                book += q * p
+                qty += q
+            avg = book / qty if qty != 0 else zero
+
+        return avg
+
+    return replay
+
+
+def _array_sum(impl: str):
+    if impl != 'Rational':
+        return None
+
+    arr = RationalArray.of(_operands(impl)[0])
+    return arr.sum
+
+
+_CASES = {
+    'from_int': _from_list(_ints),
+    'from_float': _from_floats,
+    'from_str': _from_list(_strs),
+    'add': _binary(lambda x, y: x + y),
+    'sub': _binary(lambda x, y: x - y),
+    'mul': _binary(lambda x, y: x * y),
+    'div': _binary(lambda x, y: x / y),
+    'floordiv': _binary(lambda x, y: x // y),
+    'mod': _binary(lambda x, y: x % y),
+    'pow': _binary(lambda x, y: x ** 3),
+    'compare': _binary(lambda x, y: x < y),
+    'simplify': _simplify,
+    'float_rep': _float_rep,
+    'str': _to_str,
+    'format': _format,
+    'cost_basis': _cost_basis,
+    'array_sum': _array_sum,
+}
+
+
+def time_case(name: str, impl: str, repeat: int) -> dict:
+    f = _CASES[name](impl)
+    if f is None:
+        return None
+
+    timer = timeit.Timer(f)
+    number, _ = timer.autorange()
+    best = min(timer.repeat(repeat, number)) / number
+
+    return {
+        'case': name,
+        'impl': impl,
+        'size': _SIZE,
+        'us_per_op': best / _SIZE * 1e6,
+    }
+
+
+def run(cases: list, repeat: int) -> list:
+    res = []
+    for name in cases:
+        for impl in _CONSTRUCTORS:
+            timing = time_case(name, impl, repeat)
+            if timing is not None:
+                res.append(timing)
+
+    return res
+
+
+def main(argv: list = None):
+    args = get_args_obj(BenchArgs, argv)
+    cases = args.cases if args.cases else list(_CASES)
+    repeat = args.repeat if args.repeat > 0 else 5
+
+    results = run(cases, repeat)
+    for res in results:
+        print(f"{res['case']:<12} {res['impl']:<10} {res['us_per_op']:>10.3f} us/op")
+
+    if args.output:
+        with open(args.output, "w") as file:
+            json.dump({
+                'python': sys.version,
+                'numpy': numpy.__version__ if numpy is not None else None,
+                'results': results,
+            }, file, indent=2)
+
+
+if __name__ == '__main__':
+    main(sys.argv)
@@ -1,10 +1,34 @@
 # Mabooia module
 
-from .core import *
-from .localization import *
-from .rational import *
-from .applib import *
-from .dates import *
+from ._lazy import lazy_exports
+
+__getattr__, __dir__, __all__ = lazy_exports(__name__, globals(), {
+    '.core': (
+        'SingletonMeta', 'Singleton', 'Option', 'Some', 'Nothing', 'NOTHING', 'option',
+        'Lazy', 'EvaluatedLazy', 'UnsynchronizedLazy', 'SynchronizedLazy', 'lazy',
+        'CacheInfo', 'Memoized', 'memoize',
+        'Try', 'Success', 'Failure', 'ErrorSummary', 'FailureReport', 'try_of', 'async_try_of',
+    ),
+    '.localization': (
+        'get_locale_info', 'get_current_locale_info', 'get_decimal_separator', 'get_negative_sign',
+        'get_thousand_separator', 'NumberFormat', 'DEFAULT_NUMBER_FORMAT', 'get_number_format',
+    ),
+    '.rational': (
+        'RoundingMode', 'round_div', 'Rational',
+        'PrecisionPolicy', 'ExactPrecision', 'MaxDenominatorPrecision', 'DecimalPrecision',
+        'FloatRepresentation', 'rat', 'rat_parse_many',
+        'match_float_rep_format', 'match_rational_rep_format', 'match_to_float_rep',
+        'float_rep', 'decimal_digits', 'preperiod_length', 'period_length',
+        'format_decimal', 'format_many', 'pack_rationals', 'unpack_rationals',
+    ),
+    '.rational_array': ('RationalArray',),
+    '.asynclib': ('AsyncLazy', 'async_lazy'),
+    '.applib': (
+        'ArgType', 'ArgDef', 'Args', 'arg', 'unleashed_args', 'auto_help',
+        'get_arg_definitions', 'get_args_obj',
+    ),
+    '.dates': (),
+})
 
 __mabooia = True
 __mabooia_version = "1.0"
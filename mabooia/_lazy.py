@@ -0,0 +1,30 @@
+import sys
+
+# Keep this module free of heavy imports (typing included): every package __init__
+# depends on it, so anything imported here is paid by all of them.
+
+
+def lazy_exports(package: str, namespace: dict, exports: dict) -> tuple:
+    origins = {name: module for module, names in exports.items() for name in names}
+
+    def __getattr__(name: str):
+        module = origins.get(name)
+        if module is None:
+            if f".{name}" not in exports:
+                raise AttributeError(f"module '{package}' has no attribute '{name}'")
+            return _import(f"{package}.{name}")
+
+        value = getattr(_import(package + module if module.startswith('.') else module), name)
+        namespace[name] = value
+        return value
+
+    def __dir__():
+        return sorted(set(namespace) | set(origins))
+
+    return __getattr__, __dir__, list(origins)
+
+
+def _import(module: str):
+    # __import__ rather than importlib.import_module, so the import still shows in -X importtime
+    __import__(module)
+    return sys.modules[module]
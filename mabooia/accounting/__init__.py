@@ -1,3 +1,7 @@
+from mabooia._lazy import lazy_exports
 
-from .enums import *
-from .timeline import *
+__getattr__, __dir__, __all__ = lazy_exports(__name__, globals(), {
+    '.enums': ('Currency',),
+    '.money': ('Money',),
+    '.timeline': ('TimelineEvent', 'Timeline', 'TimeAgg', 'Year', 'Month', 'Quarter', 'Day'),
+})
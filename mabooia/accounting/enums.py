@@ -8,3 +8,7 @@ class Currency(Enum):
 
     def __str__(self):
         return self.name
+
+    @property
+    def decimals(self) -> int:
+        return 2
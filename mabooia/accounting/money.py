@@ -0,0 +1,123 @@
+from typing import *
+
+from mabooia import rat, Rational, RoundingMode, round_div
+from mabooia.accounting.enums import Currency
+
+
+class Money:
+    __slots__ = ('_units', '_currency')
+
+    @staticmethod
+    def of(amount, currency: Currency, mode: RoundingMode = RoundingMode.HALF_EVEN):
+        if isinstance(amount, Money):
+            if amount.currency != currency:
+                raise ValueError(f"Currency mismatch: {amount.currency} and {currency}")
+
+            return amount
+
+        r = rat(amount)
+        return Money(round_div(r.num * 10 ** currency.decimals, r.den, mode), currency)
+
+    @staticmethod
+    def zero(currency: Currency):
+        return Money(0, currency)
+
+    @staticmethod
+    def sum(values: Iterable, currency: Currency):
+        units = 0
+        for it in values:
+            units += Money._units_of(it, currency)
+
+        return Money(units, currency)
+
+    def __init__(self, units: int, currency: Currency):
+        self._units: Final[int] = units
+        self._currency: Final[Currency] = currency
+
+    def __str__(self):
+        decimals = self._currency.decimals
+        int_part, dec_part = divmod(abs(self._units), 10 ** decimals)
+        sign = '-' if self._units < 0 else ''
+        dec_text = f".{dec_part:0{decimals}d}" if decimals > 0 else ''
+        return f"{sign}{int_part}{dec_text} {self._currency}"
+
+    def __hash__(self):
+        return hash((self._units, self._currency))
+
+    def __bool__(self):
+        return self._units != 0
+
+    def __eq__(self, other):
+        return isinstance(other, Money) and self._units == other._units and self._currency == other._currency
+
+    def __lt__(self, other):
+        return self._units < self._units_of(other, self._currency)
+
+    def __le__(self, other):
+        return self._units <= self._units_of(other, self._currency)
+
+    def __gt__(self, other):
+        return self._units > self._units_of(other, self._currency)
+
+    def __ge__(self, other):
+        return self._units >= self._units_of(other, self._currency)
+
+    def __neg__(self):
+        return Money(-self._units, self._currency)
+
+    def __abs__(self):
+        return self if self._units >= 0 else -self
+
+    def __add__(self, other):
+        return Money(self._units + self._units_of(other, self._currency), self._currency)
+
+    def __radd__(self, other):
+        return self.__add__(other)
+
+    def __sub__(self, other):
+        return Money(self._units - self._units_of(other, self._currency), self._currency)
+
+    def __rsub__(self, other):
+        return Money(self._units_of(other, self._currency) - self._units, self._currency)
+
+    def __mul__(self, other):
+        return self.multiply(other)
+
+    def __rmul__(self, other):
+        return self.multiply(other)
+
+    @property
+    def units(self) -> int:
+        return self._units
+
+    @property
+    def currency(self) -> Currency:
+        return self._currency
+
+    @property
+    def decimals(self) -> int:
+        return self._currency.decimals
+
+    def multiply(self, quantity, mode: RoundingMode = RoundingMode.HALF_EVEN):
+        if type(quantity) is int:
+            return Money(self._units * quantity, self._currency)
+
+        q = rat(quantity)
+        return Money(round_div(self._units * q.num, q.den, mode), self._currency)
+
+    def to_rational(self) -> Rational:
+        return Rational(self._units, 10 ** self._currency.decimals)
+
+    # Private methods
+
+    @staticmethod
+    def _units_of(other, currency: Currency) -> int:
+        if isinstance(other, Money):
+            if other._currency != currency:
+                raise ValueError(f"Currency mismatch: {other._currency} and {currency}")
+
+            return other._units
+        elif other == 0:
+            return 0
+
+        raise TypeError(f"Cannot operate Money with {other.__class__}")
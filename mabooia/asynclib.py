@@ -0,0 +1,61 @@
+import asyncio
+from typing import *
+
+from mabooia import Option, Some, NOTHING
+
+
+# Not a Lazy: get() is a coroutine here, so an AsyncLazy cannot stand in where a Lazy is expected
+class AsyncLazy:
+    __slots__ = ('_f', '_value', '_task')
+
+    def __init__(self, f: Optional[Callable], value=None):
+        self._f: Optional[Callable] = f
+        self._value: Optional = value
+        self._task: Optional[asyncio.Future] = None
+
+    def is_computed(self) -> bool:
+        return self._f is None
+
+    def get_if_computed(self) -> Option:
+        return Some(self._value) if self._f is None else NOTHING
+
+    async def get(self):
+        if self._f is None:
+            return self._value
+
+        task = self._task
+        if task is None:
+            task = self._task = asyncio.ensure_future(self._compute(self._f))
+
+        return await asyncio.shield(task)
+
+    async def _compute(self, f: Callable):
+        try:
+            value = f()
+            if isinstance(value, Awaitable):
+                value = await value
+        except BaseException:
+            self._task = None
+            raise
+
+        self._value = value
+        self._f = None
+        self._task = None
+        return value
+
+    def __str__(self):
+        if self._f is None:
+            return f"AsyncLazy({self._value})"
+        else:
+            return "AsyncLazy(...)"
+
+
+def async_lazy(arg) -> AsyncLazy:
+    if isinstance(arg, AsyncLazy):
+        return arg
+    elif isinstance(arg, Awaitable):
+        return AsyncLazy(lambda: arg)
+    elif isinstance(arg, Callable):
+        return AsyncLazy(arg)
+    else:
+        return AsyncLazy(None, arg)
@@ -1,3 +1,13 @@
-from .traversable import *
-from .stack import *
-from .streams import *
+from mabooia._lazy import lazy_exports
+
+__getattr__, __dir__, __all__ = lazy_exports(__name__, globals(), {
+    '.traversable': ('Traversable',),
+    '.stack': ('Stack', 'EmptyStack', 'NonEmptyStack'),
+    '.streams': (
+        'Stream', 'EmptyStream', 'NonEmptyStream', 'SingleStream', 'ConsStream',
+        'LazyTailStream', 'LazyStream', 'GeneratorStream', 'ConcatStream',
+    ),
+    '.mutable': ('LinkedList',),
+    # Re-exported since the star imports used to leak them
+    'mabooia': ('Option', 'Some', 'Nothing', 'NOTHING'),
+})
@@ -1,2 +1,6 @@
-from .linkedlist import *
-from .utils import *
+from mabooia._lazy import lazy_exports
+
+__getattr__, __dir__, __all__ = lazy_exports(__name__, globals(), {
+    '.linkedlist': ('LinkedList',),
+    '.utils': ('put_if_absent', 'compute_if_absent', 'get_value_option'),
+})
@@ -111,24 +111,10 @@ class LinkedList(Iterable, Sized):
         return Iter(self._head, self._rear)
 
     def __len__(self):
-        curr = self._head.next
-        res = 0
-        while curr != self._rear:
-            res += 1
-            curr = curr.next
-
-        return res
+        return self._size
 
     def __str__(self):
-        count = len(self)
-        sb = [''] * count
-
-        idx = 0
-        for it in self:
-            sb[idx] = str(it)
-            idx += 1
-
-        return f"[{', '.join(sb)}]"
+        return f"[{', '.join(str(it) for it in self)}]"
 
     @property
     def is_empty(self) -> bool:
@@ -143,6 +129,7 @@ class LinkedList(Iterable, Sized):
         node = self._LinkedNode(item, self._rear.prev, self._rear)
         self._rear.prev = node
         node.prev.next = node
+        self._size += 1
         return self
 
     def append_iterable(self, tail: Iterable):
@@ -154,6 +141,7 @@ class LinkedList(Iterable, Sized):
     def clear(self):
         self._head.next = self._rear
         self._rear.prev = self._head
+        self._size = 0
 
     def count_of(self, item):
         res = 0
@@ -179,6 +167,7 @@ class LinkedList(Iterable, Sized):
         node = self._LinkedNode(item, self._head, self._head.next)
         self._head.next = node
         node.next.prev = node
+        self._size += 1
         return self
 
     def prepend_iterable(self, head: Iterable):
@@ -205,23 +194,17 @@ class LinkedList(Iterable, Sized):
         return self
 
     def to_list(self):
-        res = [None] * len(self)
-        idx = 0
-        for it in self:
-            res[idx] = it
-            idx += 1
-
-        return res
+        return list(self)
 
     # private methods
 
-    @staticmethod
-    def _remove_node(node: _LinkedNode):
+    def _remove_node(self, node: _LinkedNode):
         if not node.is_head and not node.is_rear:
             pv = node.prev
             nx = node.next
             pv.next = nx
             nx.prev = pv
+            self._size -= 1
 
     def _get_abs_index(self, idx):
         if idx >= 0:
@@ -2,7 +2,7 @@ from typing import Callable
 
 
 # Dictionary utils
-from mabooia import Option, Some, Nothing
+from mabooia import Option, Some, NOTHING
 
 
 def put_if_absent(d: dict, key, value_if_absent):
@@ -23,4 +23,4 @@ def get_value_option(d: dict, key) -> Option:
     if key in d.keys():
         return Some(d[key])
 
-    return Nothing()
+    return NOTHING
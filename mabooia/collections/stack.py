@@ -1,7 +1,7 @@
 import abc
 from typing import *
 
-from mabooia import Singleton, Option, Some, Nothing
+from mabooia import Singleton, Option, Some, NOTHING
 from mabooia.collections.traversable import Traversable
 
 
@@ -33,12 +33,15 @@ class Stack(Traversable, abc.ABC):
 class EmptyStack(Stack, Singleton):
     @property
     def head_option(self) -> Option:
-        return Nothing()
+        return NOTHING
 
     @property
     def tail(self):
         return self
 
+    def _step(self) -> Optional[tuple]:
+        return None
+
 
 class NonEmptyStack(Stack):
     def __init__(self, head, tail: Stack):
@@ -55,3 +58,6 @@ class NonEmptyStack(Stack):
     @property
     def tail(self) -> Stack:
         return self._tail
+
+    def _step(self) -> Optional[tuple]:
+        return self._head, self._tail
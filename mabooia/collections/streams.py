@@ -1,8 +1,11 @@
 import abc
+import itertools
+import sys
+import threading
 from typing import *
 
-from mabooia import Singleton, Option, Some, Nothing, lazy, Lazy
-from mabooia.collections import Traversable, Stack
+from mabooia import Singleton, Option, Some, Nothing, NOTHING, lazy, Lazy
+from mabooia.collections import Traversable, Stack, EmptyStack, NonEmptyStack
 
 
 class Stream(Traversable, abc.ABC):
@@ -18,36 +21,47 @@ class Stream(Traversable, abc.ABC):
             for idx in range(len(_iterable) - 1, -1, -1):
                 res = ConsStream(_iterable[idx], res)
             return res
+        elif isinstance(_iterable, Iterator):
+            return GeneratorStream(_iterable)
 
-        return Stack\
-            .of(_iterable)\
-            .fold(EmptyStream(), lambda acc, it: ConsStream(it, acc))
+        return Stream.of(list(_iterable))
+
+    @staticmethod
+    def from_iter(_iterable: Iterable):
+        return GeneratorStream(iter(_iterable))
+
+    def __len__(self):
+        size = self._known_size()
+        return size if size is not None else Traversable.__len__(self)
 
     def __str__(self):
         return f"Stream[{self._inner_str()}]"
 
     def all(self, f: Callable, is_true: bool = True) -> bool:
-        curr = self
-        curr_head = curr.head_option
-        while isinstance(curr_head, Some):
-            if f(curr_head.value) != is_true:
+        step = self._step()
+        while step is not None:
+            head, curr = step
+            if f(head) != is_true:
                 return False
-            curr = curr.tail
-            curr_head = curr.head_option
+            step = curr._step()
 
         return True
 
     def append(self, item):
-        return self\
-            .head_option\
-            .map(lambda head: LazyTailStream(head, lambda: self.tail.append(item)))\
-            .get_or_else(SingleStream(item))
+        return self.append_stream(SingleStream(item))
 
     def append_stream(self, stream):
-        return self\
-            .head_option\
-            .map(lambda head: LazyTailStream(head, lambda: self.tail.append_stream(stream)))\
-            .get_or_else(stream)
+        if isinstance(self, EmptyStream):
+            return stream
+        elif isinstance(stream, EmptyStream):
+            return self
+
+        size = self._known_size()
+        stream_size = stream._known_size()
+        return ConcatStream(
+            EmptyStack().push(stream).push(self),
+            size + stream_size if size is not None and stream_size is not None else None
+        )
 
     def exists(self, f: Callable, is_true: bool = True) -> bool:
         return self\
@@ -55,39 +69,10 @@ class Stream(Traversable, abc.ABC):
             .is_not_empty
 
     def filter(self, f: Callable, is_true: bool = True):
-        def get_stream():
-            filtered_to_head = self.skip_while(f, not is_true)
-
-            def filter_tail():
-                return filtered_to_head.tail.filter(f, is_true)
-
-            return filtered_to_head\
-                .head_option\
-                .map(lambda head: LazyTailStream(head, filter_tail))\
-                .get_or_else(EmptyStream())
-
-        return LazyStream(get_stream)
+        return self._then(lambda it: filter(lambda x: f(x) == is_true, it))
 
     def flatmap(self, f: Callable):
-        def get_stream():
-            def prepend_head(head):
-                new_head = f(head)
-
-                if isinstance(new_head, Stream):
-                    return new_head.append_stream(self.tail.flatmap(f))
-                elif isinstance(new_head, Some):
-                    return LazyTailStream(new_head.value, lambda: self.tail.flatmap(f))
-                elif isinstance(new_head, Nothing):
-                    return self.tail.flatmap(f)
-                else:
-                    raise TypeError
-
-            return self\
-                .head_option\
-                .map(prepend_head)\
-                .get_or_else(EmptyStream())
-
-        return LazyStream(get_stream)
+        return self._then(lambda it: _flatten(map(f, it)))
 
     def flatten(self):
         return self.flatmap(lambda it: it)
@@ -106,35 +91,22 @@ class Stream(Traversable, abc.ABC):
 
     def index_of(self, item) -> int:
         idx = 0
-        curr = self
-        curr_head = curr.head_option
-        while isinstance(curr_head, Some):
-            if curr_head.value == item:
+        step = self._step()
+        while step is not None:
+            head, curr = step
+            if head == item:
                 return idx
 
             idx += 1
-            curr = curr.tail
-            curr_head = curr.head_option
+            step = curr._step()
 
         return -1
 
     def map(self, f: Callable):
-        def get_stream():
-            return self\
-                .head_option\
-                .map(lambda head: LazyTailStream(f(head), lambda: self.tail.map(f)))\
-                .get_or_else(EmptyStream())
-
-        return LazyStream(get_stream)
+        return self._then(lambda it: map(f, it), _same_size)
 
     def map_indexed(self, f2: Callable):
-        def get_stream(stream, idx):
-            return stream\
-                .head_option\
-                .map(lambda head: LazyTailStream(f2(head, idx), lambda: get_stream(stream.tail, idx + 1)))\
-                .get_or_else(EmptyStream())
-
-        return LazyStream(lambda: get_stream(self, 0))
+        return self._then(lambda it: map(f2, it, itertools.count()), _same_size)
 
     def prepend(self, head):
         if self.is_empty:
@@ -149,75 +121,44 @@ class Stream(Traversable, abc.ABC):
         assert size > 0
 
         def get_stream(stream):
-            if stream.is_empty:
-                return stream
+            step = stream._step()
+            if step is None:
+                return EmptyStream()
 
-            page = [None] * size
+            page = []
+            while True:
+                head, curr = step
+                page.append(head)
+                if len(page) == size:
+                    break
 
-            idx = 0
-            curr = stream
-            curr_head = curr.head_option
-            while idx < size and isinstance(curr_head, Some):
-                page[idx] = curr_head.value
-                idx += 1
-                curr = curr.tail
-                curr_head = curr.head_option
+                step = curr._step()
+                if step is None:
+                    break
 
-            return LazyTailStream(page[:idx], lambda: get_stream(curr))
+            return LazyTailStream(page, lambda: get_stream(curr))
 
         return LazyStream(lambda: get_stream(self))
 
     def skip(self, count: int):
-        return self.skip_while_indexed(lambda _, idx: idx < count)
+        count = max(count, 0)
+        return self._then(lambda it: itertools.islice(it, count, None), lambda size: max(size - count, 0))
 
     def skip_while(self, f: Callable, is_true: bool = True):
-        def get_stream():
-            curr = self
-            curr_head = curr.head_option
-            while isinstance(curr_head, Some) and f(curr_head.value) == is_true:
-                curr = curr.tail
-                curr_head = curr.head_option
-
-            return curr
-
-        return LazyStream(get_stream)
+        return self._then(lambda it: itertools.dropwhile(lambda x: f(x) == is_true, it))
 
     def skip_while_indexed(self, f2: Callable, is_true: bool = True):
-        def get_stream():
-            curr = self
-            curr_head = curr.head_option
-            idx = 0
-            while isinstance(curr_head, Some) and f2(curr_head.value, idx) == is_true:
-                curr = curr.tail
-                curr_head = curr.head_option
-                idx += 1
-
-            return curr
-
-        return LazyStream(get_stream)
+        return self._then(lambda it: _skip_while_indexed(it, f2, is_true))
 
     def take(self, count: int):
-        return self.take_while_indexed(lambda _, idx: idx < count)
+        count = max(count, 0)
+        return self._then(lambda it: itertools.islice(it, count), lambda size: min(size, count))
 
     def take_while(self, f: Callable, is_true: bool = True):
-        def get_stream(stream):
-            return stream\
-                .head_option\
-                .filter(lambda head: f(head) == is_true)\
-                .map(lambda head: LazyTailStream(head, lambda: get_stream(stream.tail)))\
-                .get_or_else(EmptyStream())
-
-        return LazyStream(lambda: get_stream(self))
+        return self._then(lambda it: itertools.takewhile(lambda x: f(x) == is_true, it))
 
     def take_while_indexed(self, f2: Callable, is_true: bool = True):
-        def get_stream(stream, idx):
-            return stream\
-                .head_option\
-                .filter(lambda head: f2(head, idx) == is_true)\
-                .map(lambda head: LazyTailStream(head, lambda: get_stream(stream.tail, idx + 1)))\
-                .get_or_else(EmptyStream())
-
-        return LazyStream(lambda: get_stream(self, 0))
+        return self._then(lambda it: _take_while_indexed(it, f2, is_true))
 
     def unzip(self, f: Callable):
         stream = self.map(f)
@@ -228,32 +169,44 @@ class Stream(Traversable, abc.ABC):
 
     def zip(self, other):
         def get_stream(stream_a, stream_b):
-            head_a = stream_a.head_option
-            if not isinstance(head_a, Some):
+            step_a = stream_a._step()
+            if step_a is None:
                 return EmptyStream()
 
-            head_b = stream_b.head_option
-            if not isinstance(head_b, Some):
+            step_b = stream_b._step()
+            if step_b is None:
                 return EmptyStream()
 
             return LazyTailStream(
-                (head_a.value, head_b.value),
-                lambda: get_stream(stream_a.tail, stream_b.tail)
+                (step_a[0], step_b[0]),
+                lambda: get_stream(step_a[1], step_b[1])
             )
 
         return LazyStream(lambda: get_stream(self, other))
 
+    def _then(self, stage: Callable, resize: Optional[Callable] = None):
+        return _StageStream(self, stage, resize)
+
+    def _known_size(self) -> Optional[int]:
+        return None
+
 
 class EmptyStream(Stream, Singleton):
 
     @property
     def head_option(self) -> Option:
-        return Nothing()
+        return NOTHING
 
     @property
     def tail(self):
         return self
 
+    def _known_size(self) -> Optional[int]:
+        return 0
+
+    def _step(self) -> Optional[tuple]:
+        return None
+
 
 class NonEmptyStream(Stream, abc.ABC):
 
@@ -278,17 +231,31 @@ class SingleStream(NonEmptyStream):
     def tail(self):
         return EmptyStream()
 
+    def _known_size(self) -> Optional[int]:
+        return 1
+
+    def _step(self) -> Optional[tuple]:
+        return self.head, EmptyStream()
+
 
 class ConsStream(NonEmptyStream):
 
     def __init__(self, head, tail: Stream):
         NonEmptyStream.__init__(self, head)
         self._tail: Final[Stream] = tail
+        tail_size = tail._known_size()
+        self._size: Final[Optional[int]] = tail_size + 1 if tail_size is not None else None
 
     @property
     def tail(self):
         return self._tail
 
+    def _known_size(self) -> Optional[int]:
+        return self._size
+
+    def _step(self) -> Optional[tuple]:
+        return self.head, self._tail
+
 
 class LazyTailStream(NonEmptyStream):
 
@@ -296,13 +263,13 @@ class LazyTailStream(NonEmptyStream):
         NonEmptyStream.__init__(self, head)
         self._lazy_tail: Final[Lazy] = lazy(lazy_tail)
 
-    def __len__(self):
-        return 1 + len(self._lazy_tail.get())
-
     @property
     def tail(self):
         return self._lazy_tail.get()
 
+    def _step(self) -> Optional[tuple]:
+        return self.head, self._lazy_tail.get()
+
     def _inner_str(self):
         if self._lazy_tail.is_computed():
             return f"{self.head}, {Stream._inner_str(self)}"
@@ -316,7 +283,7 @@ class LazyStream(Stream):
         self._lazy_stream: Final[Lazy] = lazy(lazy_stream)
 
     def __len__(self):
-        return len(self._lazy_stream.get())
+        return len(self.touch())
 
     def __eq__(self, other):
         if isinstance(other, LazyStream):
@@ -341,8 +308,225 @@ class LazyStream(Stream):
 
         return lazy_stream
 
+    def _step(self) -> Optional[tuple]:
+        return self.touch()._step()
+
+    def _known_size(self) -> Optional[int]:
+        if self._lazy_stream.is_computed():
+            return self.touch()._known_size()
+
+        return None
+
     def _inner_str(self):
         if self._lazy_stream.is_computed():
             return Stream._inner_str(self)
 
         return "..."
+
+
+class GeneratorStream(Stream):
+
+    def __init__(self, iterator: Iterator, lock: threading.Lock = None):
+        self._iterator = iterator
+        self._lock: Final[threading.Lock] = lock if lock is not None else threading.Lock()
+        self._cell: Optional[Stream] = None
+        self._error: Optional[Exception] = None
+
+    @property
+    def head_option(self) -> Option:
+        return self.touch().head_option
+
+    @property
+    def tail(self):
+        return self.touch().tail
+
+    def touch(self):
+        cell = self._cell
+        if cell is None:
+            with self._lock:
+                cell = self._cell
+                if cell is None:
+                    if self._error is not None:
+                        raise self._error
+
+                    try:
+                        cell = self._cell = self._pull()
+                    except Exception as err:
+                        # The iterator is dead after raising: this cell fails the same way from now on
+                        self._error = err
+                        self._iterator = None
+                        raise
+
+        return cell
+
+    def _step(self) -> Optional[tuple]:
+        return self.touch()._step()
+
+    def _pull(self):
+        # The lock is shared by every cell of the same iterator, so it is advanced by one thread at a time
+        for head in self._iterator:
+            cell = ConsStream(head, GeneratorStream(self._iterator, self._lock))
+            break
+        else:
+            cell = EmptyStream()
+
+        self._iterator = None
+        return cell
+
+    def _inner_str(self):
+        if self._cell is not None:
+            return Stream._inner_str(self)
+
+        return "..."
+
+
+class ConcatStream(LazyStream):
+
+    def __init__(self, parts: Stack, size: Optional[int] = None):
+        LazyStream.__init__(self, self._normalize)
+        self._parts: Final[Stack] = parts
+        self._size: Final[Optional[int]] = size
+
+    def __len__(self):
+        return Stream.__len__(self)
+
+    def _normalize(self):
+        # Nested concatenations are unfolded into a stack of pending parts, so finding the
+        # first cell is a loop whatever the depth of the rope
+        curr = self._parts.peek()
+        pending = self._parts.pop()
+        while True:
+            if isinstance(curr, ConcatStream) and not curr._lazy_stream.is_computed():
+                parts = []
+                rest = curr._parts
+                while isinstance(rest, NonEmptyStack):
+                    parts.append(rest.peek())
+                    rest = rest.pop()
+
+                for part in reversed(parts):
+                    pending = pending.push(part)
+            else:
+                step = curr._step()
+                if step is not None:
+                    head, tail = step
+                    if not isinstance(pending, NonEmptyStack):
+                        return ConsStream(head, tail)
+
+                    return ConsStream(head, ConcatStream(pending.push(tail)))
+
+            if not isinstance(pending, NonEmptyStack):
+                return EmptyStream()
+
+            curr = pending.peek()
+            pending = pending.pop()
+
+    def _known_size(self) -> Optional[int]:
+        return self._size if self._size is not None else LazyStream._known_size(self)
+
+
+class _StageStream(LazyStream):
+
+    # A map/filter/take/skip stage runs as a plain iterator over its source and buffers the outputs,
+    # so each element goes through the stage once and cells are only built when the stream is
+    # walked through head/tail
+
+    def __init__(self, source: Stream, stage: Callable, resize: Optional[Callable] = None):
+        LazyStream.__init__(self, lambda: GeneratorStream(iter(self)).touch())
+        self._source: Optional[Stream] = source
+        self._stage: Optional[Callable] = stage
+        self._resize: Final[Optional[Callable]] = resize
+        self._outputs: Optional[Iterator] = None
+        self._buffer: Final[list] = []
+        self._done = False
+        self._error: Optional[Exception] = None
+        self._lock: Final = threading.RLock()
+
+    def __iter__(self):
+        buffer = self._buffer
+        idx = 0
+        while idx < len(buffer) or self._pull(idx):
+            yield buffer[idx]
+            idx += 1
+
+    def __len__(self):
+        size = self._known_size()
+        if size is not None:
+            return size
+
+        self._pull(sys.maxsize)
+        return len(self._buffer)
+
+    def _known_size(self) -> Optional[int]:
+        source = self._source
+        if self._done or source is None:
+            return len(self._buffer)
+
+        size = source._known_size()
+        if size is None or self._resize is None:
+            return None
+
+        return self._resize(size)
+
+    def _pull(self, idx: int) -> bool:
+        with self._lock:
+            buffer = self._buffer
+            if len(buffer) <= idx and not self._done:
+                if self._error is not None:
+                    raise self._error
+
+                try:
+                    if self._outputs is None:
+                        self._outputs = self._stage(iter(self._source))
+
+                    for it in self._outputs:
+                        buffer.append(it)
+                        if len(buffer) > idx:
+                            break
+                    else:
+                        # Drained: let go of the source and the stage, only the buffer is needed from now on
+                        self._done = True
+                        self._source = None
+                        self._stage = None
+                        self._outputs = None
+                except Exception as err:
+                    # The iterators are dead after raising: every later traversal fails at the same element
+                    self._error = err
+                    self._outputs = None
+                    raise
+
+            return len(buffer) > idx
+
+    def _inner_str(self):
+        if self._outputs is not None or self._done or self._error is not None:
+            return Stream._inner_str(self)
+
+        return "..."
+
+
+def _same_size(size: int) -> int:
+    return size
+
+
+def _flatten(it: Iterator) -> Iterator:
+    for x in it:
+        if isinstance(x, Stream):
+            yield from x
+        elif isinstance(x, Some):
+            yield x.value
+        elif not isinstance(x, Nothing):
+            raise TypeError
+
+
+def _skip_while_indexed(it: Iterator, f2: Callable, is_true: bool) -> Iterator:
+    for idx, x in enumerate(it):
+        if f2(x, idx) != is_true:
+            yield x
+            yield from it
+            return
+
+
+def _take_while_indexed(it: Iterator, f2: Callable, is_true: bool) -> Iterator:
+    for idx, x in enumerate(it):
+        if f2(x, idx) != is_true:
+            return
+        yield x
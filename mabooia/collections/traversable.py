@@ -1,32 +1,27 @@
 import abc
+import itertools
 from typing import *
 import sys
 
-from mabooia import Option, Nothing, Some
+from mabooia import Option, NOTHING, Some
 from mabooia.collections.mutable import LinkedList
 
 
 class Traversable(Iterable, Sized, abc.ABC):
 
     def __iter__(self):
-        class Iter(Iterator):
-            def __init__(self, trav):
-                self._trav = trav
-
-            def __next__(self):
-                head = self._trav.head_option
-                if isinstance(head, Some):
-                    self._trav = self._trav.tail
-                    return head.value
-
-                raise StopIteration
-
-        return Iter(self)
+        step = self._step()
+        while step is not None:
+            head, trav = step
+            yield head
+            step = trav._step()
 
     def __len__(self):
         res = 0
-        for _ in self:
+        step = self._step()
+        while step is not None:
             res += 1
+            step = step[1]._step()
         return res
 
     @property
@@ -36,13 +31,22 @@ class Traversable(Iterable, Sized, abc.ABC):
 
     @property
     def rear_option(self) -> Option:
-        return self.fold(Nothing(), lambda _, it: Some(it))
+        return self.fold(NOTHING, lambda _, it: Some(it))
 
     @property
     @abc.abstractmethod
     def tail(self):
         raise NotImplementedError()
 
+    # Returns (head, tail) or None once the traversable is exhausted; used by every built-in loop,
+    # so walking a structure does not allocate an Option per element
+    def _step(self) -> Optional[tuple]:
+        head = self.head_option
+        if isinstance(head, Some):
+            return head.value, self.tail
+
+        return None
+
     @property
     def is_empty(self) -> bool:
         return self.head_option.is_empty()
@@ -143,18 +147,8 @@ class Traversable(Iterable, Sized, abc.ABC):
         return self
 
     def to_list(self, max_size: int = sys.maxsize) -> list:
-        size = min(len(self), max_size)
-        res = [None] * size
-
-        idx = 0
-        for it in self:
-            if idx >= size:
-                break
-
-            res[idx] = it
-            idx += 1
-
-        return res
+        # islice hides __len__ from list(), which would otherwise walk the whole traversable first
+        return list(itertools.islice(self, max(max_size, 0)))
 
     def _inner_str(self) -> str:
         return self._inner_str_max_length(", ", 256)
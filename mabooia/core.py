@@ -1,101 +1,215 @@
 import abc
+import functools
 import threading
+from collections import OrderedDict
+from time import monotonic as _monotonic
 from typing import *
 
 
-class Singleton(object):
-    def __new__(cls, *args, **keywords):
-        instance = cls.__dict__.get("__it__")
+# The instance is created and initialized once under a per-class lock and only then
+# published in __it__, so later calls are a single attribute load.
+
+class SingletonMeta(abc.ABCMeta):
+    def __init__(cls, name, bases, namespace, **kwargs):
+        super().__init__(name, bases, namespace, **kwargs)
+        cls.__it__ = None
+        cls._singleton_lock = threading.Lock()
+
+    def __call__(cls, *args, **keywords):
+        instance = cls.__it__
         if instance is not None:
             return instance
 
-        cls.__it__ = instance = object.__new__(cls)
-        instance.init(*args, **keywords)
+        with cls._singleton_lock:
+            instance = cls.__it__
+            if instance is None:
+                instance = cls.__new__(cls)
+                instance.init(*args, **keywords)
+                cls.__it__ = instance
+
         return instance
 
+
+class Singleton(metaclass=SingletonMeta):
     def init(self, *args, **keywords):
         pass
 
+    @classmethod
+    def reset_singleton(cls):
+        with cls._singleton_lock:
+            cls.__it__ = None
+
 
 # Option
 
 class Option(abc.ABC):
+    __slots__ = ()
 
     def is_empty(self):
         return not self.is_not_empty()
 
+    @abc.abstractmethod
     def is_not_empty(self):
-        return isinstance(self, Some)
+        pass
 
+    @abc.abstractmethod
     def get_or_else(self, default):
-        if isinstance(self, Some):
-            return self.value
-
-        return default() if isinstance(default, Callable) else default
+        pass
 
+    @abc.abstractmethod
     def or_else(self, default_opt):
-        if isinstance(self, Some):
-            return self
-
-        return default_opt() if isinstance(default_opt, Callable) else default_opt
+        pass
 
+    @abc.abstractmethod
     def filter(self, f: Callable, is_true: bool = True):
-        return Some(self.value) if isinstance(self, Some) and f(self.value) == is_true else Nothing()
+        pass
 
+    @abc.abstractmethod
     def flatmap(self, mapper: Callable):
-        if isinstance(self, Some):
-            opt = mapper(self.value)
-
-            assert isinstance(opt, Option)
-            return Some(opt.value) if isinstance(opt, Some) else Nothing()
-
-        return Nothing()
+        pass
 
+    @abc.abstractmethod
     def if_present(self, f: Callable):
-        if isinstance(self, Some):
-            f(self.value)
+        pass
 
+    @abc.abstractmethod
     def map(self, mapper: Callable):
-        return Some(mapper(self.value)) if isinstance(self, Some) else Nothing()
+        pass
 
+    @abc.abstractmethod
     def unzip(self, f: Callable) -> tuple:
-        if isinstance(self, Some):
-            t: tuple = f(self.value)
-            if isinstance(t, tuple):
-                return Some(t[0]), Some(t[1])
-
-        return Nothing(), Nothing()
+        pass
 
+    @abc.abstractmethod
     def zip(self, other):
-        if isinstance(self, Some) and isinstance(other, Some):
-            return Some((self.value, other.value))
-
-        return Nothing()
+        pass
 
 
 class Some(Option):
+    __slots__ = ('value',)
+
     def __init__(self, value):
         self.value: Final = value
 
     def __eq__(self, other: Option):
         return isinstance(other, Some) and self.value == other.value
 
+    def __hash__(self):
+        return hash((Some, self.value))
+
+    def __bool__(self):
+        return True
+
     def __str__(self):
         return f"Some({self.value})"
 
+    def is_empty(self):
+        return False
+
+    def is_not_empty(self):
+        return True
+
+    def get_or_else(self, default):
+        return self.value
+
+    def or_else(self, default_opt):
+        return self
+
+    def filter(self, f: Callable, is_true: bool = True):
+        return self if f(self.value) == is_true else NOTHING
+
+    def flatmap(self, mapper: Callable):
+        opt = mapper(self.value)
+
+        assert isinstance(opt, Option)
+        return opt
+
+    def if_present(self, f: Callable):
+        f(self.value)
+
+    def map(self, mapper: Callable):
+        return Some(mapper(self.value))
+
+    def unzip(self, f: Callable) -> tuple:
+        t: tuple = f(self.value)
+        if isinstance(t, tuple):
+            return Some(t[0]), Some(t[1])
+
+        return NOTHING, NOTHING
+
+    def zip(self, other):
+        return Some((self.value, other.value)) if type(other) is Some else NOTHING
+
+
+class Nothing(Option):
+    __slots__ = ()
+
+    def __new__(cls):
+        return NOTHING
+
+    def __eq__(self, other):
+        return other is self
+
+    def __hash__(self):
+        return hash(Nothing)
+
+    def __bool__(self):
+        return False
 
-class Nothing(Option, Singleton):
     def __str__(self):
         return "Nothing"
 
+    def __copy__(self):
+        return self
+
+    def __deepcopy__(self, memo):
+        return self
+
+    def __reduce__(self):
+        return Nothing, ()
+
+    def is_empty(self):
+        return True
+
+    def is_not_empty(self):
+        return False
+
+    def get_or_else(self, default):
+        return default() if isinstance(default, Callable) else default
+
+    def or_else(self, default_opt):
+        return default_opt() if isinstance(default_opt, Callable) else default_opt
+
+    def filter(self, f: Callable, is_true: bool = True):
+        return self
+
+    def flatmap(self, mapper: Callable):
+        return self
+
+    def if_present(self, f: Callable):
+        pass
+
+    def map(self, mapper: Callable):
+        return self
+
+    def unzip(self, f: Callable) -> tuple:
+        return self, self
+
+    def zip(self, other):
+        return self
+
+
+NOTHING: Final[Nothing] = object.__new__(Nothing)
+
 
 def option(value):
-    return Some(value) if value is not None else Nothing()
+    return Some(value) if value is not None else NOTHING
 
 
 # Lazy
 
 class Lazy(abc.ABC):
+    __slots__ = ()
 
     @abc.abstractmethod
     def is_computed(self) -> bool:
@@ -111,6 +225,8 @@ class Lazy(abc.ABC):
 
 
 class EvaluatedLazy(Lazy):
+    __slots__ = ('_value',)
+
     def __init__(self, value):
         self._value: Final = value
 
@@ -127,46 +243,244 @@ class EvaluatedLazy(Lazy):
         return f"Lazy({self._value})"
 
 
+class UnsynchronizedLazy(Lazy):
+    __slots__ = ('_f', '_value')
+
+    def __init__(self, f: Callable):
+        self._f: Optional[Callable] = f
+        self._value: Optional = None
+
+    def is_computed(self) -> bool:
+        return self._f is None
+
+    def get_if_computed(self) -> Option:
+        return Some(self._value) if self._f is None else NOTHING
+
+    def get(self):
+        f = self._f
+        if f is not None:
+            self._value = f()
+            self._f = None
+
+        return self._value
+
+    def __str__(self):
+        if self._f is None:
+            return f"Lazy({self._value})"
+        else:
+            return "Lazy(...)"
+
+
+# The thunk is released once the value is computed. Instances share one guard lock
+# that is only held to claim or publish a computation, and an Event is created only
+# when another thread has to wait for the running one.
+
+_lazy_guard = threading.Lock()
+
+
 class SynchronizedLazy(Lazy):
+    __slots__ = ('_f', '_value', '_owner', '_done')
+
     def __init__(self, f: Callable):
-        self._f = f
-        self._is_computed = False
+        self._f: Optional[Callable] = f
         self._value: Optional = None
-        self._lock = threading.Lock()
+        self._owner: Optional[int] = None
+        self._done: Optional[threading.Event] = None
 
     def is_computed(self) -> bool:
-        return self._is_computed
+        return self._f is None
 
     def get_if_computed(self) -> Option:
-        return Some(self._value) if self._is_computed else Nothing()
+        return Some(self._value) if self._f is None else NOTHING
 
     def get(self):
-        self._compute_if_needed()
+        while self._f is not None:
+            self._compute_or_wait()
+
         return self._value
 
-    def _compute_if_needed(self):
-        if not self._is_computed:
-            with self._lock:
-                if not self._is_computed:
-                    self._value = self._f()
-                    self._is_computed = True
+    def _compute_or_wait(self):
+        me = threading.get_ident()
+        with _lazy_guard:
+            f = self._f
+            if f is None:
+                return
+            elif self._owner is None:
+                self._owner = me
+                done = None
+            elif self._owner == me:
+                raise RuntimeError("Recursive evaluation of a lazy value")
+            else:
+                done = self._done
+                if done is None:
+                    done = self._done = threading.Event()
+
+        if done is not None:
+            done.wait()
+            return
+
+        try:
+            value = f()
+        except BaseException:
+            self._release(False, None)
+            raise
+
+        self._release(True, value)
+
+    def _release(self, computed: bool, value):
+        with _lazy_guard:
+            if computed:
+                self._value = value
+                self._f = None
+            self._owner = None
+            done = self._done
+            self._done = None
+
+        if done is not None:
+            done.set()
 
     def __str__(self):
-        if self._is_computed:
+        if self._f is None:
             return f"Lazy({self._value})"
         else:
             return "Lazy(...)"
 
 
-def lazy(arg) -> Lazy:
+def lazy(arg, thread_safe: bool = True) -> Lazy:
     if isinstance(arg, Lazy):
         return arg
     elif isinstance(arg, Callable):
-        return SynchronizedLazy(arg)
+        return SynchronizedLazy(arg) if thread_safe else UnsynchronizedLazy(arg)
     else:
         return EvaluatedLazy(arg)
 
 
+# Memoize
+
+class CacheInfo:
+    def __init__(self, hits: int, misses: int, evictions: int, size: int, maxsize: Optional[int]):
+        self.hits: Final[int] = hits
+        self.misses: Final[int] = misses
+        self.evictions: Final[int] = evictions
+        self.size: Final[int] = size
+        self.maxsize: Final[Optional[int]] = maxsize
+
+    def __eq__(self, other):
+        return isinstance(other, CacheInfo) and self._key() == other._key()
+
+    def __str__(self):
+        return f"CacheInfo(hits={self.hits}, misses={self.misses}, evictions={self.evictions}," \
+               f" size={self.size}, maxsize={self.maxsize})"
+
+    def _key(self):
+        return self.hits, self.misses, self.evictions, self.size, self.maxsize
+
+
+_MIN_SWEEP_SIZE: Final[int] = 128
+
+
+class Memoized:
+    def __init__(self,
+                 f: Callable,
+                 maxsize: Optional[int] = 128,
+                 ttl: Optional[float] = None,
+                 key: Optional[Callable] = None,
+                 timer: Callable[[], float] = _monotonic):
+        assert maxsize is None or maxsize > 0
+        assert ttl is None or ttl > 0
+        self._f: Final[Callable] = f
+        self._maxsize: Final[Optional[int]] = maxsize
+        self._ttl: Final[Optional[float]] = ttl
+        self._key: Final[Optional[Callable]] = key
+        self._timer: Final[Callable[[], float]] = timer
+        self._entries = OrderedDict()
+        self._lock = threading.Lock()
+        self._hits = 0
+        self._misses = 0
+        self._evictions = 0
+        self._sweep_at = _MIN_SWEEP_SIZE
+        functools.update_wrapper(self, f)
+
+    def __call__(self, *args, **kwargs):
+        k = self._key(*args, **kwargs) if self._key is not None else _make_key(args, kwargs)
+        now = self._timer() if self._ttl is not None else None
+
+        with self._lock:
+            entry = self._entries.get(k)
+            if entry is not None and (now is None or entry[1] > now):
+                self._entries.move_to_end(k)
+                self._hits += 1
+            else:
+                if entry is not None:
+                    self._evictions += 1
+
+                self._misses += 1
+                expires_at = now + self._ttl if now is not None else None
+                entry = self._entries[k] = (SynchronizedLazy(lambda: self._f(*args, **kwargs)), expires_at)
+                if self._maxsize is not None and len(self._entries) > self._maxsize:
+                    self._entries.popitem(last=False)
+                    self._evictions += 1
+                elif now is not None and len(self._entries) >= self._sweep_at:
+                    self._sweep(now)
+
+        try:
+            return entry[0].get()
+        except BaseException:
+            with self._lock:
+                if self._entries.get(k) is entry:
+                    del self._entries[k]
+            raise
+
+    def __get__(self, instance, owner=None):
+        return self if instance is None else functools.partial(self, instance)
+
+    # Expired entries are only replaced when their key is called again: drop them all once the
+    # cache doubles its size since the last sweep, so an unbounded cache with a ttl stays bounded
+    def _sweep(self, now: float):
+        expired = [k for k, (_, expires_at) in self._entries.items() if expires_at <= now]
+        for k in expired:
+            del self._entries[k]
+
+        self._evictions += len(expired)
+        self._sweep_at = max(_MIN_SWEEP_SIZE, 2 * len(self._entries))
+
+    def cache_info(self) -> CacheInfo:
+        with self._lock:
+            return CacheInfo(self._hits, self._misses, self._evictions, len(self._entries), self._maxsize)
+
+    def cache_clear(self):
+        with self._lock:
+            self._entries.clear()
+            self._hits = 0
+            self._misses = 0
+            self._evictions = 0
+            self._sweep_at = _MIN_SWEEP_SIZE
+
+
+def memoize(f: Optional[Callable] = None,
+            maxsize: Optional[int] = 128,
+            ttl: Optional[float] = None,
+            key: Optional[Callable] = None,
+            timer: Callable[[], float] = _monotonic):
+    if f is not None:
+        return Memoized(f, maxsize, ttl, key, timer)
+
+    def decorator(g: Callable) -> Memoized:
+        return Memoized(g, maxsize, ttl, key, timer)
+
+    return decorator
+
+
+_KWARGS_MARK: Final = object()
+
+
+def _make_key(args: tuple, kwargs: dict):
+    if not kwargs:
+        return args[0] if len(args) == 1 and type(args[0]) in (str, int) else args
+
+    return args + (_KWARGS_MARK,) + tuple(sorted(kwargs.items()))
+
+
 # Try
 
 class Try(abc.ABC):
@@ -180,7 +494,7 @@ class Try(abc.ABC):
         if isinstance(self, Success):
             return Some(self.result)
 
-        return Nothing()
+        return NOTHING
 
     def get_tuple(self) -> tuple[Optional, Optional[Exception]]:
         if isinstance(self, Success):
@@ -215,7 +529,7 @@ class Try(abc.ABC):
         return self
 
     def if_failure_with(self, err_type, recover_func: Callable):
-        if isinstance(self, Failure) and isinstance(self.err, err_type):
+        if isinstance(self, Failure) and self.is_error_of(err_type):
             err = self.err
 
             def g():
@@ -229,6 +543,45 @@ class Try(abc.ABC):
         if isinstance(self, Failure):
             raise self.err
 
+    @staticmethod
+    def sequence(items: Iterable):
+        res = []
+        for it in items:
+            t = it if isinstance(it, Try) else try_of(it)
+            if isinstance(t, Failure):
+                return t
+
+            res.append(t.result)
+
+        return Success(res)
+
+    @staticmethod
+    def partition(items: Iterable, max_samples: int = 100) -> tuple:
+        results = []
+        report = FailureReport(max_samples)
+        for idx, it in enumerate(items):
+            t = it if isinstance(it, Try) else try_of(it, light=True)
+            if isinstance(t, Failure):
+                report.add(idx, t.err)
+            else:
+                results.append(t.result)
+
+        return results, report
+
+    async def if_success_async(self, f: Callable):
+        if isinstance(self, Success):
+            res = self.result
+            return await async_try_of(lambda: f(res))
+
+        return self
+
+    async def if_failure_async(self, recover_func: Callable):
+        if isinstance(self, Failure):
+            err = self.err
+            return await async_try_of(lambda: recover_func(err))
+
+        return self
+
 
 class Success(Try):
     def __init__(self, result):
@@ -257,19 +610,113 @@ class Failure(Try):
     def __str__(self):
         return f"Failure({self.err})"
 
+    def is_error_of(self, err_type) -> bool:
+        err = self.err
+        if isinstance(err, ErrorSummary):
+            return issubclass(err.error_type, err_type)
+
+        return isinstance(err, err_type)
+
+    def light(self):
+        return self if isinstance(self.err, ErrorSummary) else Failure(ErrorSummary.of(self.err))
 
-def try_of(arg) -> Try:
+
+# A detached description of an exception: it keeps the exception type, message and
+# the location it was raised from, but no traceback, frames or arguments.
+
+class ErrorSummary(Exception):
+
+    @staticmethod
+    def of(err: Exception):
+        if isinstance(err, ErrorSummary):
+            return err
+
+        tb = err.__traceback__
+        origin = None
+        if tb is not None:
+            while tb.tb_next is not None:
+                tb = tb.tb_next
+            code = tb.tb_frame.f_code
+            origin = f"{code.co_filename}:{tb.tb_lineno} in {code.co_name}"
+
+        return ErrorSummary(type(err), str(err), origin)
+
+    def __init__(self, error_type: type, message: str, origin: Optional[str] = None):
+        super().__init__(message)
+        self.error_type: Final[type] = error_type
+        self.message: Final[str] = message
+        self.origin: Final[Optional[str]] = origin
+
+    def __eq__(self, other):
+        return isinstance(other, ErrorSummary) and self._key() == other._key()
+
+    def __hash__(self):
+        return hash(self._key())
+
+    def __str__(self):
+        return f"{self.error_type.__name__}: {self.message}"
+
+    def _key(self):
+        return self.error_type, self.message, self.origin
+
+
+class FailureReport:
+    def __init__(self, max_samples: int = 100):
+        self._max_samples: Final[int] = max_samples
+        self._count = 0
+        self._counts_by_type = dict()
+        self._samples = []
+
+    def __len__(self):
+        return self._count
+
+    def __str__(self):
+        by_type = ', '.join(f"{name}: {count}" for name, count in self._counts_by_type.items())
+        return f"FailureReport({self._count} failures; {by_type})"
+
+    @property
+    def count(self) -> int:
+        return self._count
+
+    @property
+    def counts_by_type(self) -> dict:
+        return dict(self._counts_by_type)
+
+    @property
+    def samples(self) -> list:
+        return list(self._samples)
+
+    def add(self, idx: int, err: Exception):
+        summary = ErrorSummary.of(err)
+        name = summary.error_type.__name__
+        self._count += 1
+        self._counts_by_type[name] = self._counts_by_type.get(name, 0) + 1
+        if len(self._samples) < self._max_samples:
+            self._samples.append((idx, summary))
+
+
+def try_of(arg, light: bool = False) -> Try:
     if isinstance(arg, tuple):
         if arg[1] is None:
             return Success(arg[0])
-        return Failure(arg[1])
+        return Failure(ErrorSummary.of(arg[1]) if light else arg[1])
 
     elif isinstance(arg, Callable):
         try:
             res = arg()
             return Success(res)
         except Exception as ex:
-            return Failure(ex)
+            return Failure(ErrorSummary.of(ex) if light else ex)
 
     else:
         return Success(arg)
+
+
+async def async_try_of(arg) -> Try:
+    try:
+        res = arg() if isinstance(arg, Callable) else arg
+        if isinstance(res, Awaitable):
+            res = await res
+        return Success(res)
+    except Exception as ex:
+        return Failure(ex)
@@ -1 +1,5 @@
-from .hashes import *
+from mabooia._lazy import lazy_exports
+
+__getattr__, __dir__, __all__ = lazy_exports(__name__, globals(), {
+    '.hashes': ('bin_to_hex', 'hash_of', 'sha256', 'sha512', 'sha256_to_str'),
+})
@@ -1,8 +1,19 @@
-from .definitions import *
-from .utils import *
-from .events import *
-from .positions import *
-from .transactions import *
-from .timeline import *
-from .accounts import *
+from mabooia._lazy import lazy_exports
 
+__getattr__, __dir__, __all__ = lazy_exports(__name__, globals(), {
+    '.definitions': (
+        'StockExchange', 'Security', 'Stock', 'OptionContract', 'CallOption', 'PutOption',
+        'all_stock_exchanges', 'get_stock_exchange',
+    ),
+    '.utils': ('from_tmpl', 'get_option_dict', 'format_match_to_option_symbol'),
+    '.events': (
+        'Event', 'SecurityEvent', 'Trade', 'Dividend', 'TransformFrom', 'TransformInto',
+        'OptionExpiration', 'UnknownEvent',
+    ),
+    '.positions': ('Position',),
+    '.transactions': ('QuestradeTransaction', 'ScotiaITradeTransaction'),
+    '.timeline': ('TimelineRange', 'DayOfMonthRange', 'MonthRange'),
+    '.accounts': ('Account', 'AccountCurrencySide'),
+    # Re-exported since the star import of accounts used to leak them over the .timeline ones
+    'mabooia.time': ('Timeline', 'TimelineEvent'),
+})
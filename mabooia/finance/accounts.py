@@ -1,14 +1,16 @@
+from mabooia import PrecisionPolicy, ExactPrecision
 from mabooia.accounting import Currency
 from mabooia.collections import Stream
-from mabooia.collections.mutable import put_if_absent, compute_if_absent
+from mabooia.collections.mutable import compute_if_absent
 from mabooia.finance import Event, SecurityEvent, Position
 from mabooia.reactive import Observable
 from mabooia.time import Timeline, TimelineEvent, TimeCriteria, all_events
 
 
 class Account(Observable):
-    def __init__(self, account_id, *currencies: Currency):
+    def __init__(self, account_id, *currencies: Currency, precision: PrecisionPolicy = ExactPrecision()):
         self._account_id = account_id
+        self._precision = precision
         self._currency_sides = dict()
         for curr in currencies:
             self._currency_sides[curr] = self._create_new_currency_side(curr)
@@ -24,6 +26,10 @@ class Account(Observable):
     def account_id(self):
         return self._account_id
 
+    @property
+    def precision(self) -> PrecisionPolicy:
+        return self._precision
+
     @property
     def is_multicurrency(self):
         return len(self._currency_sides) > 1
@@ -97,7 +103,11 @@ class AccountCurrencySide(Observable):
     def add_event(self, event: Event):
         self._timeline.add_event(TimelineEvent(event.transaction_date, event))
         if isinstance(event, SecurityEvent):
-            position = put_if_absent(self._positions, event.symbol, Position(event.account_id, event.security))
+            position = compute_if_absent(
+                self._positions,
+                event.symbol,
+                lambda: Position(event.account_id, event.security, self.account.precision)
+            )
             position.add_event(event)
 
     def _event_raised(self, event: TimelineEvent):
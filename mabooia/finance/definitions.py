@@ -71,7 +71,7 @@ class OptionContract(Security, abc.ABC):
         self._stock = stock
         self._exp_date = exp_date
         self._strike_price = strike_price
-        Security.__init__(self, self.symbol, stock.currency)
+        Security.__init__(self, self._get_symbol(), stock.currency)
 
     def __str__(self):
         return self.symbol
@@ -80,11 +80,6 @@ class OptionContract(Security, abc.ABC):
     def shares_per_unit(self):
         return 100
 
-    @property
-    def symbol(self):
-        return f"{self.stock.symbol}{self.exp_date.strftime('%Y%b%d')}" \
-               f"@{'{0:g}'.format(self.strike_price)}{self.option_type}"
-
     @property
     def stock(self) -> Stock:
         return self._stock
@@ -110,6 +105,10 @@ class OptionContract(Security, abc.ABC):
     def option_type(self) -> str:
         pass
 
+    def _get_symbol(self) -> str:
+        return f"{self.stock.symbol}{self.exp_date.strftime('%Y%b%d')}" \
+               f"@{'{0:g}'.format(self.strike_price)}{self.option_type}"
+
 
 class CallOption(OptionContract):
     def __init__(self, stock: Stock, exp_date: date, strike_price: Rational):
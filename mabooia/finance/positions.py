@@ -1,4 +1,4 @@
-from mabooia import lazy, Rational
+from mabooia import lazy, Rational, PrecisionPolicy, ExactPrecision
 from mabooia.accounting import Currency
 from mabooia.collections.mutable import LinkedList
 from mabooia.crypto import sha256_to_str
@@ -6,14 +6,15 @@ from mabooia.finance import Trade, Security
 
 
 class Position:
-    def __init__(self, account_id: str, security: Security):
+    def __init__(self, account_id: str, security: Security, precision: PrecisionPolicy = ExactPrecision()):
         self._account_id = account_id
         self._security = security
+        self._precision = precision
         self._events = LinkedList()
         self._lazy_id = lazy(self._get_id)
-        self._quantity = Rational(0)
-        self._avg_cost = Rational(0)
-        self._realized_pl = Rational(0)
+        self._quantity = Rational.zero()
+        self._avg_cost = Rational.zero()
+        self._realized_pl = Rational.zero()
 
     def __str__(self):
         ff = '{0:,g}'
@@ -66,6 +67,10 @@ class Position:
     def book_value(self) -> Rational:
         return self.quantity * self.avg_cost * self.security.shares_per_unit
 
+    @property
+    def precision(self) -> PrecisionPolicy:
+        return self._precision
+
     @property
     def realized_pl(self) -> Rational:
         return self._realized_pl
@@ -96,13 +101,14 @@ class Position:
             decreasing_position = (qty > 0 and event.is_sell) or (qty < 0 and event.is_buy)
             qty += event.quantity
             if decreasing_position:
-                self._realized_pl += -event.quantity * shares_per_unit * (event.price - avg_cost) - event.fee
+                realized_pl = -event.quantity * shares_per_unit * (event.price - avg_cost) - event.fee
+                self._realized_pl = self._precision.apply(self._realized_pl + realized_pl)
                 book_val = qty * shares_per_unit * avg_cost
             else:
                 book_val -= event.total_vector
 
         self._quantity = qty
-        self._avg_cost = book_val / (qty * shares_per_unit) if qty != 0 else 0
+        self._avg_cost = self._precision.apply(book_val / (qty * shares_per_unit)) if qty != 0 else Rational.zero()
         self._events.append(event)
 
     def _get_id(self):
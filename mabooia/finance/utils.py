@@ -1,8 +1,9 @@
 import re
 from datetime import date
 from time import strptime
+from typing import Optional
 
-from mabooia import rat
+from mabooia import memoize, rat
 
 
 def from_tmpl(pattern: str) -> str:
@@ -16,6 +17,17 @@ def from_tmpl(pattern: str) -> str:
 
 
 def get_option_dict(pattern: str, text: str):
+    parsed = _parse_option(pattern, text)
+    if parsed is not None:
+        res = dict()
+        res['stock_symbol'], res['exp_date'], res['strike_price'], res['type'] = parsed
+        return res
+    else:
+        return None
+
+
+@memoize(maxsize=4096)
+def _parse_option(pattern: str, text: str) -> Optional[tuple]:
     m = re.match(pattern, text)
     if m:
         ot = "CALL" if 'C' in m.group('opt_type') else 'PUT'
@@ -34,12 +46,7 @@ def get_option_dict(pattern: str, text: str):
             int(m.group('day')),
         )
 
-        res = dict()
-        res['stock_symbol'] = m.group('stock')
-        res['exp_date'] = dt
-        res['strike_price'] = rat(m.group('price'))
-        res['type'] = ot
-        return res
+        return m.group('stock'), dt, rat(m.group('price')), ot
     else:
         return None
 
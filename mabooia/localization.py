@@ -1,4 +1,6 @@
 import locale
+import threading
+from typing import *
 
 
 def get_locale_info(loc):
@@ -12,12 +14,101 @@ def get_current_locale_info():
 
 
 def get_decimal_separator():
-    return get_current_locale_info()['decimal_point']
+    return get_number_format().decimal_separator
 
 
 def get_negative_sign():
-    return get_current_locale_info()['negative_sign']
+    return get_number_format().negative_sign
 
 
 def get_thousand_separator():
-    return get_current_locale_info()['thousands_sep']
+    return get_number_format().thousands_separator
+
+
+# Number formats
+
+class NumberFormat:
+
+    @staticmethod
+    def of(loc=None):
+        return get_number_format(loc)
+
+    def __init__(self,
+                 decimal_separator: str = '.',
+                 thousands_separator: str = ',',
+                 negative_sign: str = '-',
+                 locale_name: Optional[str] = None):
+        assert decimal_separator != ''
+        assert decimal_separator != thousands_separator
+        self._decimal_separator: Final[str] = decimal_separator
+        self._thousands_separator: Final[str] = thousands_separator
+        self._negative_sign: Final[str] = negative_sign if negative_sign != '' else '-'
+        self._locale_name: Final[Optional[str]] = locale_name
+
+    def __eq__(self, other):
+        return isinstance(other, NumberFormat) and self._key() == other._key()
+
+    def __hash__(self):
+        return hash(self._key())
+
+    def __str__(self):
+        return f"NumberFormat(decimal='{self.decimal_separator}'," \
+               f" thousands='{self.thousands_separator}'," \
+               f" negative='{self.negative_sign}')"
+
+    @property
+    def decimal_separator(self) -> str:
+        return self._decimal_separator
+
+    @property
+    def thousands_separator(self) -> str:
+        return self._thousands_separator
+
+    @property
+    def negative_sign(self) -> str:
+        return self._negative_sign
+
+    @property
+    def locale_name(self) -> Optional[str]:
+        return self._locale_name
+
+    def _key(self):
+        return self._decimal_separator, self._thousands_separator, self._negative_sign
+
+
+DEFAULT_NUMBER_FORMAT: Final[NumberFormat] = NumberFormat()
+
+_number_formats = dict()
+_number_formats_lock = threading.Lock()
+
+
+def get_number_format(loc=None) -> NumberFormat:
+    if isinstance(loc, NumberFormat):
+        return loc
+
+    key = loc if loc is not None else locale.getlocale()
+    fmt = _number_formats.get(key)
+    if fmt is None:
+        with _number_formats_lock:
+            fmt = _number_formats.get(key)
+            if fmt is None:
+                fmt = _number_formats[key] = _capture_number_format(key)
+
+    return fmt
+
+
+def _capture_number_format(loc) -> NumberFormat:
+    prev_loc = locale.setlocale(locale.LC_ALL)
+    try:
+        info = get_locale_info(loc)
+    except locale.Error:
+        return DEFAULT_NUMBER_FORMAT
+    finally:
+        locale.setlocale(locale.LC_ALL, prev_loc)
+
+    return NumberFormat(
+        info['decimal_point'],
+        info['thousands_sep'],
+        info['negative_sign'],
+        loc if isinstance(loc, str) else '.'.join(filter(None, loc))
+    )
@@ -1 +1,5 @@
-from .excel import *
+from mabooia._lazy import lazy_exports
+
+__getattr__, __dir__, __all__ = lazy_exports(__name__, globals(), {
+    '.excel': ('read_excel_table',),
+})
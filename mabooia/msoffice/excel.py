@@ -24,5 +24,5 @@ def read_excel_table(filepath, sheet) -> Stream:
 
             return obj
 
-        return Stream.of(dfs.values) \
+        return Stream.from_iter(dfs.values) \
             .map(to_obj)
@@ -1,133 +1,315 @@
+import abc
 import math
+import numbers
 import re
-from typing import Final
+import sys
+from enum import Enum
+from typing import Callable, Final, Iterable, Iterator, Optional
 
-from mabooia import get_decimal_separator, get_negative_sign, get_thousand_separator, Some, lazy
-from mabooia.collections.streams import EmptyStream
-from mabooia.collections.mutable import LinkedList
+from mabooia import get_number_format, NumberFormat, Success, Try, try_of
+
+
+# Rounding
+
+class RoundingMode(Enum):
+    HALF_EVEN = 0
+    HALF_UP = 1
+    TRUNCATE = 2
+
+    def __str__(self):
+        return self.name
+
+
+def round_div(num: int, den: int, mode: RoundingMode = RoundingMode.HALF_EVEN) -> int:
+    if den < 0:
+        num = -num
+        den = -den
+
+    quot, rem = divmod(num, den)
+    if rem == 0:
+        return quot
+
+    if mode is RoundingMode.TRUNCATE:
+        return quot if num >= 0 else quot + 1
+
+    rem2 = 2 * rem
+    if rem2 < den:
+        return quot
+    elif rem2 > den:
+        return quot + 1
+    elif mode is RoundingMode.HALF_EVEN:
+        return quot + (quot & 1)
+    else:
+        return quot + 1 if num >= 0 else quot
 
 
 class Rational:
+    __slots__ = ('_num', '_den')
 
     @staticmethod
     def one():
-        return rat(1)
+        return _ONE
 
     @staticmethod
     def minus_one():
-        return rat(-1)
+        return _MINUS_ONE
 
     @staticmethod
     def zero():
-        return rat(0)
+        return _ZERO
+
+    @staticmethod
+    def of(obj, fmt: NumberFormat = None):
+        if isinstance(obj, Rational):
+            return obj
+        elif isinstance(obj, int):
+            return Rational._from_int(obj)
+        elif isinstance(obj, float):
+            return Rational.from_float(obj)
+        elif isinstance(obj, str):
+            ctx = _get_parsing_context(fmt)
+            m = ctx.rational_rep_regex.match(obj)
+            if m:
+                return Rational._from_rat_rep(m, ctx.fmt)
+            else:
+                m = ctx.float_rep_regex.match(obj)
+                if m:
+                    return Rational._from_float_rep(match_to_float_rep(m, ctx.fmt), ctx.fmt)
+                else:
+                    return Rational._from_str(obj, ctx.fmt)
+        elif isinstance(obj, numbers.Rational):
+            return Rational(obj.numerator, obj.denominator)
+        else:
+            raise TypeError
+
+    @staticmethod
+    def from_float(n: float, exact: bool = False):
+        if not math.isfinite(n):
+            raise ValueError(f"Cannot convert {n} to Rational")
+
+        if exact:
+            num, den = n.as_integer_ratio()
+            return Rational(num, den, True)
+
+        num, den = _shortest_decimal_ratio(n)
+        return Rational(num, den)
 
     def __init__(self, num: int, den: int = 1, _simplified: bool = False):
-        assert den != 0
-        self._is_negative: Final[bool] = (num > 0 > den) or (num < 0 < den)
-        num = abs(num)
-        den = abs(den)
-        self._num: Final[int] = num if not self._is_negative else -num
+        if den == 0:
+            raise ZeroDivisionError(f"Rational({num}, 0)")
+
+        if not _simplified:
+            if den < 0:
+                num = -num
+                den = -den
+
+            gcd = math.gcd(num, den)
+            if gcd != 1:
+                num //= gcd
+                den //= gcd
+
+        self._num: Final[int] = num
         self._den: Final[int] = den
-        self._simplified: bool = _simplified or num == 0 or den == 1
+
+    def __hash__(self):
+        if self._den == 1:
+            return hash(self._num)
+
+        try:
+            den_inv = pow(self._den, -1, _HASH_MODULUS)
+        except ValueError:
+            hash_ = _HASH_INF
+        else:
+            hash_ = hash(hash(abs(self._num)) * den_inv)
+
+        res = hash_ if self._num >= 0 else -hash_
+        return -2 if res == -1 else res
 
     def __int__(self) -> int:
-        s = self.simplify()
-        if s.is_integer:
-            return s.num
+        if self._num >= 0:
+            return self._num // self._den
         else:
-            return int(s.num / s.den)
+            return -(-self._num // self._den)
 
     def __float__(self) -> float:
-        s = self.simplify()
-        if s.is_integer:
-            return float(s.num)
-        else:
-            return s.num / s.den
+        return self._num / self._den
 
     def __format__(self, format_spec):
-        return format(float(self), format_spec)
+        return _format(self, format_spec)
+
+    def __round__(self, ndigits: int = None):
+        if ndigits is None:
+            return round_div(self._num, self._den)
+
+        return self.round(ndigits)
 
     def __cmp__(self, other) -> int:
         return self._cmp(other)
 
+    def __bool__(self):
+        return self._num != 0
+
     def __eq__(self, other) -> bool:
-        return self._cmp(other) == 0
+        if type(other) is int:
+            return self._den == 1 and self._num == other
+        elif isinstance(other, Rational):
+            return self._num == other._num and self._den == other._den
+
+        o = _as_comparable(other)
+        if o is None:
+            return NotImplemented
+        elif isinstance(o, float):
+            return False
+
+        return self._num == o._num and self._den == o._den
 
     def __ne__(self, other) -> bool:
-        return self._cmp(other) != 0
+        res = self.__eq__(other)
+        return res if res is NotImplemented else not res
 
     def __gt__(self, other) -> bool:
-        return self._cmp(other) > 0
+        diff = self._diff_sign(other)
+        return diff if diff is NotImplemented else diff > 0
 
     def __ge__(self, other) -> bool:
-        return self._cmp(other) >= 0
+        diff = self._diff_sign(other)
+        return diff if diff is NotImplemented else diff >= 0
 
     def __lt__(self, other) -> bool:
-        return self._cmp(other) < 0
+        diff = self._diff_sign(other)
+        return diff if diff is NotImplemented else diff < 0
 
     def __le__(self, other) -> bool:
-        return self._cmp(other) <= 0
+        diff = self._diff_sign(other)
+        return diff if diff is NotImplemented else diff <= 0
+
+    def __pos__(self):
+        return self
 
     def __neg__(self):
-        return Rational(-self.num, self.den)
+        return Rational(-self._num, self._den, True)
 
     def __abs__(self):
-        return self if not self.is_negative else -self
+        return self if self._num >= 0 else -self
 
     def __add__(self, other):
-        o = rat(other)
-        return Rational(self.num * o.den + o.num * self.den, self.den * o.den)
+        if type(other) is int:
+            return Rational(self._num + other * self._den, self._den, True)
+        elif isinstance(other, Rational):
+            return _add(self._num, self._den, other._num, other._den)
+
+        o = _as_rational(other)
+        return _add(self._num, self._den, o._num, o._den) if o is not None else NotImplemented
+
+    def __radd__(self, other):
+        return self.__add__(other)
 
     def __sub__(self, other):
-        o = rat(other)
-        return Rational(self.num * o.den - o.num * self.den, self.den * o.den)
+        if type(other) is int:
+            return Rational(self._num - other * self._den, self._den, True)
+        elif isinstance(other, Rational):
+            return _add(self._num, self._den, -other._num, other._den)
+
+        o = _as_rational(other)
+        return _add(self._num, self._den, -o._num, o._den) if o is not None else NotImplemented
+
+    def __rsub__(self, other):
+        if type(other) is int:
+            return Rational(other * self._den - self._num, self._den, True)
+
+        o = _as_rational(other)
+        return _add(o._num, o._den, -self._num, self._den) if o is not None else NotImplemented
 
     def __mul__(self, other):
-        o = rat(other)
-        return Rational(self.num * o.num, self.den * o.den)
+        if type(other) is int:
+            gcd = math.gcd(other, self._den)
+            return Rational(self._num * (other // gcd), self._den // gcd, True)
+        elif isinstance(other, Rational):
+            return _mul(self._num, self._den, other._num, other._den)
+
+        o = _as_rational(other)
+        return _mul(self._num, self._den, o._num, o._den) if o is not None else NotImplemented
+
+    def __rmul__(self, other):
+        return self.__mul__(other)
 
     def __pow__(self, power, modulo=None):
-        if power == 0:
-            return Rational.one()
-        elif power == 1 or self == 0 or self == 1:
-            return self
-        elif power == -1:
-            return self.invert()
-        else:
-            n = self.den if power < 0 else self.num
-            d = self.num if power < 0 else self.den
+        if modulo is not None:
+            return self._pow_mod(power, modulo)
 
-            p = abs(power)
+        if type(power) is int:
+            return self._pow_int(power)
 
-            n = n**p
-            d = d**p
+        # Float exponents take their shortest decimal value and follow the Rational exponent path
+        p = Rational.from_float(power) if isinstance(power, float) else _as_rational(power)
+        if p is None:
+            return NotImplemented
 
-            return rat(n) / rat(d)
+        return self._pow_rational(p)
+
+    def __rpow__(self, other, modulo=None):
+        o = _as_rational(other)
+        return o.__pow__(self, modulo) if o is not None else NotImplemented
 
     def __truediv__(self, other):
-        o = rat(other)
-        return Rational(self.num * o.den, self.den * o.num)
+        if type(other) is int:
+            return _div(self._num, self._den, other, 1)
+        elif isinstance(other, Rational):
+            return _div(self._num, self._den, other._num, other._den)
+
+        o = _as_rational(other)
+        return _div(self._num, self._den, o._num, o._den) if o is not None else NotImplemented
+
+    def __rtruediv__(self, other):
+        if type(other) is int:
+            return _div(other, 1, self._num, self._den)
+
+        o = _as_rational(other)
+        return _div(o._num, o._den, self._num, self._den) if o is not None else NotImplemented
 
     def __mod__(self, other):
-        o = rat(other)
-        return Rational(self.num * o.den % (self.den * o.num), self.den * o.den)
+        o = _as_rational(other)
+        if o is None:
+            return NotImplemented
+
+        return Rational(self._num * o._den % (self._den * o._num), self._den * o._den)
+
+    def __rmod__(self, other):
+        o = _as_rational(other)
+        return o % self if o is not None else NotImplemented
 
     def __floordiv__(self, other):
-        o = rat(other)
-        return rat((self.num * o.den) // (self.den * o.num))
+        o = _as_rational(other)
+        if o is None:
+            return NotImplemented
+
+        return Rational._from_int((self._num * o._den) // (self._den * o._num))
+
+    def __rfloordiv__(self, other):
+        o = _as_rational(other)
+        return o // self if o is not None else NotImplemented
 
     def __divmod__(self, other):
-        o = rat(other)
+        o = _as_rational(other)
+        if o is None:
+            return NotImplemented
+
         return self // o, self % o
 
     def __str__(self):
-        if self._simplified and self.is_integer:
+        if self.is_integer:
             return str(self.num)
         else:
             return f"rat({self.num}, {self.den}) = {float_rep(self, 100)}"
 
     def __copy__(self):
-        return Rational(self.num, self.den, self._simplified)
+        return self
+
+    def __deepcopy__(self, memo):
+        return self
+
+    def __reduce__(self):
+        return _rational_from_bytes, (self.to_bytes(),)
 
     @property
     def num(self):
@@ -137,55 +319,182 @@ class Rational:
     def den(self):
         return self._den
 
+    @property
+    def numerator(self):
+        return self._num
+
+    @property
+    def denominator(self):
+        return self._den
+
     @property
     def is_negative(self):
-        return self._is_negative
+        return self._num < 0
 
     @property
     def is_integer(self):
-        return self.den == 1 or self.simplify().den == 1
+        return self._den == 1
 
     def simplify(self):
-        if self._simplified:
-            return self
+        return self
 
-        gdc = math.gcd(self.num, self.den)
-        if gdc == 1:
-            return self
+    def round(self, decimals: int = 0, mode: RoundingMode = RoundingMode.HALF_EVEN):
+        shift = 10 ** abs(decimals)
+        if decimals >= 0:
+            return Rational(round_div(self._num * shift, self._den, mode), shift)
+        else:
+            return Rational._from_int(round_div(self._num, self._den * shift, mode) * shift)
 
-        s_num = int(self.num / gdc)
-        s_den = int(self.den / gdc)
+    def limit_denominator(self, max_den: int = 1000000):
+        if max_den < 1:
+            raise ValueError("max_den should be at least 1")
+        if self._den <= max_den:
+            return self
 
-        if s_num == s_den:
-            return Rational.one()
-        elif s_num == -s_den:
-            return Rational.minus_one()
+        p0, q0, p1, q1 = 0, 1, 1, 0
+        n, d = self._num, self._den
+        while True:
+            a = n // d
+            q2 = q0 + a * q1
+            if q2 > max_den:
+                break
+            p0, q0, p1, q1 = p1, q1, p0 + a * p1, q2
+            n, d = d, n - a * d
+
+        k = (max_den - q0) // q1
+        if 2 * d * (q0 + k * q1) <= self._den:
+            return Rational(p1, q1, True)
         else:
-            return Rational(s_num, s_den, True)
+            return Rational(p0 + k * p1, q0 + k * q1, True)
 
     def invert(self):
         return Rational(self.den, self.num)
 
+    def nth_root(self, k: int, decimals: int = 20):
+        if k <= 0:
+            raise ValueError(f"Root degree should be positive: {k}")
+
+        root = self._exact_root(k)
+        if root is not None:
+            return root
+
+        if self._num < 0 and k % 2 == 0:
+            raise ValueError(f"Even root of negative number: {self}")
+
+        scale = _pow10(decimals)
+        q = _iroot(abs(self._num) * scale ** k // self._den, k)
+        return Rational(q if self._num >= 0 else -q, scale)
+
+    def to_bytes(self) -> bytes:
+        buf = bytearray()
+        _write_rational(buf, self._num, self._den)
+        return bytes(buf)
+
+    @staticmethod
+    def from_bytes(data: bytes):
+        r, pos = _read_rational(data, 0)
+        if pos != len(data):
+            raise ValueError(f"Unexpected {len(data) - pos} trailing bytes")
+
+        return r
+
     # Private methods
 
+    def _pow_int(self, power: int):
+        if power >= 0:
+            num = self._num ** power
+            den = self._den ** power
+        elif self._num == 0:
+            raise ZeroDivisionError(f"{self} ** {power}")
+        else:
+            num = self._den ** -power
+            den = self._num ** -power
+            if den < 0:
+                num = -num
+                den = -den
+
+        return Rational._from_int(num) if den == 1 else Rational(num, den, True)
+
+    def _pow_rational(self, p):
+        if self._num != 0 and abs(self._num) != self._den:
+            digits = abs(float(p) * (math.log10(abs(self._num)) - math.log10(self._den)))
+            if digits > _MAX_POW_DIGITS:
+                raise OverflowError(f"Power result has more than {_MAX_POW_DIGITS} digits")
+
+        if p._den == 1:
+            return self._pow_int(p._num)
+        elif self._num < 0 and p._den % 2 == 0:
+            raise ValueError(f"Even root of negative number: {self}")
+
+        root = self._exact_root(p._den)
+        if root is not None:
+            return root._pow_int(p._num)
+
+        size = max(self._num.bit_length(), self._den.bit_length())
+        if abs(p._num) * size + p._den * _ROOT_DECIMALS_BITS <= _MAX_EXACT_POW_BITS:
+            return self._pow_int(p._num).nth_root(p._den)
+
+        return self._pow_approx(p)
+
+    def _pow_approx(self, p, decimals: int = 20):
+        # Exponents like 0.1234567 would need x ** 1234567 first: go through ln/exp in a
+        # Decimal context wide enough for the integer digits plus the requested decimals
+        import decimal
+
+        base = abs(self)
+        digits = float(p) * (math.log10(base._num) - math.log10(base._den))
+        with decimal.localcontext() as ctx:
+            ctx.prec = max(int(digits), 0) + decimals + 20
+            x = decimal.Decimal(base._num) / decimal.Decimal(base._den)
+            y = (x.ln() * decimal.Decimal(p._num) / decimal.Decimal(p._den)).exp()
+            num, den = y.quantize(decimal.Decimal(1).scaleb(-decimals)).as_integer_ratio()
+
+        res = Rational(num, den)
+        return -res if self._num < 0 and p._num % 2 != 0 else res
+
+    def _pow_mod(self, power, modulo) -> 'Rational':
+        if type(power) is not int or type(modulo) is not int:
+            raise TypeError("pow() with modulo requires integer exponent and modulo")
+
+        num = pow(self._num, power, modulo)
+        den = pow(self._den, -power, modulo)
+        return Rational._from_int(num * den % modulo)
+
+    def _exact_root(self, k: int):
+        if self._num < 0:
+            if k % 2 == 0:
+                return None
+
+            root = (-self)._exact_root(k)
+            return -root if root is not None else None
+
+        num = _iroot(self._num, k)
+        if num ** k != self._num:
+            return None
+
+        den = _iroot(self._den, k)
+        if den ** k != self._den:
+            return None
+
+        return Rational(num, den, True)
+
     @staticmethod
     def _from_int(n: int):
-        return Rational(n)
+        if _INTERNED_MIN <= n <= _INTERNED_MAX:
+            return _INTERNED[n - _INTERNED_MIN]
 
-    @staticmethod
-    def _from_float(n: float):
-        return Rational._from_str(str(n))
+        return Rational(n, 1, True)
 
     @staticmethod
-    def _from_str(s: str):
-        negative_sign = get_negative_sign()
-        decimal_separator = get_decimal_separator()
-        thousands_separator = get_thousand_separator()
+    def _from_str(s: str, fmt: NumberFormat):
+        negative_sign = fmt.negative_sign
 
         sign = s.startswith(negative_sign)
 
-        split = s.split(decimal_separator)
-        integer_part = split[0].replace(thousands_separator, '')
+        split = s.split(fmt.decimal_separator)
+        integer_part = split[0].replace(fmt.thousands_separator, '')
+        if sign and negative_sign != '-':
+            integer_part = '-' + integer_part[len(negative_sign):]
         fractional_part = split[1] if len(split) > 1 else ''
 
         r1 = Rational(int(integer_part))
@@ -193,73 +502,230 @@ class Rational:
             if fractional_part != ''\
             else 0
 
-        return (r1 + r2).simplify()
+        return r1 + r2
 
     @staticmethod
-    def _from_rat_rep(m: re.Match):
-        thou_sep = get_thousand_separator()
-        num = m.group('num').replace(' ', '').replace(thou_sep, '')
-        den = m.group('den').replace(' ', '').replace(thou_sep, '')
+    def _from_rat_rep(m: re.Match, fmt: NumberFormat):
+        thou_sep = fmt.thousands_separator
+        neg_sign = fmt.negative_sign
+        num = m.group('num').replace(' ', '').replace(thou_sep, '').replace(neg_sign, '-')
+        den = m.group('den').replace(' ', '').replace(thou_sep, '').replace(neg_sign, '-')
 
         return Rational(int(num), int(den))
 
     @staticmethod
-    def _from_float_rep(fr):
+    def _from_float_rep(fr, fmt: NumberFormat):
         ip = fr.int_part
         dp = fr.decimal_part
         rd = fr.repeated_decimal
-        sign = ip.startswith(get_negative_sign())
+        sign = ip.startswith(fmt.negative_sign)
 
         len_dp = len(dp)
         len_rd = len(rd)
 
-        ip_rat = rat(ip)
-        dec_sep = get_decimal_separator()
-        dp_rat = rat(f"0{dec_sep}{dp}")
-        rd_rat = rat(rd) / (rat(10) ** (len_dp + len_rd) - rat(10) ** len_dp)
+        ip_rat = abs(rat(ip, fmt))
+        dp_rat = rat(f"0{fmt.decimal_separator}{dp}", fmt)
+        rd_rat = rat(rd, fmt) / (rat(10) ** (len_dp + len_rd) - rat(10) ** len_dp)
 
         return (ip_rat + dp_rat + rd_rat) * (-1 if sign else 1)
 
-    @staticmethod
-    def of(obj):
-        if isinstance(obj, Rational):
-            return obj
-        elif isinstance(obj, int):
-            return Rational(obj)
-        elif isinstance(obj, float):
-            return Rational._from_float(obj)
-        elif isinstance(obj, str):
-            m = match_rational_rep_format(obj)
-            if m:
-                return Rational._from_rat_rep(m)
-            else:
-                m = match_float_rep_format(obj)
-                if m:
-                    return Rational._from_float_rep(match_to_float_rep(m))
-                else:
-                    return Rational._from_str(obj)
-        else:
-            raise TypeError
-
     def _cmp(self, other):
-        o = rat(other)
-        res = self.num * o.den - o.num * self.den
-        if res > 0:
-            return 1
-        elif res < 0:
-            return -1
+        diff = self._diff_sign(other)
+        if diff is NotImplemented:
+            raise TypeError(f"Cannot compare Rational with {other.__class__}")
+
+        return diff
+
+    def _diff_sign(self, other):
+        if type(other) is int:
+            lhs = self._num
+            rhs = other * self._den
+        elif isinstance(other, Rational):
+            lhs = self._num * other._den
+            rhs = other._num * self._den
         else:
-            return 0
+            o = _as_comparable(other)
+            if o is None:
+                return NotImplemented
+            elif isinstance(o, float):
+                return NotImplemented if math.isnan(o) else -1 if o > 0 else 1
+
+            lhs = self._num * o._den
+            rhs = o._num * self._den
+
+        return 1 if lhs > rhs else -1 if lhs < rhs else 0
+
+
+# Arithmetic on canonical (num, den) pairs: the gcd's are taken over the smallest
+# possible operands and the results are already reduced.
+
+def _add(na: int, da: int, nb: int, db: int) -> Rational:
+    gcd = math.gcd(da, db)
+    if gcd == 1:
+        return Rational(na * db + da * nb, da * db, True)
+
+    s = da // gcd
+    t = na * (db // gcd) + nb * s
+    gcd2 = math.gcd(t, gcd)
+    if gcd2 == 1:
+        return Rational(t, s * db, True)
+
+    return Rational(t // gcd2, s * (db // gcd2), True)
+
+
+def _mul(na: int, da: int, nb: int, db: int) -> Rational:
+    gcd1 = math.gcd(na, db)
+    if gcd1 > 1:
+        na //= gcd1
+        db //= gcd1
+
+    gcd2 = math.gcd(nb, da)
+    if gcd2 > 1:
+        nb //= gcd2
+        da //= gcd2
+
+    return Rational(na * nb, da * db, True)
+
+
+def _div(na: int, da: int, nb: int, db: int) -> Rational:
+    if nb == 0:
+        raise ZeroDivisionError(f"Rational({na}, {da}) / 0")
+
+    gcd1 = math.gcd(na, nb)
+    if gcd1 > 1:
+        na //= gcd1
+        nb //= gcd1
+
+    gcd2 = math.gcd(db, da)
+    if gcd2 > 1:
+        db //= gcd2
+        da //= gcd2
+
+    num = na * db
+    den = da * nb
+    return Rational(num, den, True) if den > 0 else Rational(-num, -den, True)
+
+
+# Operators take numbers only: strings are parsed by Rational.of/rat, never by + or ==
+def _as_rational(obj) -> Optional[Rational]:
+    if isinstance(obj, Rational):
+        return obj
+    elif isinstance(obj, str):
+        return None
+
+    try:
+        return Rational.of(obj)
+    except (TypeError, ValueError):
+        return None
+
+
+# Comparisons must agree with __hash__ (the one of int, float and Fraction): floats are
+# compared by their exact binary value, not the shortest decimal Rational.of picks.
+# Non-finite floats are returned as they are and never equal.
+def _as_comparable(obj):
+    if isinstance(obj, float):
+        if not math.isfinite(obj):
+            return obj
+
+        num, den = obj.as_integer_ratio()
+        return Rational(num, den, True)
+
+    return _as_rational(obj)
+
+
+# Bounds of the exact (x ** num).nth_root(den) path for Rational and float exponents
+_MAX_EXACT_POW_BITS: Final[int] = 1 << 16
+_ROOT_DECIMALS_BITS: Final[int] = 67
+_MAX_POW_DIGITS: Final[int] = 10 ** 6
+
+_HASH_MODULUS: Final[int] = sys.hash_info.modulus
+_HASH_INF: Final[int] = sys.hash_info.inf
+
+_INTERNED_MIN: Final[int] = -128
+_INTERNED_MAX: Final[int] = 1024
+_INTERNED: Final[tuple] = tuple(Rational(n, 1, True) for n in range(_INTERNED_MIN, _INTERNED_MAX + 1))
+
+_ZERO: Final[Rational] = Rational._from_int(0)
+_ONE: Final[Rational] = Rational._from_int(1)
+_MINUS_ONE: Final[Rational] = Rational._from_int(-1)
+
+
+def _iroot(n: int, k: int) -> int:
+    if n < 2 or k == 1:
+        return n
+    if k >= n.bit_length():
+        return 1
+    if k == 2:
+        return math.isqrt(n)
+
+    x = 1 << -(-n.bit_length() // k)
+    while True:
+        y = ((k - 1) * x + n // x ** (k - 1)) // k
+        if y >= x:
+            return x
+        x = y
+
+
+# Precision policies
+
+class PrecisionPolicy(abc.ABC):
+
+    @abc.abstractmethod
+    def apply(self, value: Rational) -> Rational:
+        pass
+
+
+class ExactPrecision(PrecisionPolicy):
+
+    def __str__(self):
+        return "ExactPrecision"
+
+    def apply(self, value: Rational) -> Rational:
+        return value
+
+
+class MaxDenominatorPrecision(PrecisionPolicy):
+
+    def __init__(self, max_den: int):
+        assert max_den >= 1
+        self._max_den: Final[int] = max_den
+
+    def __str__(self):
+        return f"MaxDenominatorPrecision({self.max_den})"
+
+    @property
+    def max_den(self) -> int:
+        return self._max_den
+
+    def apply(self, value: Rational) -> Rational:
+        return value.limit_denominator(self._max_den)
+
+
+class DecimalPrecision(PrecisionPolicy):
+
+    def __init__(self, decimals: int):
+        self._decimals: Final[int] = decimals
+
+    def __str__(self):
+        return f"DecimalPrecision({self.decimals})"
+
+    @property
+    def decimals(self) -> int:
+        return self._decimals
+
+    def apply(self, value: Rational) -> Rational:
+        return round(value, self._decimals)
 
 
 class FloatRepresentation:
-    def __init__(self, int_part: str, decimal_part: str, repeated_decimal: str):
+    def __init__(self, int_part: str, decimal_part: str, repeated_decimal: str, fmt: NumberFormat = None):
         self._int_part = int_part
         self._decimal_part = decimal_part
         self._repeated_decimal = repeated_decimal
+        self._fmt = fmt
 
     def __str__(self):
-        decimal_separator = get_decimal_separator()
+        decimal_separator = get_number_format(self._fmt).decimal_separator
 
         period_chars = f"({self.repeated_decimal})"\
             if self.repeated_decimal != ''\
@@ -280,42 +746,204 @@ class FloatRepresentation:
         return self._repeated_decimal
 
 
-def rat(obj) -> Rational:
-    return Rational.of(obj)
+def rat(obj, fmt: NumberFormat = None) -> Rational:
+    return Rational.of(obj, fmt)
+
+
+# Shortest decimal conversion of floats: the decimal with the fewest significant digits
+# that rounds back to the same float, i.e. the value repr() prints, found with integer
+# arithmetic only.
+
+_POWERS_OF_10: Final[tuple] = tuple(10 ** i for i in range(40))
 
 
-def __get_float_rep_regex():
-    neg_sign = get_negative_sign()
-    thou_sep = get_thousand_separator()
-    dec_sep = get_decimal_separator()
-    return re.compile(f"^(?P<ip>{neg_sign}?\\s*[\\d{thou_sep}\\s]+)\\s*"
-                      f"{dec_sep}\\s*(?P<dp>\\d+)?\\s*\\(\\s*(?P<rp>[\\d\\s]+)\\s*\\)$")
+def _pow10(exp: int) -> int:
+    return _POWERS_OF_10[exp] if exp < 40 else 10 ** exp
 
 
-__float_rep_regex_lazy = lazy(__get_float_rep_regex)
+def _nearest_quotients(num: int, den: int) -> tuple:
+    q, r = divmod(num, den)
+    if r == 0:
+        return q,
 
+    r2 = 2 * r
+    if r2 < den or (r2 == den and q % 2 == 0):
+        return q, q + 1
 
-def __get_rational_rep_format():
-    neg_sign = get_negative_sign()
-    thou_sep = get_thousand_separator().replace('.', '\\.')
-    div_sep = '/'
-    return re.compile(f"^(?P<num>{neg_sign}?\\s*[\\d{thou_sep}\\s]+)\\s*"
-                      f"{div_sep}\\s*(?P<den>{neg_sign}?\\s*[\\d+{thou_sep}\\s]+)?\\s*$")
+    return q + 1, q
 
 
-__get_rational_rep_format_lazy = lazy(__get_rational_rep_format)
+def _decimal_exponent(num: int, den: int, x: float) -> int:
+    e = math.floor(math.log10(x))
+    if e >= 0:
+        if num < den * _pow10(e):
+            e -= 1
+        elif num >= den * _pow10(e + 1):
+            e += 1
+    else:
+        if num * _pow10(-e) < den:
+            e -= 1
+        elif num * _pow10(-e - 1) >= den:
+            e += 1
+
+    return e
+
+
+def _digits_round_trip(num: int, den: int, x: float, scale: int):
+    if scale >= 0:
+        p = _pow10(scale)
+        for q in _nearest_quotients(num, den * p):
+            try:
+                if float(q * p) == x:
+                    return q * p, 1
+            except OverflowError:
+                pass
+    else:
+        p = _pow10(-scale)
+        for q in _nearest_quotients(num * p, den):
+            if q / p == x:
+                return q, p
+
+    return None
+
+
+def _shortest_decimal_ratio(x: float) -> tuple:
+    num, den = x.as_integer_ratio()
+    if den == 1 and abs(num) <= 2 ** 53:
+        return num, 1
+
+    sign = -1 if num < 0 else 1
+    num = abs(num)
+    x = abs(x)
+    e = _decimal_exponent(num, den, x)
+
+    res = None
+    lo, hi = 1, 17
+    while lo <= hi:
+        digits = (lo + hi) // 2
+        ratio = _digits_round_trip(num, den, x, e - digits + 1)
+        if ratio is not None:
+            res = ratio
+            hi = digits - 1
+        else:
+            lo = digits + 1
+
+    return sign * res[0], res[1]
+
+
+class _ParsingContext:
+    def __init__(self, fmt: NumberFormat):
+        self.fmt: Final[NumberFormat] = fmt
+        self.float_rep_regex: Final[re.Pattern] = self._get_float_rep_regex(fmt)
+        self.rational_rep_regex: Final[re.Pattern] = self._get_rational_rep_regex(fmt)
+        self.decimal_rep_regex: Final[re.Pattern] = self._get_decimal_rep_regex(fmt)
+
+    @staticmethod
+    def _get_float_rep_regex(fmt: NumberFormat):
+        neg_sign = re.escape(fmt.negative_sign)
+        thou_sep = re.escape(fmt.thousands_separator)
+        dec_sep = re.escape(fmt.decimal_separator)
+        return re.compile(f"^(?P<ip>{neg_sign}?\\s*[\\d{thou_sep}\\s]+)\\s*"
+                          f"{dec_sep}\\s*(?P<dp>\\d+)?\\s*\\(\\s*(?P<rp>[\\d\\s]+)\\s*\\)$")
+
+    @staticmethod
+    def _get_rational_rep_regex(fmt: NumberFormat):
+        neg_sign = re.escape(fmt.negative_sign)
+        thou_sep = re.escape(fmt.thousands_separator)
+        div_sep = '/'
+        return re.compile(f"^(?P<num>{neg_sign}?\\s*[\\d{thou_sep}\\s]+)\\s*"
+                          f"{div_sep}\\s*(?P<den>{neg_sign}?\\s*[\\d+{thou_sep}\\s]+)?\\s*$")
+
+    @staticmethod
+    def _get_decimal_rep_regex(fmt: NumberFormat):
+        neg_sign = re.escape(fmt.negative_sign)
+        thou_sep = re.escape(fmt.thousands_separator)
+        dec_sep = re.escape(fmt.decimal_separator)
+        return re.compile(f"^\\s*(?P<neg>{neg_sign})?\\s*(?P<ip>\\d[\\d{thou_sep}]*)"
+                          f"(?:{dec_sep}(?P<dp>\\d*))?\\s*$")
+
+    def parse_rational_rep(self, text: str) -> Optional[Rational]:
+        m = self.rational_rep_regex.match(text)
+        return Rational._from_rat_rep(m, self.fmt) if m else None
+
+    def parse_float_rep(self, text: str) -> Optional[Rational]:
+        m = self.float_rep_regex.match(text)
+        return Rational._from_float_rep(match_to_float_rep(m, self.fmt), self.fmt) if m else None
+
+    def parse_decimal_rep(self, text: str) -> Optional[Rational]:
+        m = self.decimal_rep_regex.match(text)
+        if not m:
+            return None
+
+        thou_sep = self.fmt.thousands_separator
+        ip = m.group('ip')
+        dp = m.group('dp') or ''
+        num = int((ip.replace(thou_sep, '') if thou_sep != '' else ip) + dp)
+        return Rational(-num if m.group('neg') else num, _pow10(len(dp)))
+
+    def detect_parser(self, text: str) -> Optional[Callable[[str], Optional[Rational]]]:
+        for parser in (self.parse_decimal_rep, self.parse_rational_rep, self.parse_float_rep):
+            if _try_parse(parser, text) is not None:
+                return parser
 
+        return None
 
-def match_float_rep_format(text: str) -> re.Match:
-    return __float_rep_regex_lazy.get().match(text)
 
+_parsing_contexts = dict()
 
-def match_rational_rep_format(text: str) -> re.Match:
-    return __get_rational_rep_format_lazy.get().match(text)
 
+def _get_parsing_context(fmt: NumberFormat = None) -> _ParsingContext:
+    fmt = get_number_format(fmt)
+    ctx = _parsing_contexts.get(fmt)
+    if ctx is None:
+        ctx = _parsing_contexts.setdefault(fmt, _ParsingContext(fmt))
 
-def match_to_float_rep(m: re.Match) -> FloatRepresentation:
-    thou_sep = get_thousand_separator()
+    return ctx
+
+
+def rat_parse_many(values: Iterable, fmt: NumberFormat = None) -> list[Try]:
+    ctx = _get_parsing_context(fmt)
+    parser = None
+    res = []
+
+    for it in values:
+        if type(it) is str:
+            if parser is None:
+                parser = ctx.detect_parser(it)
+
+            r = _try_parse(parser, it)
+            if r is not None:
+                res.append(Success(r))
+                continue
+
+        res.append(try_of(lambda: Rational.of(it, ctx.fmt)))
+
+    return res
+
+
+def _try_parse(parser, text: str) -> Optional[Rational]:
+    if parser is None:
+        return None
+
+    # A cell the fast path cannot handle (malformed, zero denominator...) falls back to
+    # Rational.of, which reports it as a Failure for that cell only
+    try:
+        return parser(text)
+    except (ValueError, ArithmeticError):
+        return None
+
+
+def match_float_rep_format(text: str, fmt: NumberFormat = None) -> re.Match:
+    return _get_parsing_context(fmt).float_rep_regex.match(text)
+
+
+def match_rational_rep_format(text: str, fmt: NumberFormat = None) -> re.Match:
+    return _get_parsing_context(fmt).rational_rep_regex.match(text)
+
+
+def match_to_float_rep(m: re.Match, fmt: NumberFormat = None) -> FloatRepresentation:
+    fmt = get_number_format(fmt)
+    thou_sep = fmt.thousands_separator
     ip_str = m.group('ip')
     dp_str = m.group('dp')
     rp_str = m.group('rp')
@@ -323,64 +951,437 @@ def match_to_float_rep(m: re.Match) -> FloatRepresentation:
     dp = dp_str.replace(' ', '') if dp_str is not None else ''
     rp = rp_str.replace(' ', '') if rp_str is not None else ''
 
-    return FloatRepresentation(ip, dp, rp)
+    return FloatRepresentation(ip, dp, rp, fmt)
 
 
-def float_rep(obj, max_decimals: int = 100):
+def float_rep(obj, max_decimals: int = 100, fmt: NumberFormat = None) -> FloatRepresentation:
+    if not isinstance(obj, Rational):
+        if isinstance(obj, str):
+            m = match_float_rep_format(obj, fmt)
+            if m:
+                return match_to_float_rep(m, fmt)
 
-    def _from_rat(_r):
-        def _float_rep(continue_cond):
-            num = abs(_r.num)
-            den = abs(_r.den)
+        obj = rat(obj, fmt)
 
-            int_part = str(num // den)
-            decimal_part = EmptyStream()
-            repeated_part = ''
-            remaining = EmptyStream()
+    den = obj.den
+    int_part, rem = divmod(abs(obj.num), den)
+    digits = []
+    positions = dict()
+    repeated_part = ''
 
-            rem = num % den
-            while rem != 0 and continue_cond(int_part, decimal_part, repeated_part):
-                cur_quot = LinkedList()
-                remaining = remaining.prepend(rem)
-                num = rem * 10
-                while num < den:
-                    num *= 10
-                    cur_quot.append('0')
+    while rem != 0 and len(digits) < max_decimals:
+        positions[rem] = len(digits)
+        digit, rem = divmod(rem * 10, den)
+        digits.append(_DIGITS[digit])
 
-                quot = num // den
-                cur_quot.append(str(quot))
-                rem = num % den
-                decimal_part = decimal_part.prepend(''.join(cur_quot))
+        idx = positions.get(rem)
+        if idx is not None:
+            repeated_part = ''.join(digits[idx:])
+            del digits[idx:]
+            break
 
-                idx = remaining.index_of(rem)
-                if idx >= 0:
-                    repeated_part = ''.join(reversed(decimal_part.take(idx + 1).to_list()))
-                    decimal_part = decimal_part.skip(idx + 1)
-                    decimal_part_head = decimal_part.head_option
-                    if isinstance(decimal_part_head, Some) and decimal_part_head.value.endswith(repeated_part):
-                        d_str = decimal_part_head.value
-                        decimal_part = decimal_part.skip(1).prepend(d_str.value[:len(d_str) - len(repeated_part)])
-                    break
+    sign = get_number_format(fmt).negative_sign if obj.is_negative else ''
 
-            if int_part == '0' and _r.is_negative:
-                int_part = f"-{int_part}"
+    return FloatRepresentation(f"{sign}{int_part}", ''.join(digits), repeated_part, fmt)
 
-            decimal_part_str = ''.join(reversed(decimal_part.to_list()))
 
-            return FloatRepresentation(
-                int_part,
-                decimal_part_str,
-                repeated_part
-            )
+def decimal_digits(obj, max_decimals: Optional[int] = None, fmt: NumberFormat = None) -> Iterator[int]:
+    r = rat(obj, fmt)
+    den = r.den
+    rem = abs(r.num) % den
+    count = 0
+    while rem != 0 and (max_decimals is None or count < max_decimals):
+        digit, rem = divmod(rem * 10, den)
+        count += 1
+        yield digit
 
-        return _float_rep(lambda _ip, _dp, _rp: len(_dp) + len(_rp) <= max_decimals)
 
-    if isinstance(obj, Rational):
-        return _from_rat(obj)
-    else:
-        m = match_float_rep_format(str(obj))
-        if isinstance(obj, str) and m:
-            return match_to_float_rep(m)
+def preperiod_length(obj, fmt: NumberFormat = None) -> int:
+    den = rat(obj, fmt).den
+    twos = _multiplicity(den, 2)
+    fives = _multiplicity(den, 5)
+    return max(twos, fives)
+
+
+def period_length(obj, fmt: NumberFormat = None) -> int:
+    den = rat(obj, fmt).den
+    den //= 2 ** _multiplicity(den, 2)
+    den //= 5 ** _multiplicity(den, 5)
+    if den == 1:
+        return 0
+
+    # The period is the multiplicative order of 10 modulo den: start from Carmichael's
+    # lambda(den) and strip its prime factors. The cost is the one of factoring den.
+    factors = _factorize(den)
+    order = 1
+    primes = set()
+    for p, k in factors.items():
+        order = math.lcm(order, (p - 1) * p ** (k - 1))
+        primes.update(_factorize(p - 1))
+        if k > 1:
+            primes.add(p)
+
+    for p in primes:
+        while order % p == 0 and pow(10, order // p, den) == 1:
+            order //= p
+
+    return order
+
+
+_DIGITS: Final[str] = '0123456789'
+
+
+_SMALL_PRIMES: Final[tuple] = (2, 3, 5, 7, 11, 13, 17, 19, 23, 29, 31, 37, 41, 43, 47)
+
+
+def _factorize(n: int) -> dict:
+    factors = {}
+    for p in _SMALL_PRIMES:
+        if n % p == 0:
+            factors[p] = _multiplicity(n, p)
+            n //= p ** factors[p]
+
+    stack = [n] if n > 1 else []
+    while stack:
+        m = stack.pop()
+        if _is_prime(m):
+            factors[m] = factors.get(m, 0) + 1
         else:
-            r = rat(obj)
-            return _from_rat(r)
+            d = _pollard_rho(m)
+            stack += [d, m // d]
+
+    return factors
+
+
+def _is_prime(n: int) -> bool:
+    # Miller-Rabin with the first prime bases: deterministic below 3.3 * 10 ** 24
+    if n < 2:
+        return False
+    for p in _SMALL_PRIMES:
+        if n % p == 0:
+            return n == p
+
+    d, s = n - 1, 0
+    while d % 2 == 0:
+        d //= 2
+        s += 1
+
+    for a in _SMALL_PRIMES[:13]:
+        x = pow(a, d, n)
+        if x == 1 or x == n - 1:
+            continue
+        for _ in range(s - 1):
+            x = x * x % n
+            if x == n - 1:
+                break
+        else:
+            return False
+
+    return True
+
+
+def _pollard_rho(n: int) -> int:
+    # Brent's variant, for an odd composite n without small factors
+    c = 1
+    while True:
+        y, r, q, d = 2, 1, 1, 1
+        x = ys = y
+        while d == 1:
+            x = y
+            for _ in range(r):
+                y = (y * y + c) % n
+            k = 0
+            while k < r and d == 1:
+                ys = y
+                for _ in range(min(128, r - k)):
+                    y = (y * y + c) % n
+                    q = q * abs(x - y) % n
+                k += 128
+                d = math.gcd(q, n)
+            r *= 2
+
+        if d == n:
+            d = 1
+            while d == 1:
+                ys = (ys * ys + c) % n
+                d = math.gcd(abs(x - ys), n)
+
+        if d != n:
+            return d
+        c += 1
+
+
+def _multiplicity(n: int, p: int) -> int:
+    count = 0
+    while n % p == 0:
+        n //= p
+        count += 1
+
+    return count
+
+
+# Exact decimal formatting: the digits are computed from num / den with integer
+# arithmetic and laid out following the format spec mini-language.
+
+_FORMAT_SPEC_REGEX: Final[re.Pattern] = re.compile(
+    r"^(?:(?P<fill>.)?(?P<align>[<>=^]))?(?P<sign>[-+ ])?(?P<z>z)?(?P<alt>#)?(?P<zero>0)?"
+    r"(?P<width>\d+)?(?P<grouping>[,_])?(?:\.(?P<precision>\d+))?(?P<type>[eEfFgGn%])$",
+    re.DOTALL
+)
+
+
+class _FormatSpec:
+    def __init__(self, m: re.Match):
+        zero = m.group('zero') is not None and m.group('align') is None
+        self.fill: Final[str] = m.group('fill') or ('0' if zero else ' ')
+        self.align: Final[str] = m.group('align') or ('=' if zero else '>')
+        self.sign: Final[str] = m.group('sign') or '-'
+        self.coerce_zero: Final[bool] = m.group('z') is not None
+        self.alternate: Final[bool] = m.group('alt') is not None
+        self.width: Final[int] = int(m.group('width') or 0)
+        self.grouping: Final[str] = m.group('grouping') or ''
+        self.precision: Final[int] = int(m.group('precision') or 6)
+        self.type: Final[str] = m.group('type')
+        self.kind: Final[str] = self.type.lower()
+        self.upper: Final[bool] = self.type.isupper()
+
+    def format(self, r: Rational) -> str:
+        num = abs(r.num)
+        den = r.den
+        kind = self.kind
+
+        if kind == 'f':
+            int_digits, rest = _fixed_digits(num, den, self.precision, self.alternate)
+        elif kind == '%':
+            int_digits, rest = _fixed_digits(num * 100, den, self.precision, self.alternate)
+            rest += '%'
+        elif kind == 'e':
+            int_digits, rest = _exponent_digits(num, den, self.precision, self.alternate)
+        else:
+            int_digits, rest = _general_digits(num, den, self.precision, self.alternate)
+
+        grouping = self.grouping
+        if kind == 'n':
+            fmt = get_number_format()
+            grouping = fmt.thousands_separator
+            if rest.startswith('.'):
+                rest = fmt.decimal_separator + rest[1:]
+        elif self.upper:
+            rest = rest.upper()
+
+        negative = r.is_negative
+        if negative and self.coerce_zero and f"{int_digits}{rest}".strip('0.%') == '':
+            negative = False
+
+        return self._layout(negative, int_digits, rest, grouping)
+
+    def _layout(self, negative: bool, int_digits: str, rest: str, grouping: str) -> str:
+        sign = '-' if negative else ('' if self.sign == '-' else self.sign)
+
+        if self.align == '=' and self.fill == '0' and grouping != '':
+            min_len = self.width - len(sign) - len(rest)
+            grouped = _group(int_digits, grouping)
+            while len(grouped) < min_len:
+                int_digits = '0' + int_digits
+                grouped = _group(int_digits, grouping)
+            return f"{sign}{grouped}{rest}"
+
+        body = f"{_group(int_digits, grouping)}{rest}"
+        pad = self.width - len(sign) - len(body)
+        if pad <= 0:
+            return f"{sign}{body}"
+        elif self.align == '<':
+            return f"{sign}{body}{self.fill * pad}"
+        elif self.align == '>':
+            return f"{self.fill * pad}{sign}{body}"
+        elif self.align == '=':
+            return f"{sign}{self.fill * pad}{body}"
+        else:
+            left = pad // 2
+            return f"{self.fill * left}{sign}{body}{self.fill * (pad - left)}"
+
+
+_format_specs = dict()
+
+
+def _get_format_spec(spec: str) -> Optional[_FormatSpec]:
+    fs = _format_specs.get(spec)
+    if fs is None:
+        m = _FORMAT_SPEC_REGEX.match(spec)
+        if m is None:
+            return None
+        fs = _format_specs.setdefault(spec, _FormatSpec(m))
+
+    return fs
+
+
+def _format(r: Rational, spec: str) -> str:
+    if spec == '':
+        return str(r)
+
+    fs = _get_format_spec(spec)
+    if fs is None:
+        return format(float(r), spec)
+
+    return fs.format(r)
+
+
+def _fixed_digits(num: int, den: int, decimals: int, alternate: bool = False,
+                  mode: RoundingMode = RoundingMode.HALF_EVEN) -> tuple:
+    q = round_div(num * _pow10(decimals), den, mode)
+    if decimals == 0:
+        return str(q), '.' if alternate else ''
+
+    int_part, dec_part = divmod(q, _pow10(decimals))
+    return str(int_part), f".{dec_part:0{decimals}d}"
+
+
+def _scientific(num: int, den: int, digits: int) -> tuple:
+    if num == 0:
+        return 0, 0
+
+    exp = int((num.bit_length() - den.bit_length()) * 0.30102999566398120)
+    while (num * _pow10(-exp) if exp < 0 else num) < (den * _pow10(exp) if exp > 0 else den):
+        exp -= 1
+    while (num * _pow10(-exp - 1) if exp < -1 else num) >= (den * _pow10(exp + 1) if exp > -1 else den):
+        exp += 1
+
+    shift = digits - 1 - exp
+    q = round_div(num * _pow10(shift), den) if shift >= 0 else round_div(num, den * _pow10(-shift))
+    if q == _pow10(digits):
+        q //= 10
+        exp += 1
+
+    return q, exp
+
+
+def _exponent_digits(num: int, den: int, precision: int, alternate: bool) -> tuple:
+    q, exp = _scientific(num, den, precision + 1)
+    digits = str(q).rjust(precision + 1, '0')
+    point = '.' if precision > 0 or alternate else ''
+    return digits[0], f"{point}{digits[1:]}e{'-' if exp < 0 else '+'}{abs(exp):02d}"
+
+
+def _general_digits(num: int, den: int, precision: int, alternate: bool) -> tuple:
+    precision = max(precision, 1)
+    _, exp = _scientific(num, den, precision)
+
+    if -4 <= exp < precision:
+        int_digits, rest = _fixed_digits(num, den, precision - 1 - exp, alternate)
+        if not alternate:
+            rest = rest.rstrip('0').rstrip('.')
+        return int_digits, rest
+
+    int_digits, rest = _exponent_digits(num, den, precision - 1, alternate)
+    if not alternate:
+        mantissa, exponent = rest.split('e')
+        rest = f"{mantissa.rstrip('0').rstrip('.')}e{exponent}"
+    return int_digits, rest
+
+
+def _group(int_digits: str, separator: str) -> str:
+    if separator == '' or len(int_digits) <= 3:
+        return int_digits
+
+    head = len(int_digits) % 3 or 3
+    groups = [int_digits[:head]]
+    groups.extend(int_digits[idx:idx + 3] for idx in range(head, len(int_digits), 3))
+    return separator.join(groups)
+
+
+def format_decimal(obj,
+                   decimals: int = 2,
+                   grouping: bool = False,
+                   sign: bool = False,
+                   mode: RoundingMode = RoundingMode.HALF_EVEN,
+                   fmt: NumberFormat = None) -> str:
+    r = rat(obj, fmt)
+    fmt = get_number_format(fmt)
+    int_digits, rest = _fixed_digits(abs(r.num), r.den, decimals, mode=mode)
+    negative = r.is_negative and f"{int_digits}{rest}".strip('0.') != ''
+
+    if grouping:
+        int_digits = _group(int_digits, fmt.thousands_separator)
+    if rest != '':
+        rest = f"{fmt.decimal_separator}{rest[1:]}"
+
+    sign_str = fmt.negative_sign if negative else ('+' if sign else '')
+    return f"{sign_str}{int_digits}{rest}"
+
+
+def format_many(values: Iterable, format_spec: str) -> list[str]:
+    fs = _get_format_spec(format_spec)
+    if fs is None:
+        return [format(it, format_spec) for it in values]
+
+    return [fs.format(rat(it)) for it in values]
+
+
+# Binary serialization: a Rational is written as the zigzag varint of its numerator
+# followed by the varint of its denominator (LEB128, 7 bits per byte).
+
+def _write_varint(buf: bytearray, n: int):
+    while n > 0x7f:
+        buf.append((n & 0x7f) | 0x80)
+        n >>= 7
+    buf.append(n)
+
+
+def _read_varint(data: bytes, pos: int) -> tuple:
+    res = 0
+    shift = 0
+    try:
+        while True:
+            b = data[pos]
+            pos += 1
+            res |= (b & 0x7f) << shift
+            if b < 0x80:
+                return res, pos
+            shift += 7
+    except IndexError:
+        raise ValueError("Truncated varint") from None
+
+
+def _write_rational(buf: bytearray, num: int, den: int):
+    _write_varint(buf, num << 1 if num >= 0 else (-num << 1) - 1)
+    _write_varint(buf, den)
+
+
+def _read_rational(data: bytes, pos: int) -> tuple:
+    z, pos = _read_varint(data, pos)
+    den, pos = _read_varint(data, pos)
+    num = z >> 1 if z & 1 == 0 else -((z + 1) >> 1)
+    if den == 0:
+        raise ValueError("Zero denominator")
+    elif den == 1:
+        return Rational._from_int(num), pos
+
+    return Rational(num, den), pos
+
+
+def _rational_from_bytes(data: bytes) -> Rational:
+    return Rational.from_bytes(data)
+
+
+def pack_rationals(values: Iterable) -> bytes:
+    values = values if isinstance(values, list) else list(values)
+    buf = bytearray()
+    _write_varint(buf, len(values))
+    for it in values:
+        r = rat(it)
+        _write_rational(buf, r.num, r.den)
+
+    return bytes(buf)
+
+
+def unpack_rationals(data: bytes) -> list[Rational]:
+    count, pos = _read_varint(data, 0)
+    res = []
+    for _ in range(count):
+        r, pos = _read_rational(data, pos)
+        res.append(r)
+
+    if pos != len(data):
+        raise ValueError(f"Unexpected {len(data) - pos} trailing bytes")
+
+    return res
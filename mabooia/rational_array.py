@@ -0,0 +1,356 @@
+import math
+import numbers
+from typing import *
+
+from mabooia import NumberFormat, Rational, rat, rat_parse_many, pack_rationals, unpack_rationals
+
+try:
+    import numpy as np
+except ImportError:
+    np = None
+
+
+_INT64_MAX: Final[int] = 2 ** 63 - 1
+
+
+class RationalArray(Sized, Iterable):
+
+    @staticmethod
+    def of(values: Iterable):
+        if isinstance(values, RationalArray):
+            return values
+
+        nums = []
+        dens = []
+        for it in values:
+            r = rat(it)
+            nums.append(r.num)
+            dens.append(r.den)
+
+        return RationalArray(nums, dens)
+
+    @staticmethod
+    def parse(values: Iterable, fmt: NumberFormat = None):
+        nums = []
+        dens = []
+        for it in rat_parse_many(values, fmt):
+            it.raise_if_failure()
+            nums.append(it.result.num)
+            dens.append(it.result.den)
+
+        return RationalArray._new(_pack(nums), _pack(dens))
+
+    @staticmethod
+    def from_bytes(data: bytes):
+        return RationalArray.of(unpack_rationals(data))
+
+    def __init__(self, nums: Iterable[int], dens: Optional[Iterable[int]] = None):
+        nums = [int(n) for n in nums]
+        dens = [int(d) for d in dens] if dens is not None else [1] * len(nums)
+        _check_lengths(len(nums), len(dens))
+
+        for idx in range(len(dens)):
+            d = dens[idx]
+            if d == 0:
+                raise ZeroDivisionError(f"Zero denominator at index {idx}")
+            elif d < 0:
+                nums[idx] = -nums[idx]
+                dens[idx] = -d
+
+        self._nums = _pack(nums)
+        self._dens = _pack(dens)
+
+    def __len__(self):
+        return len(self._nums)
+
+    def __iter__(self):
+        for n, d in zip(_to_list(self._nums), _to_list(self._dens)):
+            yield Rational(n, d)
+
+    def __getitem__(self, key):
+        if isinstance(key, numbers.Integral):
+            return Rational(int(self._nums[key]), int(self._dens[key]))
+        elif isinstance(key, slice):
+            return RationalArray._new(self._nums[key], self._dens[key])
+
+        raise TypeError
+
+    def __str__(self):
+        items = [
+            str(n) if d == 1 else f"{n}/{d}"
+            for n, d in zip(_to_list(self._nums), _to_list(self._dens))
+        ]
+        return f"RationalArray[{', '.join(items)}]"
+
+    def __neg__(self):
+        return RationalArray._new(_neg(self._nums), self._dens)
+
+    def __abs__(self):
+        return RationalArray._new(_abs(self._nums), self._dens)
+
+    def __add__(self, other):
+        on, od = self._operands(other)
+        return RationalArray._new(
+            _add(_mul(self._nums, od), _mul(on, self._dens)),
+            _mul(self._dens, od)
+        )
+
+    def __radd__(self, other):
+        return self + other
+
+    def __sub__(self, other):
+        on, od = self._operands(other)
+        return RationalArray._new(
+            _sub(_mul(self._nums, od), _mul(on, self._dens)),
+            _mul(self._dens, od)
+        )
+
+    def __rsub__(self, other):
+        return -self + other
+
+    def __mul__(self, other):
+        on, od = self._operands(other)
+        return RationalArray._new(_mul(self._nums, on), _mul(self._dens, od))
+
+    def __rmul__(self, other):
+        return self * other
+
+    def __truediv__(self, other):
+        on, od = self._operands(other)
+        if _any_zero(on):
+            raise ZeroDivisionError
+        nums, dens = _normalize_sign(_mul(self._nums, od), _mul(self._dens, on))
+        return RationalArray._new(nums, dens)
+
+    def __rtruediv__(self, other):
+        if _any_zero(self._nums):
+            raise ZeroDivisionError
+        nums, dens = _normalize_sign(self._dens, self._nums)
+        return RationalArray._new(nums, dens) * other
+
+    def __eq__(self, other):
+        return _compare(*self._cross(other), lambda a, b: a == b)
+
+    def __ne__(self, other):
+        return _compare(*self._cross(other), lambda a, b: a != b)
+
+    def __lt__(self, other):
+        return _compare(*self._cross(other), lambda a, b: a < b)
+
+    def __le__(self, other):
+        return _compare(*self._cross(other), lambda a, b: a <= b)
+
+    def __gt__(self, other):
+        return _compare(*self._cross(other), lambda a, b: a > b)
+
+    def __ge__(self, other):
+        return _compare(*self._cross(other), lambda a, b: a >= b)
+
+    __hash__ = None
+
+    @property
+    def nums(self) -> list:
+        return _to_list(self._nums)
+
+    @property
+    def dens(self) -> list:
+        return _to_list(self._dens)
+
+    @property
+    def is_simplified(self) -> bool:
+        return all(g == 1 for g in _to_list(_gcd(self._nums, self._dens)))
+
+    def simplify(self):
+        g = _gcd(self._nums, self._dens)
+        return RationalArray._new(_shrink(_floordiv(self._nums, g)), _shrink(_floordiv(self._dens, g)))
+
+    def sum(self) -> Rational:
+        if len(self) == 0:
+            return Rational.zero()
+
+        lcm = math.lcm(*set(_to_list(self._dens)))
+        return Rational(_sum(_mul(self._nums, _floordiv(lcm, self._dens))), lcm).simplify()
+
+    def dot(self, other) -> Rational:
+        other = RationalArray.of(other)
+        _check_lengths(len(self), len(other))
+        return (self * other).sum()
+
+    def to_list(self) -> list:
+        return list(self)
+
+    def to_bytes(self) -> bytes:
+        return pack_rationals(self)
+
+    # Private methods
+
+    @staticmethod
+    def _new(nums, dens):
+        res = RationalArray.__new__(RationalArray)
+        res._nums = nums
+        res._dens = dens
+        return res
+
+    def _operands(self, other):
+        if isinstance(other, RationalArray):
+            _check_lengths(len(self), len(other))
+            return other._nums, other._dens
+
+        o = rat(other)
+        return o.num, o.den
+
+    def _cross(self, other):
+        on, od = self._operands(other)
+        return _mul(self._nums, od), _mul(on, self._dens)
+
+
+def _check_lengths(a: int, b: int):
+    if a != b:
+        raise ValueError(f"Length mismatch: {a} and {b}")
+
+
+# Integer vector helpers: NumPy int64 while values fit, NumPy object arrays once they
+# would overflow, and plain Python lists when NumPy is not installed.
+
+def _pack(values: list):
+    if np is None:
+        return values
+    if len(values) == 0 or (-_INT64_MAX <= min(values) and max(values) <= _INT64_MAX):
+        return np.array(values, dtype=np.int64)
+
+    return np.array(values, dtype=object)
+
+
+def _shrink(values):
+    if np is not None and values.dtype == object:
+        return _pack(values.tolist())
+
+    return values
+
+
+def _to_list(values) -> list:
+    return values if isinstance(values, list) else values.tolist()
+
+
+def _bound(values) -> int:
+    if isinstance(values, int):
+        return abs(values)
+    if len(values) == 0:
+        return 0
+    if isinstance(values, list):
+        return max(abs(it) for it in values)
+
+    return int(np.max(np.abs(values)))
+
+
+def _is_int64(values) -> bool:
+    if isinstance(values, int):
+        return abs(values) <= _INT64_MAX
+
+    return values.dtype == np.int64
+
+
+def _as_object(values):
+    if isinstance(values, int) or values.dtype == object:
+        return values
+
+    return values.astype(object)
+
+
+def _zip_with(a, b, f: Callable) -> list:
+    if isinstance(a, int):
+        return [f(a, y) for y in b]
+    elif isinstance(b, int):
+        return [f(x, b) for x in a]
+
+    return [f(x, y) for x, y in zip(a, b)]
+
+
+def _mul(a, b):
+    if np is None:
+        return _zip_with(a, b, lambda x, y: x * y)
+    if _is_int64(a) and _is_int64(b) and _bound(a) * _bound(b) <= _INT64_MAX:
+        return a * b
+
+    return _as_object(a) * _as_object(b)
+
+
+def _add(a, b):
+    if np is None:
+        return _zip_with(a, b, lambda x, y: x + y)
+    if _is_int64(a) and _is_int64(b) and _bound(a) + _bound(b) <= _INT64_MAX:
+        return a + b
+
+    return _as_object(a) + _as_object(b)
+
+
+def _sub(a, b):
+    if np is None:
+        return _zip_with(a, b, lambda x, y: x - y)
+    if _is_int64(a) and _is_int64(b) and _bound(a) + _bound(b) <= _INT64_MAX:
+        return a - b
+
+    return _as_object(a) - _as_object(b)
+
+
+def _floordiv(a, b):
+    if np is None:
+        return _zip_with(a, b, lambda x, y: x // y)
+    if _is_int64(a) and _is_int64(b):
+        return a // b
+
+    return _as_object(a) // _as_object(b)
+
+
+def _neg(values):
+    return [-it for it in values] if isinstance(values, list) else -values
+
+
+def _abs(values):
+    return [abs(it) for it in values] if isinstance(values, list) else np.abs(values)
+
+
+def _gcd(a, b):
+    if np is None:
+        return _zip_with(a, b, math.gcd)
+    if _is_int64(a) and _is_int64(b):
+        return np.gcd(a, b)
+
+    return _object_gcd(_as_object(a), _as_object(b))
+
+
+def _sum(values) -> int:
+    if isinstance(values, list):
+        return sum(values)
+    if values.dtype == np.int64 and _bound(values) * len(values) <= _INT64_MAX:
+        return int(values.sum())
+
+    return sum(values.tolist())
+
+
+def _any_zero(values) -> bool:
+    if isinstance(values, int):
+        return values == 0
+    if isinstance(values, list):
+        return 0 in values
+
+    return bool((values == 0).any())
+
+
+def _normalize_sign(nums, dens):
+    if isinstance(dens, list):
+        signs = [-1 if d < 0 else 1 for d in dens]
+        return _mul(nums, signs), _mul(dens, signs)
+
+    signs = np.where(dens < 0, -1, 1)
+    return _mul(nums, signs), _mul(dens, signs)
+
+
+def _compare(a, b, f: Callable):
+    if isinstance(a, list):
+        return [f(x, y) for x, y in zip(a, b)]
+
+    return np.asarray(f(a, b), dtype=bool)
+
+
+_object_gcd = np.frompyfunc(math.gcd, 2, 1) if np is not None else None
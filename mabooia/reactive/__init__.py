@@ -1 +1,5 @@
-from .observables import *
+from mabooia._lazy import lazy_exports
+
+__getattr__, __dir__, __all__ = lazy_exports(__name__, globals(), {
+    '.observables': ('Observer', 'ObservableBase', 'Observable'),
+})
@@ -1,2 +1,5 @@
+from mabooia._lazy import lazy_exports
 
-from .stats import *
+__getattr__, __dir__, __all__ = lazy_exports(__name__, globals(), {
+    '.stats': ('Countable', 'Stat', 'Count', 'count', 'Sum', 'summation', 'Avg', 'avg', 'AllStat'),
+})
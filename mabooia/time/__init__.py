@@ -1 +1,5 @@
-from .timeline import *
+from mabooia._lazy import lazy_exports
+
+__getattr__, __dir__, __all__ = lazy_exports(__name__, globals(), {
+    '.timeline': ('TimelineEvent', 'TimeCriteria', 'all_events', 'in_date', 'since', 'until', 'in_range', 'Timeline'),
+})
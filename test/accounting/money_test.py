@@ -0,0 +1,63 @@
+import unittest
+
+from mabooia import rat, Rational, RoundingMode
+from mabooia.accounting import Currency, Money
+
+
+class MoneyTest(unittest.TestCase):
+
+    def test_of(self):
+        self.assertEqual(1234, Money.of('12.34', Currency.CAD).units)
+        self.assertEqual(1234, Money.of('12.345', Currency.CAD).units)
+        self.assertEqual(1235, Money.of('12.345', Currency.CAD, RoundingMode.HALF_UP).units)
+        self.assertEqual(-1234, Money.of('-12.349', Currency.CAD, RoundingMode.TRUNCATE).units)
+        self.assertEqual(33, Money.of(Rational(1, 3), Currency.USD).units)
+        self.assertRaises(ValueError, lambda: Money.of(Money.of(1, Currency.USD), Currency.CAD))
+
+    def test_str(self):
+        self.assertEqual("12.34 CAD", str(Money.of('12.34', Currency.CAD)))
+        self.assertEqual("-0.05 USD", str(Money.of('-0.05', Currency.USD)))
+        self.assertEqual("0.00 USD", str(Money.zero(Currency.USD)))
+
+    def test_arithmetic(self):
+        # given
+        a = Money.of('10.10', Currency.CAD)
+        b = Money.of('0.25', Currency.CAD)
+
+        # then
+        self.assertEqual(Money.of('10.35', Currency.CAD), a + b)
+        self.assertEqual(Money.of('9.85', Currency.CAD), a - b)
+        self.assertEqual(Money.of('-10.10', Currency.CAD), -a)
+        self.assertEqual(a, abs(-a))
+        self.assertEqual(Money.of('30.30', Currency.CAD), a * 3)
+        self.assertEqual(Money.of('10.85', Currency.CAD), sum([a, b, b, b]))
+        self.assertTrue(b < a)
+        self.assertFalse(Money.zero(Currency.CAD))
+
+    def test_multiply_rounding(self):
+        # given
+        price = Money.of('0.05', Currency.CAD)
+
+        # then
+        self.assertEqual(2, price.multiply(rat('0.5')).units)
+        self.assertEqual(3, price.multiply(rat('0.5'), RoundingMode.HALF_UP).units)
+        self.assertEqual(2, price.multiply(rat('0.5'), RoundingMode.TRUNCATE).units)
+
+    def test_currency_mismatch(self):
+        self.assertRaises(ValueError, lambda: Money.of(1, Currency.CAD) + Money.of(1, Currency.USD))
+        self.assertRaises(TypeError, lambda: Money.of(1, Currency.CAD) + 1)
+
+    def test_no_drift(self):
+        # given
+        cent = Money.of('0.01', Currency.USD)
+
+        # when
+        total = Money.sum([cent] * 100000, Currency.USD)
+
+        # then
+        self.assertEqual(Money.of(1000, Currency.USD), total)
+        self.assertEqual(rat(1000), total.to_rational())
+
+
+if __name__ == '__main__':
+    unittest.main()
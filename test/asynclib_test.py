@@ -0,0 +1,100 @@
+import asyncio
+import unittest
+
+import mabooia
+from mabooia import Lazy, Some, Nothing
+from mabooia.asynclib import AsyncLazy, async_lazy
+
+
+class AsyncLazyTest(unittest.IsolatedAsyncioTestCase):
+
+    async def test_get(self):
+        # given
+        async def load():
+            await asyncio.sleep(0)
+            return "value"
+
+        lz = async_lazy(load)
+
+        # when
+        value = await lz.get()
+
+        # then
+        self.assertEqual("value", value)
+        self.assertTrue(lz.is_computed())
+        self.assertEqual(Some("value"), lz.get_if_computed())
+
+    async def test_not_computed(self):
+        # given
+        lz = async_lazy(lambda: "value")
+
+        # then
+        self.assertFalse(lz.is_computed())
+        self.assertEqual(Nothing(), lz.get_if_computed())
+
+    async def test_concurrent_awaiters_share_computation(self):
+        # given
+        calls = []
+
+        async def load():
+            calls.append(1)
+            await asyncio.sleep(0.01)
+            return len(calls)
+
+        lz = async_lazy(load)
+
+        # when
+        results = await asyncio.gather(*[lz.get() for _ in range(10)])
+
+        # then
+        self.assertEqual([1] * 10, results)
+        self.assertEqual(1, len(calls))
+
+    async def test_retries_after_failure(self):
+        # given
+        calls = []
+
+        async def load():
+            calls.append(1)
+            await asyncio.sleep(0)
+            if len(calls) == 1:
+                raise ValueError("boom")
+            return "value"
+
+        lz = async_lazy(load)
+
+        # then
+        with self.assertRaises(ValueError):
+            await lz.get()
+        self.assertFalse(lz.is_computed())
+        self.assertEqual("value", await lz.get())
+
+    async def test_cancelled_awaiter_does_not_cancel_computation(self):
+        # given
+        lz = async_lazy(lambda: asyncio.sleep(0.02, "value"))
+        first = asyncio.ensure_future(lz.get())
+        await asyncio.sleep(0)
+
+        # when
+        first.cancel()
+        value = await lz.get()
+
+        # then
+        self.assertEqual("value", value)
+
+    async def test_values(self):
+        self.assertEqual(1, await async_lazy(1).get())
+        self.assertEqual(2, await async_lazy(asyncio.sleep(0, 2)).get())
+        self.assertIsInstance(async_lazy(lambda: 3), AsyncLazy)
+
+    def test_not_a_lazy(self):
+        self.assertNotIsInstance(async_lazy(lambda: "value"), Lazy)
+
+    def test_package_exports(self):
+        self.assertIs(AsyncLazy, mabooia.AsyncLazy)
+        self.assertIs(async_lazy, mabooia.async_lazy)
+        self.assertIn('AsyncLazy', mabooia.__all__)
+
+
+if __name__ == '__main__':
+    unittest.main()
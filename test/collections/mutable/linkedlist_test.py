@@ -209,6 +209,25 @@ class LinkedListTest(unittest.TestCase):
         # then
         self.assertEqual([1, 2, 3, 4, 5], ll.to_list())
 
+    def test_len_tracks_changes(self):
+        # given
+        ll = LinkedList([1, 2, 3, 4, 5])
+
+        # when
+        ll.remove(3)
+        ll.remove(7)
+        ll.remove_first()
+        ll.prepend(0)
+        del ll[-1]
+        ll.append(9)
+        del ll[1:2]
+
+        # then
+        self.assertEqual([0, 4, 9], ll.to_list())
+        self.assertEqual(3, len(ll))
+        self.assertEqual("[0, 4, 9]", str(ll))
+        self.assertEqual(0, len(LinkedList([1]).remove_last().remove_last()))
+
 
 if __name__ == '__main__':
     unittest.main()
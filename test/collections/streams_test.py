@@ -1,8 +1,12 @@
+import itertools
 import math
+import threading
 import unittest
+import weakref
+from unittest import mock
 
 from mabooia import Nothing, Some
-from mabooia.collections import Stream, EmptyStream
+from mabooia.collections import Stream, EmptyStream, GeneratorStream, ConcatStream, LazyTailStream
 
 
 class StreamTest(unittest.TestCase):
@@ -414,6 +418,259 @@ class StreamTest(unittest.TestCase):
             .corresponds([(1, "a"), (2, "b"), (3, "c")])
         )
 
+    def test_from_iter(self):
+        # given
+        pulled = []
+
+        def numbers():
+            for n in itertools.count():
+                pulled.append(n)
+                yield n
+
+        # when
+        stream = Stream.of(numbers())
+
+        # then
+        self.assertIsInstance(stream, GeneratorStream)
+        self.assertEqual([], pulled)
+        self.assertEqual([0, 1, 2], stream.take(3).to_list())
+        pulled_by_take = list(pulled)
+        self.assertEqual([0, 1, 2], stream.take(3).to_list())
+        self.assertEqual(pulled_by_take, pulled)
+        self.assertLessEqual(len(pulled), 4)
+        self.assertEqual([0, 2, 4], stream.map(lambda n: n * 2).take(3).to_list())
+        self.assertEqual([], Stream.from_iter([]).to_list())
+        self.assertEqual([1, 2, 3], Stream.of((1, 2, 3)).to_list())
+
+    def test_from_iter_failing_source(self):
+        # given
+        def numbers():
+            yield 1
+            raise ValueError("broken source")
+
+        stream = Stream.from_iter(numbers())
+
+        # then
+        self.assertRaises(ValueError, stream.to_list)
+        self.assertRaises(ValueError, stream.to_list)
+        self.assertRaises(ValueError, lambda: stream.tail.head_option)
+        self.assertEqual(1, stream.head_option.value)
+
+    def test_from_iter_shared_across_threads(self):
+        # given
+        pulled = []
+
+        def numbers():
+            for n in range(2000):
+                pulled.append(n)
+                yield n
+
+        stream = Stream.from_iter(numbers())
+        results = [None] * 8
+
+        def consume(idx):
+            results[idx] = stream.to_list()
+
+        # when
+        threads = [threading.Thread(target=consume, args=(idx,)) for idx in range(len(results))]
+        for t in threads:
+            t.start()
+        for t in threads:
+            t.join()
+
+        # then
+        self.assertEqual(list(range(2000)), pulled)
+        for res in results:
+            self.assertEqual(list(range(2000)), res)
+
+    def test_pipeline_is_evaluated_once(self):
+        # given
+        calls = []
+
+        def double(n):
+            calls.append(n)
+            return n * 2
+
+        stream = Stream.of(list(range(10))).map(double).filter(lambda n: n % 3 == 0).take(3)
+
+        # when
+        first = next(iter(stream))
+        res = stream.to_list()
+
+        # then
+        self.assertEqual(0, first)
+        self.assertEqual([0, 6, 12], res)
+        self.assertEqual([0, 6, 12], list(stream))
+        self.assertEqual(0, stream.head_option.value)
+        self.assertEqual([6, 12], stream.tail.to_list())
+        self.assertEqual(list(range(7)), calls)
+        self.assertEqual("Stream[0, 6, 12]", str(stream))
+
+    def test_shared_stages_are_evaluated_once(self):
+        # given
+        calls = []
+
+        def double(n):
+            calls.append(n)
+            return n * 2
+
+        doubled = Stream.of([1, 2, 3]).map(double)
+        evens = doubled.filter(lambda n: n % 4 == 0)
+        shifted = doubled.map(lambda n: n + 1)
+
+        # when
+        res = (evens.to_list(), shifted.to_list(), doubled.to_list())
+        halves, negatives = Stream.of([1, 2, 3]).unzip(lambda n: (double(n) / 2, -n))
+        unzipped = (halves.to_list(), negatives.to_list())
+
+        # then
+        self.assertEqual(([4], [3, 5, 7], [2, 4, 6]), res)
+        self.assertEqual(([1, 2, 3], [-1, -2, -3]), unzipped)
+        self.assertEqual([1, 2, 3, 1, 2, 3], calls)
+
+    def test_failing_stage_raises_on_every_traversal(self):
+        # given
+        stream = Stream.of([1, 2, 0, 4]).map(lambda n: 1 / n)
+
+        # then
+        self.assertRaises(ZeroDivisionError, stream.to_list)
+        self.assertRaises(ZeroDivisionError, stream.to_list)
+        self.assertRaises(ZeroDivisionError, lambda: len(stream.filter(lambda _: True)))
+        self.assertEqual([1.0, 0.5], stream.take(2).to_list())
+
+    def test_drained_pipeline_releases_source(self):
+        # given
+        class Item:
+            pass
+
+        item = Item()
+        ref = weakref.ref(item)
+        stream = Stream.from_iter([item]).map(lambda it: 1)
+
+        # when
+        del item
+        res = stream.to_list()
+
+        # then
+        self.assertEqual([1], res)
+        self.assertIsNone(ref())
+
+    def test_pipeline_on_long_stream(self):
+        # given
+        size = 100000
+
+        # when
+        res = Stream.of(list(range(size)))\
+            .map_indexed(lambda n, idx: n + idx)\
+            .skip(10)\
+            .filter(lambda n: n % 4 == 0)\
+            .take_while(lambda n: n < size)\
+            .fold(0, lambda acc, _: acc + 1)
+
+        # then
+        self.assertEqual(size // 4 - 5, res)
+
+    def test_append_many(self):
+        # given
+        size = 20000
+        stream = EmptyStream()
+
+        # when
+        for n in range(size):
+            stream = stream.append(n)
+
+        # then
+        self.assertIsInstance(stream, ConcatStream)
+        self.assertEqual(size, len(stream))
+        self.assertTrue(stream.corresponds(range(size)))
+        self.assertEqual(Some(size - 1), stream.rear_option)
+
+    def test_append_stream_nested(self):
+        # given
+        stream = EmptyStream()
+
+        # when
+        for n in range(1000):
+            stream = Stream.of([n, n]).append_stream(stream.append_stream(EmptyStream()))
+
+        # then
+        self.assertEqual([999, 999, 998, 998, 997], stream.take(5).to_list())
+        self.assertEqual(2000, len(stream))
+
+    def test_flatten_long_streams(self):
+        # given
+        half = 500000
+        streams = Stream.of([Stream.of(list(range(half))), EmptyStream(), Stream.of(list(range(half, 2 * half)))])
+
+        # when
+        res = streams.flatten().fold(0, lambda acc, n: acc + n)
+
+        # then
+        self.assertEqual(half * (2 * half - 1), res)
+
+    def test_known_sizes(self):
+        # given
+        calls = []
+        stream = Stream.of(list(range(100)))
+
+        def square(n):
+            calls.append(n)
+            return n * n
+
+        # then
+        self.assertEqual(100, len(stream))
+        self.assertEqual(30, len(stream.map(square).skip(10).take(30)))
+        self.assertEqual(104, len(stream.append_stream(Stream.of([1, 2, 3])).append(4)))
+        self.assertEqual([], calls)
+        self.assertEqual(50, len(stream.filter(lambda n: n % 2 == 0)))
+
+    def test_to_list_single_pass(self):
+        # given
+        pulled = []
+
+        def numbers():
+            for n in range(5):
+                pulled.append(n)
+                yield n
+
+        # when
+        res = Stream.of(numbers()).to_list()
+
+        # then
+        self.assertEqual([0, 1, 2, 3, 4], res)
+        self.assertEqual([0, 1, 2, 3, 4], pulled)
+        self.assertEqual([0, 1], Stream.of(list(range(5))).to_list(2))
+
+    def test_len_of_long_lazy_stream(self):
+        # given
+        size = 50000
+
+        def numbers(n):
+            return LazyTailStream(n, lambda: numbers(n + 1) if n + 1 < size else EmptyStream())
+
+        # then
+        self.assertEqual(size, len(numbers(0)))
+
+    def test_iteration_allocates_no_options(self):
+        # given
+        size = 100000
+        stream = Stream.of(list(range(size)))
+        lazy_stream = stream.zip(stream).slice(10)
+
+        # when
+        with mock.patch.object(Some, '__init__', autospec=True, side_effect=Some.__init__) as some_init:
+            total = sum(stream)
+            pages = len(lazy_stream.to_list())
+            found = stream.index_of(size - 1)
+            all_positive = stream.all(lambda n: n >= 0)
+
+        # then
+        self.assertEqual(size * (size - 1) // 2, total)
+        self.assertEqual(size // 10, pages)
+        self.assertEqual(size - 1, found)
+        self.assertTrue(all_positive)
+        self.assertEqual(0, some_init.call_count)
+
 
 if __name__ == "__main__":
     unittest.main()
@@ -1,6 +1,73 @@
+import asyncio
+import copy
+import pickle
+import time
 import unittest
+import weakref
+from concurrent.futures import ThreadPoolExecutor
 
-from mabooia import option, Some, Nothing, lazy, try_of, Success, Failure
+from mabooia import option, Some, Nothing, NOTHING, lazy, try_of, Success, Failure, UnsynchronizedLazy, memoize, CacheInfo, \
+    async_try_of, Try, ErrorSummary, Singleton
+
+
+class SingletonTest(unittest.TestCase):
+
+    def test_same_instance(self):
+        # given
+        class Config(Singleton):
+            def init(self, name):
+                self.name = name
+
+        # when
+        a = Config('a')
+        b = Config('b')
+
+        # then
+        self.assertIs(a, b)
+        self.assertEqual('a', b.name)
+
+    def test_init_runs_once_under_contention(self):
+        # given
+        inits = []
+
+        class Slow(Singleton):
+            def init(self):
+                inits.append(1)
+                time.sleep(0.05)
+
+        # when
+        with ThreadPoolExecutor(8) as executor:
+            instances = list(executor.map(lambda _: Slow(), range(8)))
+
+        # then
+        self.assertEqual(1, len(inits))
+        self.assertTrue(all(it is instances[0] for it in instances))
+
+    def test_subclasses_have_own_instance(self):
+        # given
+        class Base(Singleton):
+            pass
+
+        class Derived(Base):
+            pass
+
+        # then
+        self.assertIsNot(Base(), Derived())
+        self.assertIs(Derived, type(Derived()))
+
+    def test_reset_singleton(self):
+        # given
+        class Counter(Singleton):
+            pass
+
+        first = Counter()
+
+        # when
+        Counter.reset_singleton()
+
+        # then
+        self.assertIsNot(first, Counter())
+        self.assertIs(Counter(), Counter())
 
 
 class OptionTest(unittest.TestCase):
@@ -14,6 +81,24 @@ class OptionTest(unittest.TestCase):
     def test_option_of_none_is_nothing(self):
         self.assertIs(option(None), Nothing())
 
+    def test_nothing_is_singleton(self):
+        self.assertIs(NOTHING, Nothing())
+        self.assertIs(NOTHING, copy.deepcopy(Nothing()))
+        self.assertIs(NOTHING, pickle.loads(pickle.dumps(Nothing())))
+
+    def test_options_have_no_dict(self):
+        self.assertFalse(hasattr(Some(1), '__dict__'))
+        self.assertFalse(hasattr(Nothing(), '__dict__'))
+
+    def test_bool(self):
+        self.assertTrue(Some(0))
+        self.assertTrue(Some(None))
+        self.assertFalse(Nothing())
+
+    def test_hash(self):
+        self.assertEqual(hash(Some((1, 2))), hash(Some((1, 2))))
+        self.assertEqual({Some(1), NOTHING}, {Some(1), Some(1), Nothing()})
+
     def test_option_of_something_is_some(self):
         self.assertEqual(option(""), Some(""))
 
@@ -200,6 +285,240 @@ class LazyTest(unittest.TestCase):
         self.assertEqual(lz.get_if_computed(), Some("value"))
         self.assertEqual(lz.get(), "value")
 
+    def test_releases_function(self):
+        for thread_safe in [True, False]:
+            # given
+            payload = set()
+            ref = weakref.ref(payload)
+            lz = lazy(lambda p=payload: len(p), thread_safe)
+            del payload
+
+            # when
+            value = lz.get()
+
+            # then
+            self.assertEqual(0, value)
+            self.assertIsNone(ref())
+
+    def test_computes_once_under_contention(self):
+        # given
+        calls = []
+
+        def compute():
+            calls.append(1)
+            time.sleep(0.05)
+            return "value"
+
+        lz = lazy(compute)
+
+        # when
+        with ThreadPoolExecutor(8) as executor:
+            results = list(executor.map(lambda _: lz.get(), range(8)))
+
+        # then
+        self.assertEqual(1, len(calls))
+        self.assertEqual(["value"] * 8, results)
+
+    def test_retries_after_failure(self):
+        # given
+        attempts = []
+
+        def compute():
+            attempts.append(1)
+            if len(attempts) == 1:
+                raise ValueError("boom")
+            return "value"
+
+        lz = lazy(compute)
+
+        # then
+        self.assertRaises(ValueError, lz.get)
+        self.assertFalse(lz.is_computed())
+        self.assertEqual("value", lz.get())
+        self.assertEqual(2, len(attempts))
+
+    def test_recursive_evaluation(self):
+        # given
+        lz = None
+        lz = lazy(lambda: lz.get())
+
+        # then
+        self.assertRaises(RuntimeError, lz.get)
+
+    def test_unsynchronized_lazy(self):
+        # given
+        lz = lazy(self._slow_function, thread_safe=False)
+
+        # when
+        value = lz.get()
+
+        # then
+        self.assertIsInstance(lz, UnsynchronizedLazy)
+        self.assertTrue(lz.is_computed())
+        self.assertEqual("value", value)
+        self.assertEqual(Some("value"), lz.get_if_computed())
+
+
+class MemoizeTest(unittest.TestCase):
+
+    def test_memoize(self):
+        # given
+        calls = []
+
+        @memoize
+        def square(x):
+            calls.append(x)
+            return x * x
+
+        # when
+        res = [square(2), square(3), square(2), square(x=2)]
+
+        # then
+        self.assertEqual([4, 9, 4, 4], res)
+        self.assertEqual([2, 3, 2], calls)
+        self.assertEqual(CacheInfo(1, 3, 0, 3, 128), square.cache_info())
+        self.assertEqual('square', square.__name__)
+
+    def test_lru_eviction(self):
+        # given
+        calls = []
+
+        @memoize(maxsize=2)
+        def identity(x):
+            calls.append(x)
+            return x
+
+        # when
+        for x in [1, 2, 1, 3, 1, 2]:
+            identity(x)
+
+        # then
+        self.assertEqual([1, 2, 3, 2], calls)
+        self.assertEqual(CacheInfo(2, 4, 2, 2, 2), identity.cache_info())
+
+    def test_ttl(self):
+        # given
+        now = [0.0]
+        calls = []
+
+        @memoize(ttl=10, timer=lambda: now[0])
+        def identity(x):
+            calls.append(x)
+            return x
+
+        # when
+        identity(1)
+        now[0] = 5.0
+        identity(1)
+        now[0] = 10.0
+        identity(1)
+
+        # then
+        self.assertEqual([1, 1], calls)
+        self.assertEqual(CacheInfo(1, 2, 1, 1, 128), identity.cache_info())
+
+    def test_unbounded_ttl_sweeps_expired_entries(self):
+        # given
+        now = [0.0]
+
+        @memoize(maxsize=None, ttl=10, timer=lambda: now[0])
+        def identity(x):
+            return x
+
+        # when
+        for i in range(1000):
+            now[0] = float(i)
+            identity(i)
+
+        # then
+        info = identity.cache_info()
+        self.assertLessEqual(info.size, 128)
+        self.assertEqual(1000, info.misses)
+        self.assertEqual(1000 - info.size, info.evictions)
+        self.assertEqual(999, identity(999))
+        self.assertEqual(1, identity.cache_info().hits)
+
+    def test_key(self):
+        # given
+        @memoize(key=lambda text: text.lower())
+        def upper(text):
+            return text.upper()
+
+        # when
+        upper('abc')
+        upper('ABC')
+
+        # then
+        self.assertEqual(1, upper.cache_info().hits)
+
+    def test_failures_are_not_cached(self):
+        # given
+        attempts = []
+
+        @memoize
+        def fail_once(x):
+            attempts.append(x)
+            if len(attempts) == 1:
+                raise ValueError("boom")
+            return x
+
+        # then
+        self.assertRaises(ValueError, lambda: fail_once(1))
+        self.assertEqual(1, fail_once(1))
+        self.assertEqual(2, len(attempts))
+
+    def test_computes_once_under_contention(self):
+        # given
+        calls = []
+
+        @memoize
+        def slow(x):
+            calls.append(x)
+            time.sleep(0.05)
+            return x
+
+        # when
+        with ThreadPoolExecutor(8) as executor:
+            results = list(executor.map(lambda _: slow(1), range(8)))
+
+        # then
+        self.assertEqual([1], calls)
+        self.assertEqual([1] * 8, results)
+
+    def test_method(self):
+        # given
+        class Counter:
+            def __init__(self):
+                self.calls = 0
+
+            @memoize
+            def double(self, x):
+                self.calls += 1
+                return 2 * x
+
+        counter = Counter()
+
+        # when
+        res = [counter.double(2), counter.double(2)]
+
+        # then
+        self.assertEqual([4, 4], res)
+        self.assertEqual(1, counter.calls)
+
+    def test_cache_clear(self):
+        # given
+        @memoize
+        def identity(x):
+            return x
+
+        identity(1)
+
+        # when
+        identity.cache_clear()
+
+        # then
+        self.assertEqual(CacheInfo(0, 0, 0, 0, 128), identity.cache_info())
+
 
 class TryTest(unittest.TestCase):
 
@@ -303,5 +622,121 @@ class TryTest(unittest.TestCase):
         self.assertEqual(res, Failure(err))
 
 
+class _Row:
+    def parse(self):
+        raise ValueError(f"bad row {id(self)}")
+
+
+class LightFailureTest(unittest.TestCase):
+
+    def test_light_failure_releases_frames(self):
+        # given
+        row = _Row()
+        ref = weakref.ref(row)
+
+        # when
+        res = try_of(row.parse, light=True)
+        del row
+
+        # then
+        self.assertTrue(res.is_failure())
+        self.assertIsNone(ref())
+        self.assertIsInstance(res.err, ErrorSummary)
+        self.assertIs(ValueError, res.err.error_type)
+        self.assertIn("in parse", res.err.origin)
+        self.assertIsNone(res.err.__traceback__)
+
+    def test_light(self):
+        # given
+        failure = try_of(lambda: int("x"))
+
+        # when
+        light = failure.light()
+
+        # then
+        self.assertEqual("ValueError: invalid literal for int() with base 10: 'x'", str(light.err))
+        self.assertIs(light, light.light())
+        self.assertRaises(ErrorSummary, light.raise_if_failure)
+
+    def test_if_failure_with_summary(self):
+        # given
+        failure = try_of(lambda: int("x"), light=True)
+
+        # then
+        self.assertEqual(Success(0), failure.if_failure_with(ValueError, lambda _: 0))
+        self.assertIs(failure, failure.if_failure_with(KeyError, lambda _: 0))
+
+    def test_sequence(self):
+        # given
+        calls = []
+
+        def thunk(v):
+            def f():
+                calls.append(v)
+                return 10 // v
+
+            return f
+
+        # then
+        self.assertEqual(Success([10, 5]), Try.sequence([thunk(1), thunk(2)]))
+        self.assertTrue(Try.sequence([thunk(1), thunk(0), thunk(2)]).is_failure())
+        self.assertEqual([1, 2, 1, 0], calls)
+        self.assertEqual(Success([1, 2]), Try.sequence([Success(1), Success(2)]))
+
+    def test_partition(self):
+        # given
+        values = ['1', 'x', '3', '', '5', 'y']
+
+        # when
+        results, report = Try.partition([lambda v=v: int(v) for v in values], max_samples=2)
+
+        # then
+        self.assertEqual([1, 3, 5], results)
+        self.assertEqual(3, report.count)
+        self.assertEqual({'ValueError': 3}, report.counts_by_type)
+        self.assertEqual([1, 3], [idx for idx, _ in report.samples])
+        self.assertTrue(all(isinstance(err, ErrorSummary) for _, err in report.samples))
+
+
+class AsyncTryTest(unittest.IsolatedAsyncioTestCase):
+
+    @staticmethod
+    async def _value(value):
+        await asyncio.sleep(0)
+        return value
+
+    @staticmethod
+    async def _fail(msg):
+        await asyncio.sleep(0)
+        raise ValueError(msg)
+
+    async def test_async_try_of(self):
+        self.assertEqual(Success(1), await async_try_of(self._value(1)))
+        self.assertEqual(Success(2), await async_try_of(lambda: self._value(2)))
+        self.assertEqual(Success(3), await async_try_of(lambda: 3))
+        self.assertTrue((await async_try_of(self._fail("boom"))).is_failure())
+
+    async def test_if_success_async(self):
+        # when
+        res = await Success(1).if_success_async(lambda v: self._value(v + 1))
+        failed = await Success(1).if_success_async(lambda v: self._fail("boom"))
+
+        # then
+        self.assertEqual(Success(2), res)
+        self.assertTrue(failed.is_failure())
+
+    async def test_if_failure_async(self):
+        # given
+        err = ValueError("boom")
+
+        # when
+        res = await Failure(err).if_failure_async(lambda e: self._value(str(e)))
+        skipped = await Success(1).if_failure_async(lambda e: self._value(2))
+
+        # then
+        self.assertEqual(Success("boom"), res)
+        self.assertEqual(Success(1), skipped)
+
+
 if __name__ == '__main__':
     unittest.main()
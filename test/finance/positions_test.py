@@ -0,0 +1,49 @@
+import unittest
+from datetime import date
+
+from mabooia import rat, Rational, MaxDenominatorPrecision
+from mabooia.accounting import Currency
+from mabooia.finance import Position, Stock, Trade
+
+
+class PositionTest(unittest.TestCase):
+
+    stock = Stock('XYZ', Currency.CAD)
+    day = date(2020, 1, 2)
+
+    def _trade(self, quantity, price, fee='0'):
+        return Trade('acc', self.day, self.day, self.stock, rat(quantity), rat(price), rat(fee))
+
+    def test_buy_and_sell(self):
+        # given
+        pos = Position('acc', self.stock)
+
+        # when
+        pos.add_event(self._trade('10', '2.5', '1'))
+        pos.add_event(self._trade('-4', '3'))
+
+        # then
+        self.assertEqual(rat(6), pos.quantity)
+        self.assertEqual(Rational(13, 5), pos.avg_cost)
+        self.assertEqual(Rational(78, 5), pos.book_value)
+        self.assertEqual(Rational(8, 5), pos.realized_pl)
+
+    def test_bounded_precision(self):
+        # given
+        exact = Position('acc', self.stock)
+        bounded = Position('acc', self.stock, MaxDenominatorPrecision(10 ** 6))
+
+        # when
+        for idx in range(50):
+            trade = self._trade(f"0.{idx + 1:04d}", Rational(1234 + idx, 7 + idx))
+            exact.add_event(trade)
+            bounded.add_event(trade)
+
+        # then
+        self.assertLessEqual(bounded.avg_cost.den, 10 ** 6)
+        self.assertGreater(exact.avg_cost.den, 10 ** 6)
+        self.assertAlmostEqual(float(exact.avg_cost), float(bounded.avg_cost), places=9)
+
+
+if __name__ == '__main__':
+    unittest.main()
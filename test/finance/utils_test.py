@@ -0,0 +1,40 @@
+import unittest
+from datetime import date
+
+from mabooia import Rational
+from mabooia.accounting import Currency
+from mabooia.finance import from_tmpl, get_option_dict, CallOption, Stock
+
+
+class UtilsTest(unittest.TestCase):
+
+    def test_get_option_dict(self):
+        # given
+        pattern = from_tmpl('^:stock::day::month::year::opt_type::price:')
+
+        # when
+        d1 = get_option_dict(pattern, 'XYZ15Jan21C12.50')
+        d2 = get_option_dict(pattern, 'XYZ15Jan21C12.50')
+
+        # then
+        self.assertEqual({
+            'stock_symbol': 'XYZ',
+            'exp_date': date(2021, 1, 15),
+            'strike_price': Rational(25, 2),
+            'type': 'CALL',
+        }, d1)
+        self.assertEqual(d1, d2)
+        self.assertIsNot(d1, d2)
+        self.assertIsNone(get_option_dict(pattern, 'not an option'))
+
+    def test_option_symbol(self):
+        # given
+        option = CallOption(Stock('XYZ', Currency.USD), date(2021, 1, 15), Rational(25, 2))
+
+        # then
+        self.assertEqual('XYZ2021Jan15@12.5CALL', option.symbol)
+        self.assertEqual('XYZ2021Jan15@12.5CALL', str(option))
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,60 @@
+import os
+import subprocess
+import sys
+import unittest
+
+import mabooia
+
+_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+
+def _loaded_modules(code: str) -> set:
+    env = dict(os.environ)
+    env['PYTHONPATH'] = os.pathsep.join(filter(None, [_ROOT, env.get('PYTHONPATH')]))
+    proc = subprocess.run(
+        [sys.executable, "-c", f"{code}\nimport sys\nprint('\\n'.join(sys.modules))"],
+        env=env, capture_output=True, text=True, check=True
+    )
+    return set(proc.stdout.splitlines())
+
+
+class LazyImportTest(unittest.TestCase):
+
+    def test_import_mabooia(self):
+        # when
+        modules = _loaded_modules("import mabooia")
+
+        # then
+        self.assertEqual({'mabooia', 'mabooia._lazy'}, {it for it in modules if it.startswith('mabooia')})
+        self.assertNotIn('typing', modules)
+
+    def test_applib_only(self):
+        # when
+        modules = _loaded_modules("from mabooia import get_args_obj")
+
+        # then
+        self.assertIn('mabooia.applib', modules)
+        self.assertNotIn('mabooia.core', modules)
+        self.assertNotIn('mabooia.rational', modules)
+        self.assertNotIn('mabooia.collections', modules)
+
+    def test_subpackage_only_loads_what_it_uses(self):
+        # when
+        modules = _loaded_modules("from mabooia.finance import Stock")
+
+        # then
+        self.assertIn('mabooia.finance.definitions', modules)
+        self.assertNotIn('mabooia.finance.accounts', modules)
+        self.assertNotIn('mabooia.time', modules)
+        self.assertNotIn('mabooia.crypto', modules)
+
+    def test_exports(self):
+        # then
+        for name in mabooia.__all__:
+            self.assertIsNotNone(getattr(mabooia, name))
+        self.assertIn('Rational', dir(mabooia))
+        self.assertRaises(AttributeError, lambda: mabooia.not_a_name)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,159 @@
+import unittest
+
+try:
+    import numpy
+except ImportError:
+    numpy = None
+
+from mabooia import rat, Rational, RationalArray
+
+
+class RationalArrayTest(unittest.TestCase):
+
+    def test_of(self):
+        # given
+        values = [Rational(1, 3), 2, '0.25', Rational(-5, 7)]
+
+        # when
+        arr = RationalArray.of(values)
+
+        # then
+        self.assertEqual(4, len(arr))
+        self.assertEqual([Rational(1, 3), Rational(2), Rational(1, 4), Rational(-5, 7)], arr.to_list())
+
+    def test_parse(self):
+        # when
+        arr = RationalArray.parse(['1,000.25', '-0.5', '1/3'])
+
+        # then
+        self.assertEqual([Rational(4001, 4), Rational(-1, 2), Rational(1, 3)], arr.to_list())
+        self.assertRaises(ValueError, lambda: RationalArray.parse(['1.5', 'n/a']))
+
+    def test_bytes_round_trip(self):
+        # given
+        arr = RationalArray.of([Rational(10 ** 30 + 1, 7), Rational(-3, 4), 0])
+
+        # when
+        res = RationalArray.from_bytes(arr.to_bytes())
+
+        # then
+        self.assertEqual(arr.to_list(), res.to_list())
+
+    def test_negative_denominators(self):
+        # given
+        arr = RationalArray([1, -2], [-3, -5])
+
+        # then
+        self.assertEqual([-1, 2], arr.nums)
+        self.assertEqual([3, 5], arr.dens)
+
+    def test_zero_denominator(self):
+        self.assertRaises(ZeroDivisionError, lambda: RationalArray([1, 2], [1, 0]))
+
+    def test_length_mismatch(self):
+        # given
+        a = RationalArray([1, 2, 3])
+
+        # then
+        self.assertRaises(ValueError, lambda: RationalArray([1, 2], [1]))
+        self.assertRaises(ValueError, lambda: a + RationalArray([1, 2]))
+        self.assertRaises(ValueError, lambda: a.dot([1, 2]))
+
+    def test_getitem(self):
+        # given
+        arr = RationalArray.of(['1/3', 2, '-0.25'])
+
+        # then
+        self.assertEqual(Rational(2), arr[1])
+        self.assertEqual(Rational(-1, 4), arr[-1])
+        self.assertEqual([Rational(1, 3), Rational(2)], arr[:2].to_list())
+        self.assertRaises(TypeError, lambda: arr['1'])
+
+    @unittest.skipIf(numpy is None, "NumPy is not installed")
+    def test_getitem_numpy_integer(self):
+        # given
+        arr = RationalArray.of(['1/3', 2, '-0.25'])
+
+        # then
+        self.assertEqual(Rational(-1, 4), arr[numpy.int64(2)])
+
+    def test_arithmetic_operations(self):
+        # given
+        a = RationalArray.of(['1/3', '0.5', -2])
+        b = RationalArray.of(['1/6', '0.25', 3])
+
+        # then
+        self.assertEqual([rat('1/2'), rat('0.75'), rat(1)], (a + b).to_list())
+        self.assertEqual([rat('1/6'), rat('0.25'), rat(-5)], (a - b).to_list())
+        self.assertEqual([rat('1/18'), rat('0.125'), rat(-6)], (a * b).to_list())
+        self.assertEqual([rat(2), rat(2), rat('-2/3')], (a / b).to_list())
+        self.assertEqual([rat('-1/3'), rat('-0.5'), rat(2)], (-a).to_list())
+
+    def test_scalar_operations(self):
+        # given
+        a = RationalArray.of(['1/3', '0.5', -2])
+
+        # then
+        self.assertEqual([rat('4/3'), rat('1.5'), rat(-1)], (a + 1).to_list())
+        self.assertEqual([rat('2/3'), rat('0.5'), rat(3)], (1 - a).to_list())
+        self.assertEqual([rat('1/6'), rat('0.25'), rat(-1)], (a * Rational(1, 2)).to_list())
+        self.assertEqual([rat(3), rat(2), rat('-0.5')], (1 / a).to_list())
+        self.assertRaises(ZeroDivisionError, lambda: a / 0)
+
+    def test_comparison_masks(self):
+        # given
+        a = RationalArray.of(['1/3', '0.5', -2])
+        b = RationalArray.of(['0.(3)', '0.25', 3])
+
+        # then
+        self.assertEqual([True, False, False], list(a == b))
+        self.assertEqual([False, True, False], list(a > b))
+        self.assertEqual([True, False, True], list(a <= b))
+        self.assertEqual([False, True, False], list(a > Rational(1, 3)))
+
+    def test_sum_and_dot(self):
+        # given
+        a = RationalArray.of(['1/3', '0.5', -2])
+        b = RationalArray.of([3, 2, '0.5'])
+
+        # then
+        self.assertEqual(Rational(-7, 6), a.sum())
+        self.assertEqual(Rational(1), a.dot(b))
+        self.assertEqual(Rational(0), RationalArray([]).sum())
+
+    def test_simplify(self):
+        # given
+        a = RationalArray([2, -6, 5], [8, 9, 1])
+
+        # when
+        s = a.simplify()
+
+        # then
+        self.assertFalse(a.is_simplified)
+        self.assertTrue(s.is_simplified)
+        self.assertEqual([1, -2, 5], s.nums)
+        self.assertEqual([4, 3, 1], s.dens)
+
+    def test_overflow_fallback(self):
+        # given
+        big = 2 ** 62 + 1
+        a = RationalArray([big, 1], [3, 2 ** 61])
+
+        # when
+        res = (a * a + a).simplify()
+
+        # then
+        self.assertEqual([Rational(big, 3) ** 2 + Rational(big, 3),
+                          Rational(1, 2 ** 122) + Rational(1, 2 ** 61)], res.to_list())
+        self.assertEqual(sum(a.to_list(), Rational(0)), a.sum())
+
+    def test_lossless_round_trip(self):
+        # given
+        values = [Rational(10 ** 30 + 1, 7), Rational(-3, 2 ** 70), Rational(0)]
+
+        # then
+        self.assertEqual(values, RationalArray.of(values).to_list())
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -1,6 +1,12 @@
+import pickle
 import unittest
+from fractions import Fraction
+from unittest import mock
 
-from mabooia import rat, Rational
+from mabooia import rat, Rational, NumberFormat, get_number_format, float_rep, decimal_digits, \
+    period_length, preperiod_length, rat_parse_many, format_decimal, format_many, pack_rationals, \
+    unpack_rationals, \
+    ExactPrecision, MaxDenominatorPrecision, DecimalPrecision, RoundingMode, round_div
 
 
 class RationalTest(unittest.TestCase):
@@ -10,8 +16,8 @@ class RationalTest(unittest.TestCase):
         r1 = Rational(2, 8)
 
         # then
-        self.assertEqual(2, r1.num)
-        self.assertEqual(8, r1.den)
+        self.assertEqual(1, r1.num)
+        self.assertEqual(4, r1.den)
         self.assertFalse(r1.is_integer)
         self.assertFalse(r1.is_negative)
         self.assertEqual(0.25, r1)
@@ -20,6 +26,57 @@ class RationalTest(unittest.TestCase):
         self.assertEqual(4, r1.simplify().den)
         self.assertEqual(Rational(1, 4), r1)
 
+    def test_rat_is_canonical(self):
+        self.assertEqual((-1, 4), (Rational(2, -8).num, Rational(2, -8).den))
+        self.assertEqual((0, 1), (Rational(0, -5).num, Rational(0, -5).den))
+        self.assertRaises(ZeroDivisionError, lambda: Rational(1, 0))
+
+    def test_hash(self):
+        self.assertEqual(hash(5), hash(rat(5)))
+        self.assertEqual(hash(Fraction(1, 3)), hash(Rational(1, 3)))
+        self.assertEqual(hash(Fraction(-7, 12)), hash(Rational(14, -24)))
+        self.assertEqual(hash(0.25), hash(Rational(1, 4)))
+        self.assertEqual({rat('0.(3)'), rat('1/3'), rat(1)}, {Rational(1, 3), Rational(1)})
+        self.assertEqual(2, {rat('0.5'): 1, Rational(1, 2): 2}[0.5])
+
+    def test_eq_agrees_with_hash(self):
+        # given
+        values = [0.1, 0.5, -2.0, 1e300, "1", "0.1", Fraction(1, 10)]
+
+        # then
+        for value in values:
+            for r in (rat(0.1), Rational(1, 2), rat(-2), Rational(1, 10), rat(1)):
+                if r == value:
+                    self.assertEqual(hash(value), hash(r), f"{r} == {value!r}")
+        self.assertNotEqual(Rational(1, 10), 0.1)
+        self.assertEqual(Rational(*(0.1).as_integer_ratio()), 0.1)
+        self.assertNotEqual(Rational(1), "1")
+        self.assertIsNone({Rational(1, 10): 'x'}.get(0.1))
+        self.assertLess(Rational(1, 10), 0.1)
+        self.assertLess(Rational(10 ** 400), float('inf'))
+        self.assertNotEqual(Rational(0), float('nan'))
+
+    def test_operators_reject_strings(self):
+        self.assertRaises(TypeError, lambda: Rational(1) + '1')
+        self.assertRaises(TypeError, lambda: '1' - Rational(1))
+        self.assertRaises(TypeError, lambda: Rational(2) * '3')
+        self.assertRaises(TypeError, lambda: Rational(2) ** '1/2')
+        self.assertRaises(TypeError, lambda: Rational(1) < '2')
+        self.assertEqual(Rational(2), Rational(1) + rat('1'))
+
+    def test_interned_values(self):
+        self.assertIs(Rational.one(), rat(1))
+        self.assertIs(Rational.zero(), rat(0))
+        self.assertIs(Rational.minus_one(), rat(-1))
+        self.assertIs(rat(100), rat(100))
+        self.assertEqual(Rational(10 ** 6), rat(10 ** 6))
+
+    def test_slots(self):
+        self.assertFalse(hasattr(Rational(1, 3), '__dict__'))
+
+    def test_rat_from_fraction(self):
+        self.assertEqual(Rational(-3, 4), rat(Fraction(-6, 8)))
+
     def test_rat_from_int(self):
         # given
         r1 = rat(100)
@@ -52,6 +109,37 @@ class RationalTest(unittest.TestCase):
         self.assertFalse(r2.is_integer)
         self.assertTrue(r2.is_negative)
 
+    def test_rat_from_float_in_exponent_notation(self):
+        self.assertEqual(Rational(1, 10000000), rat(1e-07))
+        self.assertEqual(Rational(10 ** 23), rat(1e23))
+        self.assertEqual(Rational(-25, 10 ** 20), rat(-2.5e-19))
+
+    def test_rat_from_float_matches_shortest_repr(self):
+        values = [0.1, 0.3, 2.675, 1 / 3, 123456.789, 2.0 ** 60, 2.0 ** -1017, 5e-324, 1.7976931348623157e308]
+        for value in values:
+            r = rat(value)
+            self.assertEqual(Fraction(repr(value)), Fraction(r.num, r.den))
+
+    def test_rat_from_float_exact(self):
+        # given
+        r = Rational.from_float(0.1, exact=True)
+
+        # then
+        self.assertEqual(3602879701896397, r.num)
+        self.assertEqual(36028797018963968, r.den)
+        self.assertEqual(0.1, float(r))
+
+    def test_rat_from_float_does_not_use_locale(self):
+        with mock.patch('mabooia.rational.get_number_format') as get_number_format:
+            self.assertEqual(Rational(1234, 100), rat(12.34))
+            Rational.from_float(12.34, exact=True)
+
+        get_number_format.assert_not_called()
+
+    def test_rat_from_non_finite_float(self):
+        self.assertRaises(ValueError, lambda: rat(float('nan')))
+        self.assertRaises(ValueError, lambda: rat(float('inf')))
+
     def test_rat_from_str(self):
         self.assertEqual(Rational(3, 10), rat('0.3'))
         self.assertEqual(Rational(1, 3), rat('0.(3)'))
@@ -59,6 +147,215 @@ class RationalTest(unittest.TestCase):
         self.assertEqual(Rational(-1, 333), rat('- 1 / 333'))
         self.assertEqual(Rational(1222, 3333), rat('- 1, 222 / -3,333'))
 
+    def test_rat_from_str_with_number_format(self):
+        # given
+        fmt = NumberFormat(',', '.', '-')
+
+        # then
+        self.assertEqual(Rational(2469, 2), rat('1.234,5', fmt))
+        self.assertEqual(Rational(-1, 3), rat('-0,(3)', fmt))
+        self.assertEqual(Rational(1222, 3), rat('1.222 / 3', fmt))
+        self.assertEqual('0,(3)', str(float_rep(Rational(1, 3), fmt=fmt)))
+
+    def test_float_rep(self):
+        self.assertEqual('0.(3)', str(float_rep(Rational(1, 3))))
+        self.assertEqual('0.(0099)', str(float_rep(Rational(1, 101))))
+        self.assertEqual('0.00446(428571)', str(float_rep(Rational(1, 224))))
+        self.assertEqual('-3.(142857)', str(float_rep(Rational(-22, 7))))
+        self.assertEqual('-2.5', str(float_rep(Rational(-5, 2))))
+        self.assertEqual('0.00100', str(float_rep(Rational(1, 997), 5)))
+        self.assertEqual(Rational(-7, 3), rat(str(float_rep(Rational(-7, 3)))))
+
+    def test_float_rep_long_period(self):
+        # given
+        r = Rational(1, 100003)
+
+        # when
+        fr = float_rep(r, 200000)
+
+        # then
+        self.assertEqual('', fr.decimal_part)
+        self.assertEqual(period_length(r), len(fr.repeated_decimal))
+        self.assertEqual(''.join(map(str, decimal_digits(r, 100))), fr.repeated_decimal[:100])
+
+    def test_decimal_digits(self):
+        self.assertEqual([1, 4, 2, 8, 5, 7, 1], list(decimal_digits(Rational(1, 7), 7)))
+        self.assertEqual([1, 2, 5], list(decimal_digits(Rational(-1, 8))))
+        self.assertEqual([], list(decimal_digits(3)))
+
+    def test_period_length(self):
+        self.assertEqual(0, period_length(Rational(1, 8)))
+        self.assertEqual(1, period_length(Rational(1, 6)))
+        self.assertEqual(6, period_length(Rational(22, 7)))
+        self.assertEqual(4, period_length(Rational(1, 101)))
+        self.assertEqual(42, period_length(Rational(1, 49)))
+        self.assertEqual((2 ** 61 - 2) // 2, period_length(Rational(1, 2 ** 61 - 1)))
+        self.assertEqual(0, preperiod_length(Rational(1, 7)))
+        self.assertEqual(5, preperiod_length(Rational(1, 224)))
+
+    def test_format(self):
+        self.assertEqual('0.333', f"{Rational(1, 3):.3f}")
+        self.assertEqual('-1,234.58', f"{rat('-1234.575'):,.2f}")
+        self.assertEqual('1,234.56', f"{rat('1234.565'):,.2f}")
+        self.assertEqual('1,234.5', f"{rat('1234.5'):,g}")
+        self.assertEqual('3.33333e-05', f"{Rational(1, 30000):g}")
+        self.assertEqual('1.23E+03', f"{rat('1234.5'):.2E}")
+        self.assertEqual('12.50%', f"{Rational(1, 8):.2%}")
+        self.assertEqual('+0,001,234.5', f"{rat('1234.5'):+012,.1f}")
+        self.assertEqual('**-0.50**', f"{Rational(-1, 2):*^9.2f}")
+        self.assertEqual('0.0', f"{rat('-0.01'):z.1f}")
+
+    def test_format_is_exact(self):
+        # given
+        r = Rational(2 ** 60 + 1, 1)
+
+        # then
+        self.assertEqual('1,152,921,504,606,846,977.00', f"{r:,.2f}")
+        self.assertNotEqual(f"{r:,.2f}", f"{float(r):,.2f}")
+
+    def test_format_matches_float(self):
+        # given
+        specs = ['f', '.2f', ',.1f', 'g', ',g', '.3g', '#g', 'e', '.0e', '010,.2f', '+.3f']
+        values = [0.0, 1.5, 2.5, -1234.5, 0.0001234, 99999.95, 1e16, 123.456, 1 / 3]
+
+        # then
+        for v in values:
+            for spec in specs:
+                self.assertEqual(format(v, spec), format(Rational.from_float(v, exact=True), spec))
+
+    def test_format_empty_spec_is_str(self):
+        # given
+        r = Rational(2 ** 60 + 1, 3)
+
+        # then
+        self.assertEqual(str(r), format(r, ''))
+        self.assertEqual(str(r), f"{r}")
+        self.assertEqual('7', f"{Rational(7)}")
+
+    def test_format_locale_number(self):
+        # given
+        r = Rational(2 ** 60 + 1, 1000)
+
+        # when
+        with mock.patch('mabooia.rational.get_number_format', return_value=NumberFormat(',', '.', '-')):
+            res = [f"{r:.22n}", f"{Rational(-1, 3):n}", f"{Rational(1, 30000):.2n}"]
+
+        # then
+        self.assertEqual(['1.152.921.504.606.846,977', '-0,333333', '3,3e-05'], res)
+
+    def test_format_decimal(self):
+        self.assertEqual('-12,345.68', format_decimal(rat('-12345.678'), 2, grouping=True))
+        self.assertEqual('-12.345,68', format_decimal(rat('-12345.678'), 2, True, fmt=NumberFormat(',', '.', '-')))
+        self.assertEqual('0.00', format_decimal(rat('-0.001')))
+        self.assertEqual('+0.13', format_decimal(Rational(1, 8), sign=True, mode=RoundingMode.HALF_UP))
+        self.assertEqual('0.12', format_decimal(Rational(1, 8)))
+        self.assertEqual('3', format_decimal(Rational(5, 2), 0, mode=RoundingMode.HALF_UP))
+
+    def test_format_many(self):
+        self.assertEqual(['1.000', '0.333', '-2.500'], format_many([1, Rational(1, 3), '-2.5'], '.3f'))
+        self.assertEqual(['0.5', str(Rational(1, 4))], format_many([0.5, Rational(1, 4)], ''))
+
+    def test_bytes_round_trip(self):
+        # given
+        values = [Rational(0), Rational(1), Rational(-1), Rational(-12345, 7), Rational(2 ** 100 + 1, 3 ** 50),
+                  Rational(-(2 ** 63), 2 ** 64 - 1)]
+
+        # then
+        for r in values:
+            self.assertEqual(r, Rational.from_bytes(r.to_bytes()))
+
+    def test_bytes_are_compact(self):
+        self.assertEqual(b'\x00\x01', Rational(0).to_bytes())
+        self.assertEqual(b'\x01\x02', Rational(-1, 2).to_bytes())
+        self.assertEqual(4, len(Rational(-12345, 7).to_bytes()))
+
+    def test_from_bytes_invalid(self):
+        self.assertRaises(ValueError, lambda: Rational.from_bytes(b'\x02'))
+        self.assertRaises(ValueError, lambda: Rational.from_bytes(b'\x02\x01\x01'))
+        self.assertRaises(ValueError, lambda: Rational.from_bytes(b'\x02\x00'))
+        self.assertRaises(ValueError, lambda: unpack_rationals(b'\x02\x02\x01\x00\x00'))
+
+    def test_pack_rationals(self):
+        # given
+        values = [Rational(i * 37 + 1, 100) for i in range(-500, 500)]
+
+        # when
+        data = pack_rationals(values)
+
+        # then
+        self.assertEqual(values, unpack_rationals(data))
+        self.assertEqual([], unpack_rationals(pack_rationals([])))
+        self.assertRaises(ValueError, lambda: unpack_rationals(data[:-1]))
+
+    def test_pickle(self):
+        # given
+        values = [Rational(-12345, 7), rat(3)]
+
+        # when
+        res = pickle.loads(pickle.dumps(values))
+
+        # then
+        self.assertEqual(values, res)
+        self.assertIs(rat(3), res[1])
+        self.assertLess(len(pickle.dumps(Rational(1, 3))), 80)
+
+    def test_rat_parse_many(self):
+        # given
+        values = ['1,234.50', '-0.25', ' 3 ', '1/3', '-0.(3)', 2.5, 7]
+
+        # when
+        res = rat_parse_many(values)
+
+        # then
+        self.assertTrue(all(it.is_success() for it in res))
+        self.assertEqual([rat(it) for it in values], [it.result for it in res])
+
+    def test_rat_parse_many_failures(self):
+        # when
+        res = rat_parse_many(['1.5', 'n/a', '', None, '-2'])
+
+        # then
+        self.assertEqual([True, False, False, False, True], [it.is_success() for it in res])
+        self.assertEqual(Rational(-2), res[4].result)
+
+    def test_rat_parse_many_zero_denominator(self):
+        # when
+        res = rat_parse_many(['1/2', '1/0', '3/4'])
+        first_bad = rat_parse_many(['1/0', '1/2'])
+
+        # then
+        self.assertEqual([True, False, True], [it.is_success() for it in res])
+        self.assertEqual([Rational(1, 2), Rational(3, 4)], [res[0].result, res[2].result])
+        self.assertTrue(res[1].is_error_of(ZeroDivisionError))
+        self.assertEqual([False, True], [it.is_success() for it in first_bad])
+
+    def test_rat_parse_many_with_number_format(self):
+        # given
+        fmt = NumberFormat(',', '.', '-')
+
+        # when
+        res = rat_parse_many(['1.234,5', '-0,(3)', '10'], fmt)
+
+        # then
+        self.assertEqual([Rational(2469, 2), Rational(-1, 3), Rational(10)], [it.result for it in res])
+
+    def test_parsing_does_not_set_locale(self):
+        # given
+        fmt = get_number_format()
+
+        # when
+        with mock.patch('locale.setlocale') as setlocale:
+            rat('0.3', fmt)
+            rat('0.(3)', fmt)
+            rat('1 / 3', fmt)
+
+        # then
+        setlocale.assert_not_called()
+
+    def test_number_format_is_cached(self):
+        self.assertIs(get_number_format('C'), get_number_format('C'))
+        self.assertIs(get_number_format(), get_number_format())
+
     def test_arithmetic_operations(self):
         self.assertEqual(rat(102.73), rat(100.23) + rat(2.5))
         self.assertEqual(rat(97.73), rat(100.23) - rat(2.5))
@@ -66,7 +363,145 @@ class RationalTest(unittest.TestCase):
         self.assertEqual(rat(40.092), rat(100.23) / rat(2.5))
         self.assertEqual(rat(40), rat(100.23) // rat(2.5))
         self.assertEqual(rat(0.23), rat(100.23) % rat(2.5))
-        self.assertEqual(Rational(274756336065621325000000000000, 2617821370127249000000000000), rat(100.23) ** 1.01)
+        self.assertEqual(rat(100.23) ** Rational(101, 100), rat(100.23) ** 1.01)
+
+    def test_int_power(self):
+        self.assertEqual(Rational(8, 27), Rational(2, 3) ** 3)
+        self.assertEqual(Rational(-27, 8), Rational(-2, 3) ** -3)
+        self.assertEqual(Rational(1), Rational(-2, 3) ** 0)
+        self.assertEqual(Rational(8), 2 ** Rational(3))
+        self.assertEqual(Rational(2 ** 60 + 1), Rational(2 ** 60 + 1) ** 1.0)
+        self.assertRaises(ZeroDivisionError, lambda: Rational(0) ** -2)
+
+    def test_power_keeps_canonical_form(self):
+        # given
+        r = Rational(10123, 10000)
+
+        # when
+        res = r ** 360
+
+        # then
+        self.assertEqual(10123 ** 360, res.num)
+        self.assertEqual(10000 ** 360, res.den)
+
+    def test_power_modulo(self):
+        self.assertEqual(Rational(pow(2, 5, 7) * pow(3, -5, 7) % 7), pow(Rational(2, 3), 5, 7))
+        self.assertEqual(Rational(pow(5, 3, 11)), pow(Rational(1, 5), -3, 11))
+        self.assertRaises(ValueError, lambda: pow(Rational(1, 7), 2, 7))
+        self.assertRaises(TypeError, lambda: pow(Rational(1, 3), Rational(1, 2), 7))
+
+    def test_rational_power(self):
+        self.assertEqual(Rational(2, 3), Rational(4, 9) ** Rational(1, 2))
+        self.assertEqual(Rational(4, 9), Rational(-8, 27) ** Rational(2, 3))
+        self.assertEqual(Rational(1, 4), Rational(8) ** Fraction(-2, 3))
+        self.assertEqual(Rational(14142135623730950488, 10 ** 19), Rational(2) ** Rational(1, 2))
+        self.assertRaises(ValueError, lambda: Rational(-4) ** Rational(1, 2))
+
+    def test_float_power(self):
+        self.assertEqual(Rational(3, 2), Rational(9, 4) ** 0.5)
+        self.assertEqual(Rational(-2), Rational(-8) ** Rational(1, 3))
+        self.assertAlmostEqual(2 ** 0.1234567, float(Rational(2) ** 0.1234567), places=15)
+        self.assertAlmostEqual(-(8 ** 0.2), float(Rational(-8) ** 0.2), places=15)
+        self.assertEqual(Rational(10 ** 200), Rational(10 ** 400) ** 0.5)
+        self.assertEqual(Rational(10 ** 600), Rational(10 ** 400) ** 1.5)
+
+    def test_float_power_errors(self):
+        self.assertRaises(ValueError, lambda: Rational(-8) ** 0.5)
+        self.assertRaises(ValueError, lambda: Rational(-8) ** (1 / 3))
+        self.assertRaises(OverflowError, lambda: Rational(10 ** 400) ** 1e10)
+        self.assertRaises(OverflowError, lambda: Rational(2) ** 1e300)
+
+    def test_nth_root(self):
+        self.assertEqual(Rational(-3, 2), Rational(-27, 8).nth_root(3))
+        self.assertEqual(Rational(12599, 10000), Rational(2).nth_root(3, 4))
+        self.assertEqual(Rational(10 ** 30), Rational(10 ** 150).nth_root(5))
+        self.assertRaises(ValueError, lambda: Rational(2).nth_root(0))
+
+    def test_int_operations(self):
+        # given
+        r = Rational(5, 6)
+
+        # then
+        self.assertEqual(Rational(17, 6), r + 2)
+        self.assertEqual(Rational(-7, 6), r - 2)
+        self.assertEqual(Rational(5, 2), r * 3)
+        self.assertEqual(Rational(5, 18), r / 3)
+        self.assertEqual(Rational(-5, 12), r / -2)
+        self.assertTrue(r > 0)
+        self.assertTrue(r < 1)
+        self.assertFalse(r == 1)
+        self.assertTrue(Rational(6, 3) == 2)
+
+    def test_fast_paths_do_not_convert_operands(self):
+        # given
+        r = Rational(5, 6)
+        o = Rational(1, 4)
+
+        # when
+        with mock.patch.object(Rational, 'of') as of:
+            r + 1, r - o, r * 2, r * o, r / 3, r / o, r > 0, r <= o, r == 1, r != o, 1 - r, 2 * r
+
+        # then
+        of.assert_not_called()
+
+    def test_reflected_operations(self):
+        # given
+        r = Rational(1, 4)
+
+        # then
+        self.assertEqual(Rational(5, 4), 1 + r)
+        self.assertEqual(Rational(3, 4), 1 - r)
+        self.assertEqual(Rational(1, 2), 2 * r)
+        self.assertEqual(Rational(8), 2 / r)
+        self.assertEqual(Rational(3, 2), 0.5 + 4 * r)
+        self.assertEqual(Rational(7, 4), sum([r, Rational(1, 2), 1]))
+
+    def test_unsupported_operands(self):
+        # given
+        r = Rational(1, 4)
+
+        # then
+        self.assertFalse(r == None)
+        self.assertTrue(r != object())
+        self.assertRaises(TypeError, lambda: r + None)
+        self.assertRaises(TypeError, lambda: r < object())
+
+    def test_bool(self):
+        self.assertFalse(Rational.zero())
+        self.assertTrue(Rational(-1, 3))
+
+    def test_limit_denominator(self):
+        self.assertEqual(Rational(355, 113), Rational(3141592653589793, 10 ** 15).limit_denominator(1000))
+        self.assertEqual(Rational(-1, 3), rat('-0.3333333333').limit_denominator(100))
+        self.assertEqual(Rational(1, 7), Rational(1, 7).limit_denominator(7))
+        self.assertRaises(ValueError, lambda: Rational(1, 7).limit_denominator(0))
+
+    def test_round(self):
+        self.assertEqual(2, round(Rational(5, 2)))
+        self.assertEqual(4, round(Rational(7, 2)))
+        self.assertEqual(-2, round(Rational(-5, 3)))
+        self.assertEqual(Rational(333, 1000), round(Rational(1, 3), 3))
+        self.assertEqual(Rational(1300), round(Rational(2501, 2), -2))
+
+    def test_rounding_modes(self):
+        self.assertEqual(2, round_div(5, 2, RoundingMode.HALF_EVEN))
+        self.assertEqual(3, round_div(5, 2, RoundingMode.HALF_UP))
+        self.assertEqual(-3, round_div(-5, 2, RoundingMode.HALF_UP))
+        self.assertEqual(-3, round_div(5, -2, RoundingMode.HALF_UP))
+        self.assertEqual(-2, round_div(-5, 2, RoundingMode.TRUNCATE))
+        self.assertEqual(Rational(-1, 8), Rational(-1, 8).round(3, RoundingMode.TRUNCATE))
+        self.assertEqual(Rational(-13, 100), Rational(-125, 1000).round(2, RoundingMode.HALF_UP))
+        self.assertEqual(Rational(-3, 25), Rational(-125, 1000).round(2, RoundingMode.HALF_EVEN))
+        self.assertEqual(Rational(-3, 25), Rational(-125, 1000).round(2, RoundingMode.TRUNCATE))
+
+    def test_precision_policies(self):
+        # given
+        r = Rational(10 ** 20 + 1, 3 * 10 ** 19)
+
+        # then
+        self.assertIs(r, ExactPrecision().apply(r))
+        self.assertEqual(Rational(10, 3), MaxDenominatorPrecision(1000).apply(r))
+        self.assertEqual(Rational(3333333333, 10 ** 9), DecimalPrecision(9).apply(r))
 
     def test_boolean_operations(self):
         self.assertTrue(rat('1/3') == rat('0.(3)'))